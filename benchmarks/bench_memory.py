@@ -0,0 +1,73 @@
+"""Compare peak memory of buffered and streamed vehicle list parsing.
+
+Run with ``python -m benchmarks.bench_memory``.
+"""
+
+import argparse
+from collections.abc import Callable, Iterator
+import json
+import tracemalloc
+
+from custom_components.enode.const import STREAM_CHUNK_SIZE
+from custom_components.enode.models import Vehicle, VehiclesResponse, type_adapter
+from custom_components.enode.streaming import JsonArrayItems
+
+from .fixtures import vehicles_page
+
+
+def _chunks(content: bytes) -> Iterator[bytes]:
+    """Yield the body in the chunks it would arrive in."""
+    view = memoryview(content)
+    for start in range(0, len(content), STREAM_CHUNK_SIZE):
+        yield bytes(view[start : start + STREAM_CHUNK_SIZE])
+
+
+def buffered(content: bytes) -> int:
+    """Read the whole body, then validate the page."""
+    body = b"".join(_chunks(content))
+    vehicles = type_adapter(VehiclesResponse).validate_json(body).data
+    return len(vehicles)
+
+
+def streamed(content: bytes) -> int:
+    """Validate each vehicle as its bytes arrive, keeping none of them."""
+    adapter = type_adapter(Vehicle)
+    splitter = JsonArrayItems()
+    count = 0
+    for chunk in _chunks(content):
+        for item in splitter.feed(chunk):
+            adapter.validate_json(item)
+            count += 1
+    type_adapter(VehiclesResponse).validate_json(splitter.envelope())
+    return count
+
+
+def peak(func: Callable[[bytes], int], content: bytes) -> tuple[int, int]:
+    """Return the result and peak traced memory of a parsing function."""
+    tracemalloc.start()
+    try:
+        result = func(content)
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicles", nargs="+", type=int, default=[50, 500, 5000])
+    args = parser.parse_args()
+
+    # Warm up the cached type adapters outside of the traced sections
+    streamed(json.dumps(vehicles_page(1)).encode())
+    for count in args.vehicles:
+        content = json.dumps(vehicles_page(count)).encode()
+        print(f"Payload: {count} vehicles, {len(content) / 1024:.0f} KiB")
+        for name, func in (("buffered", buffered), ("streamed", streamed)):
+            result, memory = peak(func, content)
+            assert result == count
+            print(f"{name:>10}: peak {memory / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare response parsing paths on a large vehicle list.
+
+Run with ``python -m benchmarks.bench_parsing``.
+"""
+
+import argparse
+import json
+import timeit
+
+from custom_components.enode.models import (
+    Response,
+    Vehicle,
+    VehiclesResponse,
+    type_adapter,
+)
+
+from .fixtures import vehicles_page
+
+
+def parse_dict(content: bytes) -> list[Vehicle]:
+    """Decode with the json module, then validate the resulting dicts."""
+    return Response[list[Vehicle]].model_validate(json.loads(content)).data
+
+
+def parse_bytes(content: bytes) -> list[Vehicle]:
+    """Validate the raw bytes with the cached type adapter."""
+    return type_adapter(VehiclesResponse).validate_json(content).data
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicles", type=int, default=500)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    content = json.dumps(vehicles_page(args.vehicles)).encode()
+    assert parse_dict(content) == parse_bytes(content)
+    print(f"Payload: {args.vehicles} vehicles, {len(content)} bytes")
+    for name, func in (
+        ("json + model_validate", parse_dict),
+        ("validate_json", parse_bytes),
+    ):
+        best = min(
+            timeit.repeat(lambda func=func: func(content), number=args.number, repeat=5)
+        )
+        print(f"{name:>24}: {best / args.number * 1000:.2f} ms per response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Profile the client on recorded traffic without touching the network.
+
+Run with ``python -m benchmarks.bench_replay --cassette enode.jsonl.gz``. Without
+a cassette, traffic is first recorded against the local emulator.
+"""
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import time
+from unittest.mock import MagicMock
+
+from aiohttp import ClientSession, web
+
+from custom_components.enode.api import EnodeClient
+from custom_components.enode.cassette import (
+    CassettePlayer,
+    CassetteRecorder,
+    Interaction,
+    load_interactions,
+)
+from custom_components.enode.ratelimit import RateLimiter
+
+from .emulator import EmulatorConfig, EmulatorOAuthSession, EnodeEmulator
+
+
+async def record(vehicles: int, rounds: int) -> list[Interaction]:
+    """Record vehicle listings against the emulator."""
+    runner = web.AppRunner(
+        EnodeEmulator(EmulatorConfig(vehicles=vehicles)).create_app()
+    )
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+    recorder = CassetteRecorder()
+    async with ClientSession() as session:
+        client = EnodeClient(
+            EmulatorOAuthSession(session, url),
+            api_url=url,
+            rate_limiter=RateLimiter(requests=6000),
+            cassette=recorder,
+        )
+        for _ in range(rounds):
+            await client.list_vehicles(page_size=50)
+    await runner.cleanup()
+    return recorder.interactions
+
+
+async def replay(
+    interactions: list[Interaction], rounds: int, time_scale: float
+) -> EnodeClient:
+    """Replay the vehicle listings through a client."""
+    client = EnodeClient(
+        MagicMock(),
+        rate_limiter=RateLimiter(requests=6000),
+        cassette=CassettePlayer(interactions, time_scale),
+    )
+    for round_ in range(rounds):
+        started = time.perf_counter()
+        vehicles = await client.list_vehicles(page_size=50)
+        print(
+            f"round {round_ + 1}: {len(vehicles)} vehicles in "
+            f"{time.perf_counter() - started:.3f}s"
+        )
+    return client
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cassette", default=None)
+    parser.add_argument("--vehicles", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args()
+
+    if args.cassette is None:
+        interactions = asyncio.run(record(args.vehicles, args.rounds))
+    else:
+        interactions = load_interactions(args.cassette)
+    print(f"Replaying {len(interactions)} interactions")
+
+    profiler = cProfile.Profile()
+    if args.profile:
+        profiler.enable()
+    client = asyncio.run(replay(interactions, args.rounds, args.time_scale))
+    if args.profile:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    print(client.metrics.as_dict()["validation_time"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Measure how long entry setup takes to register entities.
+
+Compares waiting for the first refresh before setting up the platforms with
+running the refresh alongside platform setup, with and without a stored
+snapshot. Reports the time until the first vehicle entity is registered and
+until every vehicle entity is ready. Entities describing the API client are
+counted but do not mark the first vehicle entity.
+
+Run with ``python -m benchmarks.bench_startup``.
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncGenerator, Iterable
+import time
+from unittest.mock import MagicMock
+
+from custom_components.enode import (
+    binary_sensor,
+    button,
+    device_tracker,
+    geo_location,
+    sensor,
+    switch,
+)
+from custom_components.enode.const import VEHICLES_PAGE_SIZE
+from custom_components.enode.coordinator import EnodeCoordinators
+from custom_components.enode.entity import VehicleEntity
+from custom_components.enode.models import Vehicle
+from custom_components.enode.ratelimit import RateLimiter
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from .fixtures import vehicle_payload
+
+PLATFORMS = (binary_sensor, button, device_tracker, geo_location, sensor, switch)
+
+
+class Timeline:
+    """Record when entities are registered."""
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.started = time.perf_counter()
+        self.first: float | None = None
+        self.entities = 0
+        self.ready: float | None = None
+
+    def add_entities(self, entities: Iterable[Entity]) -> None:
+        """Register entities, as AddEntitiesCallback would."""
+        entities = list(entities)
+        self.entities += len(entities)
+        if self.first is None and any(
+            isinstance(entity, VehicleEntity) for entity in entities
+        ):
+            self.first = time.perf_counter() - self.started
+
+    def mark_ready(self) -> None:
+        """Record that every vehicle entity is ready."""
+        self.ready = time.perf_counter() - self.started
+
+
+def _client(vehicles: list[Vehicle], latency: float) -> MagicMock:
+    """Return a client listing the vehicles with a latency per page."""
+
+    async def iter_vehicles(*_args, **_kwargs) -> AsyncGenerator[Vehicle]:
+        for start in range(0, len(vehicles), VEHICLES_PAGE_SIZE):
+            await asyncio.sleep(latency)
+            for vehicle in vehicles[start : start + VEHICLES_PAGE_SIZE]:
+                yield vehicle
+
+    client = MagicMock()
+    client.iter_vehicles = iter_vehicles
+    client.rate_limiter = RateLimiter()
+    return client
+
+
+async def _setup_platforms(entry: MagicMock, timeline: Timeline) -> None:
+    """Set up every platform of the entry."""
+    await asyncio.gather(
+        *(
+            platform.async_setup_entry(entry.hass, entry, timeline.add_entities)
+            for platform in PLATFORMS
+        )
+    )
+
+
+async def startup(
+    vehicles: list[Vehicle], latency: float, overlap: bool, snapshot: bool
+) -> Timeline:
+    """Set up an entry and return when its entities were registered."""
+    hass = MagicMock(spec=HomeAssistant)
+    coordinators = EnodeCoordinators(
+        hass, _client(vehicles, latency), use_update_interval=False
+    )
+    entry = MagicMock()
+    entry.hass = hass
+    entry.entry_id = "entry"
+    entry.runtime_data = coordinators
+    timeline = Timeline()
+    if snapshot:
+        coordinators.vehicles.data = {vehicle.id: vehicle for vehicle in vehicles}
+    if overlap:
+        refresh = asyncio.create_task(coordinators.async_refresh())
+        await _setup_platforms(entry, timeline)
+        if not snapshot:
+            await refresh
+        timeline.mark_ready()
+        await refresh
+    else:
+        await coordinators.async_refresh()
+        await _setup_platforms(entry, timeline)
+        timeline.mark_ready()
+    return timeline
+
+
+async def run(counts: list[int], latency: float) -> None:
+    """Run every scenario for each fleet size."""
+    for count in counts:
+        vehicles = [Vehicle.model_validate(vehicle_payload(i)) for i in range(count)]
+        print(f"{count} vehicles, {latency * 1000:.0f} ms per page")
+        for name, overlap, snapshot in (
+            ("blocking", False, False),
+            ("overlapped", True, False),
+            ("snapshot", True, True),
+        ):
+            timeline = await startup(vehicles, latency, overlap, snapshot)
+            print(
+                f"{name:>12}: first vehicle entity {timeline.first * 1000:8.1f} ms, "
+                f"{timeline.entities} entities ready {timeline.ready * 1000:8.1f} ms"
+            )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicles", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(run(args.vehicles, args.latency))
+
+
+if __name__ == "__main__":
+    main()
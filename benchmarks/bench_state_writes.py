@@ -0,0 +1,99 @@
+"""Count entity state writes caused by polls and single vehicle updates.
+
+Run with ``python -m benchmarks.bench_state_writes``.
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from unittest.mock import MagicMock
+
+from custom_components.enode import (
+    binary_sensor,
+    button,
+    device_tracker,
+    geo_location,
+    sensor,
+    switch,
+)
+from custom_components.enode.coordinator import EnodeCoordinators
+from custom_components.enode.models import Vehicle
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .fixtures import vehicle_payload
+
+PLATFORMS = (binary_sensor, button, device_tracker, geo_location, sensor, switch)
+
+
+async def setup(vehicles: int) -> tuple[EnodeCoordinators, Counter[str], int]:
+    """Create the coordinators and set up every platform listening to them."""
+    hass = MagicMock(spec=HomeAssistant)
+    coordinators = EnodeCoordinators(hass, MagicMock(), use_update_interval=False)
+    coordinators.vehicles.data = {
+        vehicle.id: vehicle
+        for vehicle in (
+            Vehicle.model_validate(vehicle_payload(index)) for index in range(vehicles)
+        )
+    }
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.runtime_data = coordinators
+    entities: list[CoordinatorEntity] = []
+    for platform in PLATFORMS:
+        await platform.async_setup_entry(hass, entry, entities.extend)
+    writes: Counter[str] = Counter()
+    for entity in entities:
+        entity.hass = hass
+        entity.async_write_ha_state = lambda entity=entity: writes.update(
+            [type(entity).__name__]
+        )
+        coordinators.vehicles.async_add_listener(
+            entity._handle_coordinator_update,  # noqa: SLF001
+            entity.coordinator_context,
+        )
+    return coordinators, writes, len(entities)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicles", type=int, default=100)
+    args = parser.parse_args()
+
+    coordinators, writes, entities = asyncio.run(setup(args.vehicles))
+    vehicle = coordinators.vehicles.data["vehicle-0"]
+    print(f"{entities} entities for {args.vehicles} vehicles")
+
+    coordinators.vehicles.async_set_updated_data(coordinators.vehicles.data)
+    print(f"Broadcast update: {sum(writes.values())} state writes")
+    writes.clear()
+
+    unchanged = {
+        key: value.model_copy() for key, value in coordinators.vehicles.data.items()
+    }
+    coordinators.vehicles.async_track_changes(unchanged)
+    coordinators.vehicles.async_set_updated_data(unchanged)
+    print(f"Unchanged poll: {sum(writes.values())} state writes")
+    writes.clear()
+
+    coordinators.update_vehicle_data(
+        vehicle.model_copy(update={"odometer": vehicle.odometer.model_copy()})
+    )
+    print(f"Unchanged vehicle update: {sum(writes.values())} state writes")
+    writes.clear()
+
+    charge_state = vehicle.charge_state.model_copy(
+        update={"battery_level": (vehicle.charge_state.battery_level or 0) + 1}
+    )
+    coordinators.update_vehicle_data(
+        vehicle.model_copy(update={"charge_state": charge_state})
+    )
+    print(f"Charge state update: {sum(writes.values())} state writes")
+    for name, count in sorted(writes.items()):
+        print(f"{name:>36}: {count}")
+    print(f"Skipped state writes: {coordinators.vehicles.skipped_writes}")
+
+
+if __name__ == "__main__":
+    main()
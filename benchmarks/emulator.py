@@ -0,0 +1,414 @@
+"""Local stand-in for the Enode API, for offline load and soak testing.
+
+The emulator serves the subset of the API used by the integration: the OAuth
+client credentials token endpoint, vehicle listing with pagination, refresh
+hints, charge control and webhooks including test deliveries. Fleet size,
+latency, error rate and rate limiting are configurable.
+
+Run with ``python -m benchmarks.emulator --vehicles 5000`` and point the
+client at the printed URL.
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+from hashlib import sha1
+import hmac
+import json
+import random
+import secrets
+import time
+from types import SimpleNamespace
+from typing import Any
+import uuid
+
+from aiohttp import BasicAuth, ClientError, ClientResponse, ClientSession, web
+
+from .fixtures import vehicle_payload
+
+CLIENT_ID = "emulator-client"
+CLIENT_SECRET = "emulator-secret"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 50
+TIMESTAMP = "2024-01-01T00:00:00Z"
+
+
+@dataclass
+class EmulatorConfig:
+    """Behaviour of the emulated API."""
+
+    vehicles: int = 100
+    users: int = 1
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: int | None = None
+    rate_limit_window: float = 60.0
+    token_ttl: int = 3600
+    seed: int | None = None
+
+
+@dataclass
+class EmulatorStats:
+    """Counters of the requests served by the emulator."""
+
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    tokens_issued: int = 0
+    webhook_deliveries: int = 0
+    endpoints: dict[str, int] = field(default_factory=dict)
+
+
+class EnodeEmulator:
+    """In-memory emulation of the Enode API."""
+
+    def __init__(self, config: EmulatorConfig | None = None) -> None:
+        """Initialize the emulator."""
+        self.config = config or EmulatorConfig()
+        self.stats = EmulatorStats()
+        self._random = random.Random(self.config.seed)
+        self.vehicles: list[dict[str, Any]] = [
+            vehicle_payload(index, user_id=f"user-{index % self.config.users}")
+            for index in range(self.config.vehicles)
+        ]
+        self.tokens: dict[str, float] = {}
+        self.webhooks: dict[str, dict[str, Any]] = {}
+        self._window_started = time.monotonic()
+        self._window_requests = 0
+
+    def create_app(self) -> web.Application:
+        """Return the aiohttp application serving the API."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/oauth2/token", self.token)
+        app.router.add_get("/vehicles", self.list_vehicles)
+        app.router.add_get("/users/{user_id}/vehicles", self.list_vehicles)
+        app.router.add_post("/vehicles/{vehicle_id}/refresh-hint", self.refresh_hint)
+        app.router.add_post("/vehicles/{vehicle_id}/charging", self.charging)
+        app.router.add_post("/users/{user_id}/link", self.user_link)
+        app.router.add_post("/webhooks", self.create_webhook)
+        app.router.add_delete("/webhooks/{webhook_id}", self.delete_webhook)
+        app.router.add_post("/webhooks/{webhook_id}/test", self.test_webhook)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, authentication, rate limiting and error injection."""
+        self.stats.requests += 1
+        route = request.match_info.route.resource
+        endpoint = f"{request.method} {route.canonical if route else request.path}"
+        self.stats.endpoints[endpoint] = self.stats.endpoints.get(endpoint, 0) + 1
+        if delay := self.config.latency + self._random.uniform(0, self.config.jitter):
+            await asyncio.sleep(delay)
+        if request.path == "/oauth2/token":
+            return await handler(request)
+        if not self._authorized(request):
+            return _problem(401, "Unauthorized", "Invalid or expired access token")
+        if (limited := self._rate_limit()) is not None:
+            return limited
+        if self._random.random() < self.config.error_rate:
+            self.stats.errors += 1
+            return _problem(503, "Service Unavailable", "Injected failure")
+        response = await handler(request)
+        response.headers.update(self._rate_limit_headers())
+        return response
+
+    def _authorized(self, request: web.Request) -> bool:
+        """Return True if the request carries a valid access token."""
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        expires_at = self.tokens.get(token)
+        return (
+            scheme.lower() == "bearer"
+            and expires_at is not None
+            and expires_at > time.monotonic()
+        )
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        """Return the rate limit headers for the current window."""
+        if self.config.rate_limit is None:
+            return {}
+        reset = self._window_started + self.config.rate_limit_window - time.monotonic()
+        return {
+            "X-RateLimit-Limit": str(self.config.rate_limit),
+            "X-RateLimit-Remaining": str(
+                max(self.config.rate_limit - self._window_requests, 0)
+            ),
+            "X-RateLimit-Reset": str(max(round(reset), 0)),
+        }
+
+    def _rate_limit(self) -> web.Response | None:
+        """Count the request against the rate limit, rejecting it if exceeded."""
+        if self.config.rate_limit is None:
+            return None
+        now = time.monotonic()
+        if now - self._window_started >= self.config.rate_limit_window:
+            self._window_started = now
+            self._window_requests = 0
+        if self._window_requests >= self.config.rate_limit:
+            self.stats.rate_limited += 1
+            headers = self._rate_limit_headers()
+            response = _problem(429, "Too Many Requests", "Rate limit exceeded")
+            response.headers.update(headers)
+            response.headers["Retry-After"] = headers["X-RateLimit-Reset"]
+            return response
+        self._window_requests += 1
+        return None
+
+    async def token(self, request: web.Request) -> web.Response:
+        """Issue an access token using the client credentials grant."""
+        try:
+            auth = BasicAuth.decode(request.headers.get("Authorization", ""))
+        except ValueError:
+            auth = None
+        data = await request.post()
+        if (
+            auth is None
+            or auth.login != CLIENT_ID
+            or auth.password != CLIENT_SECRET
+            or data.get("grant_type") != "client_credentials"
+        ):
+            return web.json_response(
+                {"error": "invalid_client", "error_description": "Bad credentials"},
+                status=401,
+            )
+        access_token = secrets.token_urlsafe(24)
+        self.tokens[access_token] = time.monotonic() + self.config.token_ttl
+        self.stats.tokens_issued += 1
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "expires_in": self.config.token_ttl,
+                "token_type": "bearer",
+                "scope": "",
+            }
+        )
+
+    async def list_vehicles(self, request: web.Request) -> web.Response:
+        """Return a page of vehicles, optionally for a single user."""
+        vehicles = self.vehicles
+        if user_id := request.match_info.get("user_id"):
+            vehicles = [vehicle for vehicle in vehicles if vehicle["userId"] == user_id]
+        try:
+            page_size = min(
+                int(request.query.get("pageSize", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE
+            )
+            start = int(request.query.get("after", 0))
+        except ValueError:
+            return _problem(400, "Bad Request", "Invalid pagination parameters")
+        end = start + page_size
+        return web.json_response(
+            {
+                "data": vehicles[start:end],
+                "pagination": {
+                    "before": str(start) if start else None,
+                    "after": str(end) if end < len(vehicles) else None,
+                },
+            }
+        )
+
+    def _vehicle(self, request: web.Request) -> dict[str, Any] | None:
+        """Return the vehicle addressed by the request."""
+        vehicle_id = request.match_info["vehicle_id"]
+        return next((v for v in self.vehicles if v["id"] == vehicle_id), None)
+
+    async def refresh_hint(self, request: web.Request) -> web.Response:
+        """Accept a refresh hint for a vehicle."""
+        if self._vehicle(request) is None:
+            return _problem(404, "Not Found", "Vehicle not found")
+        return web.Response(status=204)
+
+    async def charging(self, request: web.Request) -> web.Response:
+        """Start or stop charging a vehicle."""
+        if (vehicle := self._vehicle(request)) is None:
+            return _problem(404, "Not Found", "Vehicle not found")
+        action = (await request.json()).get("action")
+        if action not in ("START", "STOP"):
+            return _problem(400, "Bad Request", "Action must be START or STOP")
+        vehicle["chargeState"]["isCharging"] = action == "START"
+        return web.json_response(
+            {
+                "id": str(uuid.uuid4()),
+                "userId": vehicle["userId"],
+                "createdAt": TIMESTAMP,
+                "updatedAt": TIMESTAMP,
+                "state": "PENDING",
+                "targetId": vehicle["id"],
+                "targetType": "vehicle",
+                "kind": action,
+            }
+        )
+
+    async def user_link(self, request: web.Request) -> web.Response:
+        """Return a link session for a user."""
+        data = await request.json()
+        return web.json_response(
+            {
+                "linkUrl": f"{data['redirectUri']}?emulated=1",
+                "linkToken": secrets.token_urlsafe(16),
+            }
+        )
+
+    async def create_webhook(self, request: web.Request) -> web.Response:
+        """Register a webhook."""
+        data = await request.json()
+        webhook = {
+            "id": str(uuid.uuid4()),
+            "url": data["url"],
+            "events": data.get("events", ["*"]),
+            "isActive": True,
+            "createdAt": TIMESTAMP,
+            "lastSuccess": TIMESTAMP,
+            "apiVersion": data.get("apiVersion"),
+        }
+        self.webhooks[webhook["id"]] = {**webhook, "secret": data["secret"]}
+        return web.json_response(webhook, status=201)
+
+    async def delete_webhook(self, request: web.Request) -> web.Response:
+        """Delete a webhook."""
+        if self.webhooks.pop(request.match_info["webhook_id"], None) is None:
+            return _problem(404, "Not Found", "Webhook not found")
+        return web.Response(status=204)
+
+    async def test_webhook(self, request: web.Request) -> web.Response:
+        """Deliver a signed test event to a webhook."""
+        if (webhook := self.webhooks.get(request.match_info["webhook_id"])) is None:
+            return _problem(404, "Not Found", "Webhook not found")
+        events = [
+            {"event": "enode:webhook:test", "version": "v1", "createdAt": TIMESTAMP}
+        ]
+        try:
+            status, body = await self.deliver(webhook["id"], events)
+        except ClientError as err:
+            return web.json_response(
+                {"status": "FAILURE", "description": f"Delivery failed: {err}"}
+            )
+        return web.json_response(
+            {
+                "status": "SUCCESS" if status < 300 else "FAILURE",
+                "description": f"Webhook responded with {status}",
+                "response": {"code": status, "body": body},
+            }
+        )
+
+    async def deliver(
+        self, webhook_id: str, events: list[dict[str, Any]]
+    ) -> tuple[int, str]:
+        """Deliver a batch of events to a webhook, signed with its secret."""
+        webhook = self.webhooks[webhook_id]
+        content = json.dumps(events).encode()
+        digest = hmac.new(webhook["secret"].encode(), content, sha1).hexdigest()
+        async with (
+            ClientSession() as session,
+            session.post(
+                webhook["url"],
+                data=content,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Enode-Signature": f"sha1={digest}",
+                },
+            ) as response,
+        ):
+            self.stats.webhook_deliveries += 1
+            return response.status, await response.text()
+
+
+class EmulatorOAuthSession:
+    """Minimal OAuth session obtaining client credentials tokens from the emulator.
+
+    Stands in for Home Assistant's OAuth2Session when driving EnodeClient
+    outside of Home Assistant.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        url: str,
+        client_id: str = CLIENT_ID,
+        client_secret: str = CLIENT_SECRET,
+    ) -> None:
+        """Initialize the OAuth session."""
+        self._session = session
+        self._token_url = f"{url.rstrip('/')}/oauth2/token"
+        self._auth = BasicAuth(client_id, client_secret)
+        self._lock = asyncio.Lock()
+        self.implementation = SimpleNamespace(client_id=client_id)
+        self.token: dict[str, Any] = {"expires_at": 0}
+
+    async def async_ensure_token_valid(self) -> None:
+        """Request a new token when the current one has expired."""
+        async with self._lock:
+            if self.token["expires_at"] > time.time() + 20:
+                return
+            async with self._session.post(
+                self._token_url,
+                auth=self._auth,
+                data={"grant_type": "client_credentials"},
+            ) as response:
+                response.raise_for_status()
+                token = await response.json()
+            token["expires_at"] = time.time() + token["expires_in"]
+            self.token = token
+
+    async def async_request(self, method: str, url: Any, **kwargs) -> ClientResponse:
+        """Make a request authenticated with the current token."""
+        await self.async_ensure_token_valid()
+        headers = kwargs.pop("headers", {})
+        return await self._session.request(
+            method,
+            url,
+            headers={
+                **headers,
+                "Authorization": f"Bearer {self.token['access_token']}",
+            },
+            **kwargs,
+        )
+
+
+def _problem(status: int, title: str, detail: str) -> web.Response:
+    """Return an error response in the format used by the API."""
+    return web.json_response(
+        {
+            "type": f"https://developers.enode.com/problems/{status}",
+            "title": title,
+            "detail": detail,
+        },
+        status=status,
+    )
+
+
+def main() -> None:
+    """Run the emulator."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--vehicles", type=int, default=100)
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--rate-limit-window", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    emulator = EnodeEmulator(
+        EmulatorConfig(
+            vehicles=args.vehicles,
+            users=args.users,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+            rate_limit_window=args.rate_limit_window,
+            seed=args.seed,
+        )
+    )
+    print(
+        f"Emulating {args.vehicles} vehicles on http://{args.host}:{args.port} "
+        f"(client id {CLIENT_ID!r}, secret {CLIENT_SECRET!r})"
+    )
+    web.run_app(emulator.create_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
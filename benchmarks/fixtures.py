@@ -0,0 +1,74 @@
+"""Synthetic Enode API payloads for benchmarks."""
+
+from typing import Any
+
+
+def vehicle_payload(index: int, user_id: str = "user-1") -> dict[str, Any]:
+    """Return the API representation of a synthetic vehicle."""
+    return {
+        "id": f"vehicle-{index}",
+        "userId": user_id,
+        "vendor": "TESLA",
+        "isReachable": True,
+        "lastSeen": "2024-01-01T00:00:00Z",
+        "information": {
+            "displayName": f"Vehicle {index}",
+            "vin": f"VIN{index:014d}",
+            "brand": "Tesla",
+            "model": "Model 3",
+            "year": 2022,
+        },
+        "chargeState": {
+            "chargeMode": 11.0,
+            "chargeTimeRemaining": index % 300,
+            "isFullyCharged": False,
+            "isPluggedIn": True,
+            "isCharging": index % 2 == 0,
+            "batteryLevel": float(index % 100),
+            "range": 300.0,
+            "batteryCapacity": 75.0,
+            "chargeLimit": 80.0,
+            "lastUpdated": "2024-01-01T00:00:00Z",
+            "powerDeliveryState": "PLUGGED_IN:CHARGING",
+            "maxCurrent": 16.0,
+        },
+        "smartChargingPolicy": {
+            "deadline": "07:00:00",
+            "isEnabled": True,
+            "minimumChargeLimit": 20.0,
+        },
+        "location": {
+            "id": f"location-{index}",
+            "latitude": 59.0 + index / 10000,
+            "longitude": 18.0 + index / 10000,
+            "lastUpdated": "2024-01-01T00:00:00Z",
+        },
+        "odometer": {
+            "distance": 10000.0 + index,
+            "lastUpdated": "2024-01-01T00:00:00Z",
+        },
+        "capabilities": {
+            capability: {"isCapable": True, "interventionIds": []}
+            for capability in (
+                "information",
+                "chargeState",
+                "location",
+                "odometer",
+                "setMaxCurrent",
+                "startCharging",
+                "stopCharging",
+                "smartCharging",
+            )
+        },
+        "scopes": ["vehicle:read:data", "vehicle:read:location"],
+    }
+
+
+def vehicles_page(
+    count: int, start: int = 0, after: str | None = None
+) -> dict[str, Any]:
+    """Return a page of synthetic vehicles as returned by the API."""
+    return {
+        "data": [vehicle_payload(index) for index in range(start, start + count)],
+        "pagination": {"before": None, "after": after},
+    }
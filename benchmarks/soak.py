@@ -0,0 +1,84 @@
+"""Soak test EnodeClient against the local API emulator.
+
+Run with ``python -m benchmarks.soak --vehicles 5000 --rounds 20``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from aiohttp import ClientSession, web
+
+from custom_components.enode.api import EnodeClient
+from custom_components.enode.connection import ConnectionPoolConfig
+from custom_components.enode.ratelimit import RateLimiter
+
+from .emulator import EmulatorConfig, EmulatorOAuthSession, EnodeEmulator
+
+
+async def soak(args: argparse.Namespace) -> None:
+    """Poll the emulated fleet while sending charge commands."""
+    emulator = EnodeEmulator(
+        EmulatorConfig(
+            vehicles=args.vehicles,
+            latency=args.latency,
+            jitter=args.latency,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+            seed=1,
+        )
+    )
+    runner = web.AppRunner(emulator.create_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+    async with ClientSession() as session:
+        client = EnodeClient(
+            EmulatorOAuthSession(session, url),
+            connection_pool=ConnectionPoolConfig(),
+            api_url=url,
+            rate_limiter=RateLimiter(requests=args.client_rate_limit),
+        )
+        started = time.perf_counter()
+        for round_ in range(args.rounds):
+            round_started = time.perf_counter()
+            commands = [
+                client.control_charging(f"vehicle-{index}", "STOP")
+                for index in random.sample(range(args.vehicles), args.commands)
+            ]
+            results = await asyncio.gather(
+                client.list_vehicles(page_size=50), *commands, return_exceptions=True
+            )
+            vehicles = results[0]
+            count = len(vehicles) if isinstance(vehicles, list) else repr(vehicles)
+            print(
+                f"round {round_ + 1}: {count} vehicles in "
+                f"{time.perf_counter() - round_started:.3f}s"
+            )
+        elapsed = time.perf_counter() - started
+        await client.async_close()
+
+    await runner.cleanup()
+    print(f"{emulator.stats.requests} requests served in {elapsed:.2f}s")
+    print(json.dumps(client.diagnostics(), indent=2, default=str))
+
+
+def main() -> None:
+    """Run the soak test."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicles", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--commands", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--client-rate-limit", type=int, default=6000)
+    asyncio.run(soak(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
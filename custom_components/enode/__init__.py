@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 
 from .application_credentials import get_client
-from .const import CONF_WEBHOOK_ID
+from .const import CONF_WEBHOOK_ID, DOMAIN
 from .coordinator import EnodeConfigEntry, EnodeCoordinators
+from .snapshot import VehicleSnapshot
 from .views import EnodeWebhookView
+from .webhook import WebhookProcessor
 
 _PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -26,15 +29,74 @@ async def async_setup_entry(hass: HomeAssistant, entry: EnodeConfigEntry) -> boo
     if has_webhook:
         hass.http.register_view(EnodeWebhookView)
     client = await get_client(hass, entry)
-    coordinators = EnodeCoordinators(hass, client)
-    await coordinators.async_refresh()
-
+    coordinators = EnodeCoordinators(
+        hass, client, snapshot=VehicleSnapshot(hass, entry.entry_id)
+    )
+    await coordinators.async_load_snapshot()
+    coordinators.webhooks = WebhookProcessor(hass, entry)
+    coordinators.webhooks.async_start()
+    entry.async_on_unload(coordinators.webhooks.async_shutdown)
     entry.runtime_data = coordinators
+
+    # Platforms add the entities of each vehicle once its data is available,
+    # so the first refresh runs alongside their setup rather than before it
+    entry.async_create_background_task(
+        hass, coordinators.async_refresh(), "enode_vehicles_refresh"
+    )
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    _async_track_vehicle_devices(hass, entry)
 
     return True
 
 
+@callback
+def _async_track_vehicle_devices(hass: HomeAssistant, entry: EnodeConfigEntry) -> None:
+    """Remove the devices, and with them the entities, of removed vehicles.
+
+    Devices are only removed once a poll has listed every vehicle, so that a
+    snapshot, a partial listing or a webhook does not remove the devices of
+    vehicles that were merely not seen yet. Every device is checked after
+    the first complete poll, or when the changes are unknown, and only those
+    of the vehicles that changed afterwards.
+    """
+    vehicles = entry.runtime_data.vehicles
+    scanned = False
+
+    @callback
+    def remove_devices() -> None:
+        nonlocal scanned
+        if not vehicles.complete or vehicles.data is None:
+            return
+        registry = dr.async_get(hass)
+        changed = vehicles.async_changed_vehicles()
+        if scanned and changed is not None:
+            for vehicle_id in changed:
+                if vehicle_id not in vehicles.data and (
+                    device := registry.async_get_device(
+                        identifiers={(DOMAIN, vehicle_id)}
+                    )
+                ):
+                    registry.async_update_device(
+                        device.id, remove_config_entry_id=entry.entry_id
+                    )
+            return
+        scanned = True
+        for device in dr.async_entries_for_config_entry(registry, entry.entry_id):
+            identifiers = {
+                value for domain, value in device.identifiers if domain == DOMAIN
+            }
+            if entry.entry_id in identifiers or not identifiers.isdisjoint(
+                vehicles.data
+            ):
+                continue
+            registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+    remove_devices()
+    entry.async_on_unload(vehicles.async_add_listener(remove_devices))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: EnodeConfigEntry) -> bool:
     """Unload a config entry."""
     await entry.runtime_data.async_shutdown()
@@ -43,3 +105,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: EnodeConfigEntry) -> bo
 
 async def async_remove_entry(hass: HomeAssistant, entry: EnodeConfigEntry) -> None:
     """Handle removal of an entry."""
+    await VehicleSnapshot(hass, entry.entry_id).async_remove()
@@ -1,14 +1,32 @@
 """API for Enode bound to Home Assistant OAuth."""
 
-from typing import Literal
+import asyncio
+from collections.abc import AsyncGenerator, Hashable
+from functools import partial
+import time
+from typing import Any, Literal
+from uuid import uuid4
 
-from aiohttp import ClientResponse, ClientResponseError
+from aiohttp import ClientError, ClientResponse, ClientResponseError
 from aiohttp.hdrs import METH_DELETE, METH_GET, METH_POST
+from aiohttp.web_exceptions import HTTPTooManyRequests
 from yarl import URL
 
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+from homeassistant.util.json import json_loads
 
-from .const import LOGGER, PRODUCTION_API_URL, SANDBOX_API_URL
+from .cassette import CassettePlayer, CassetteRecorder
+from .circuit import CircuitBreaker
+from .connection import ConnectionPool, ConnectionPoolConfig
+from .const import (
+    LOGGER,
+    PRODUCTION_API_URL,
+    RATE_LIMIT_DEFAULT_RETRY_AFTER,
+    RATE_LIMIT_MAX_RETRIES,
+    SANDBOX_API_URL,
+    STREAM_CHUNK_SIZE,
+)
+from .metrics import RequestMetrics, RequestTiming
 from .models import (
     ChargeAction,
     ErrorResponse,
@@ -17,11 +35,18 @@ from .models import (
     Response,
     T,
     Vehicle,
+    VehiclesResponse,
     VendorType,
     Webhook,
     WebhookEventType,
     WebhookTest,
+    type_adapter,
 )
+from .ratelimit import RateLimiter, RequestPriority, parse_retry_after
+from .retry import RETRY_EXCEPTIONS, RETRY_STATUSES, RetryPolicy, RetryStats
+from .streaming import JsonArrayItems
+
+HEADER_IDEMPOTENCY_KEY = "Idempotency-Key"
 
 SCOPES = [
     "battery:control:operation_mode",
@@ -56,6 +81,14 @@ class EnodeError(ClientResponseError):
         )
 
 
+class PaginationError(ClientError):
+    """Pagination cursor did not advance, so the listing is incomplete."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the error."""
+        super().__init__(f"Pagination cursor for {path} did not advance")
+
+
 class EnodeClient:
     """Enode API client."""
 
@@ -63,55 +96,485 @@ class EnodeClient:
         self,
         oauth_session: OAuth2Session,
         sandbox: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        connection_pool: ConnectionPoolConfig | None = None,
+        api_url: str | None = None,
+        cassette: CassetteRecorder | CassettePlayer | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
-        """Initialize Enode auth."""
+        """Initialize Enode auth.
+
+        When a connection pool config is given, requests are sent through a
+        dedicated session owned by the client instead of Home Assistant's
+        shared one. The API URL can be overridden, such as to point the
+        client at a local emulator. A cassette records the API traffic, or
+        replays previously recorded traffic instead of sending requests.
+        """
         self._oauth_session = oauth_session
-        self._api_url = SANDBOX_API_URL if sandbox else PRODUCTION_API_URL
+        self._connection_pool = (
+            None if connection_pool is None else ConnectionPool(connection_pool)
+        )
+        self._api_url = api_url or (SANDBOX_API_URL if sandbox else PRODUCTION_API_URL)
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.coalesced_requests = 0
+        self.metrics = RequestMetrics()
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._cassette = cassette
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Return the rate limiter tracking the remaining API budget."""
+        return self._rate_limiter
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker guarding the API."""
+        return self._circuit_breaker
+
+    @property
+    def connection_pool(self) -> ConnectionPool | None:
+        """Return the dedicated connection pool, if any."""
+        return self._connection_pool
+
+    async def async_close(self) -> None:
+        """Release the resources held by the client."""
+        if self._connection_pool is not None:
+            await self._connection_pool.async_close()
+
+    async def _async_request(self, method: str, url: URL, **kwargs) -> ClientResponse:
+        """Make an authenticated request, through the cassette if any."""
+        if self._cassette is not None:
+            return await self._cassette.request(self._async_send, method, url, **kwargs)
+        return await self._async_send(method, url, **kwargs)
+
+    async def _async_send(self, method: str, url: URL, **kwargs) -> ClientResponse:
+        """Send an authenticated request over the network."""
+        if self._connection_pool is None:
+            return await self._oauth_session.async_request(
+                method=method, url=url, **kwargs
+            )
+        await self._oauth_session.async_ensure_token_valid()
+        return await self._connection_pool.request(
+            method, url, self._oauth_session.token["access_token"], **kwargs
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: URL,
+        priority: RequestPriority,
+        timing: RequestTiming | None = None,
+        **kwargs,
+    ) -> ClientResponse:
+        """Send a request once the rate limiter allows it.
+
+        Requests rejected with 429 Too Many Requests are queued again until
+        the time given by the Retry-After header has passed. The timing, if
+        any, is restarted for every attempt let through the rate limiter.
+        """
+        for _ in range(RATE_LIMIT_MAX_RETRIES):
+            await self._rate_limiter.acquire(priority)
+            if timing is not None:
+                timing.start()
+            response = await self._async_request(method, url, **kwargs)
+            if timing is not None:
+                timing.first_byte()
+            self._rate_limiter.update(response.headers)
+            if response.status != HTTPTooManyRequests.status_code:
+                return response
+            retry_after = parse_retry_after(response.headers)
+            if retry_after is None:
+                retry_after = RATE_LIMIT_DEFAULT_RETRY_AFTER.total_seconds()
+            LOGGER.debug("Rate limit exceeded, retrying in %.0f seconds", retry_after)
+            self._rate_limiter.block(retry_after)
+            response.release()
+        return response
+
+    async def _send_with_retry(
+        self, method: str, url: URL, retry: bool, priority: RequestPriority, **kwargs
+    ) -> ClientResponse:
+        """Send a request, retrying transient failures according to the policy.
+
+        Connection errors, timeouts and 5xx responses are retried with
+        exponential backoff and jitter for as long as the policy's attempt
+        limit and deadline allow.
+        """
+        loop = asyncio.get_running_loop()
+        policy = self.retry_policy
+        stats = self.retry_stats
+        started = loop.time()
+        stats.requests += 1
+        attempt = 0
+        while True:
+            attempt += 1
+            stats.attempts += 1
+            attempt_started = loop.time()
+            error: Exception | None = None
+            try:
+                response = await self._send(method, url, priority, **kwargs)
+            except RETRY_EXCEPTIONS as err:
+                if not retry:
+                    raise
+                response, error, reason = None, err, repr(err)
+            else:
+                if not retry or response.status not in RETRY_STATUSES:
+                    break
+                reason = f"status {response.status}"
+            elapsed = loop.time() - started
+            delay = policy.delay(attempt)
+            if not policy.should_retry(attempt, elapsed, delay):
+                stats.failures += 1
+                if error is not None:
+                    raise error
+                break
+            LOGGER.debug(
+                "Attempt %d of %s %s failed after %.3fs (%s), retrying in %.3fs",
+                attempt,
+                method,
+                url,
+                loop.time() - attempt_started,
+                reason,
+                delay,
+            )
+            if response is not None:
+                response.release()
+            stats.retries += 1
+            stats.retry_delay += delay
+            await asyncio.sleep(delay)
+        if attempt > 1:
+            stats.retry_latency += attempt_started - started
+            LOGGER.debug(
+                "%s %s completed after %d attempts, retries added %.3fs",
+                method,
+                url,
+                attempt,
+                attempt_started - started,
+            )
+        return response
+
+    async def _make_request(
+        self,
+        type_: T,
+        method: str,
+        path: str,
+        path_params: dict[str, str] | None = None,
+        **kwargs,
+    ) -> T:
+        """Make a request to the Enode API.
 
-    async def _make_request(self, type_: T, method: str, path: str, **kwargs) -> T:
-        """Make a request to the Enode API."""
+        The path is a template, such as ``/vehicles/{vehicle_id}``, filled in
+        from path_params. Concurrent identical GET requests are coalesced so
+        that they share a single round trip and its parsed result.
+        """
+        endpoint = path
+        if path_params:
+            path = path.format_map(path_params)
+        if method != METH_GET:
+            return await self._request(type_, method, endpoint, path, **kwargs)
+        params = kwargs.get("params") or {}
+        key = (type_, path, tuple(sorted(params.items())))
+        if (inflight := self._inflight.get(key)) is None:
+            inflight = asyncio.ensure_future(
+                self._request(type_, method, endpoint, path, **kwargs)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(partial(self._request_done, key))
+        else:
+            LOGGER.debug("Joining in-flight %s request to %s", method, path)
+            self.coalesced_requests += 1
+        return await asyncio.shield(inflight)
+
+    def _request_done(self, key: Hashable, inflight: asyncio.Future) -> None:
+        """Forget a completed in-flight request."""
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+        if not inflight.cancelled():
+            # Mark the exception as retrieved in case every waiter went away
+            inflight.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        idempotency_key: str | None = None,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+        **kwargs,
+    ) -> ClientResponse:
+        """Send a request to the Enode API and return the response.
+
+        GET requests are retried on transient failures. Other methods are
+        only retried when an idempotency key is given, which is sent along
+        so the API can discard duplicate deliveries. Requests fail fast with
+        CircuitOpenError while the circuit breaker is open. The priority
+        decides the order in which requests are let through the rate limiter.
+        """
         url = URL(self._api_url).with_path(path)
         LOGGER.debug("Making %s request to %s", method, url)
         headers = kwargs.pop("headers", {})
         headers["Content-Type"] = "application/json"
-        response = await self._oauth_session.async_request(
-            method=method, url=url, headers=headers, **kwargs
-        )
+        if idempotency_key is not None:
+            headers[HEADER_IDEMPOTENCY_KEY] = idempotency_key
+        retry = method == METH_GET or idempotency_key is not None
+        self._circuit_breaker.before_request()
+        try:
+            response = await self._send_with_retry(
+                method, url, retry=retry, priority=priority, headers=headers, **kwargs
+            )
+        except RETRY_EXCEPTIONS:
+            self._circuit_breaker.record_failure()
+            self.metrics.record_error(method, endpoint)
+            raise
+        except ClientError:
+            self._circuit_breaker.release()
+            self.metrics.record_error(method, endpoint)
+            raise
+        except BaseException:
+            self._circuit_breaker.release()
+            raise
+        if response.status in RETRY_STATUSES:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
         LOGGER.debug(
             "Received %d response having content length of %d",
             response.status,
             response.content_length or 0,
         )
-        is_error = response.status == 400
-        if not response.ok and not is_error:
-            response.raise_for_status()
-        if type_ is None:
-            return None
-        data = await response.json()
-        if is_error:
-            raise EnodeError(response, data)
-        return type_.model_validate(data)
+        return response
+
+    async def _request(
+        self,
+        type_: T,
+        method: str,
+        endpoint: str,
+        path: str,
+        **kwargs,
+    ) -> T:
+        """Send a request to the Enode API and parse the response."""
+        timing = RequestTiming()
+        response = await self._send_request(
+            method, endpoint, path, timing=timing, **kwargs
+        )
+        size = response.content_length or 0
+        validation_time: float | None = None
+        try:
+            is_error = response.status == 400
+            if not response.ok and not is_error:
+                response.raise_for_status()
+            if type_ is None:
+                return None
+            content = await response.read()
+            size = len(content)
+            if is_error:
+                raise EnodeError(response, json_loads(content))
+            validation_started = time.perf_counter()
+            result = type_adapter(type_).validate_json(content)
+            validation_time = time.perf_counter() - validation_started
+            return result
+        finally:
+            self.metrics.record(
+                method,
+                endpoint,
+                status=response.status,
+                size=size,
+                time_to_first_byte=timing.time_to_first_byte,
+                total_time=timing.elapsed(),
+                validation_time=validation_time,
+            )
+
+    async def _stream[_ItemT](
+        self,
+        type_: type[Response[list[_ItemT]]],
+        item_type: type[_ItemT],
+        path: str,
+        path_params: dict[str, str] | None = None,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[_ItemT]:
+        """Yield the items of a paginated endpoint as their bytes arrive.
+
+        Items of the data array are validated one at a time while the body is
+        read, so only the item being parsed is buffered rather than the page.
+        The rest of the response is validated once the page has been read to
+        follow the after cursor.
+        """
+        endpoint = path
+        if path_params:
+            path = path.format_map(path_params)
+        item_adapter = type_adapter(item_type)
+        params: dict[str, Any] = {}
+        if page_size is not None:
+            params["pageSize"] = page_size
+        while True:
+            timing = RequestTiming()
+            response = await self._send_request(
+                METH_GET, endpoint, path, params=params, timing=timing
+            )
+            size = 0
+            validation_time = 0.0
+            try:
+                if response.status == 400:
+                    content = await response.read()
+                    size = len(content)
+                    raise EnodeError(response, json_loads(content))
+                response.raise_for_status()
+                splitter = JsonArrayItems()
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    size += len(chunk)
+                    for item in splitter.feed(chunk):
+                        validation_started = time.perf_counter()
+                        result = item_adapter.validate_json(item)
+                        validation_time += time.perf_counter() - validation_started
+                        yield result
+                validation_started = time.perf_counter()
+                page = type_adapter(type_).validate_json(splitter.envelope())
+                validation_time += time.perf_counter() - validation_started
+            finally:
+                response.release()
+                self.metrics.record(
+                    METH_GET,
+                    endpoint,
+                    status=response.status,
+                    size=size,
+                    time_to_first_byte=timing.time_to_first_byte,
+                    total_time=timing.elapsed(),
+                    validation_time=validation_time,
+                )
+            after = page.pagination.after
+            if after is None:
+                return
+            if after == params.get("after"):
+                raise PaginationError(path)
+            params = {**params, "after": after}
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return diagnostic information about the client."""
+        pool = self._connection_pool
+        return {
+            "requests": self.metrics.as_dict(),
+            "retries": self.retry_stats.as_dict(),
+            "coalesced_requests": self.coalesced_requests,
+            "circuit_breaker": self._circuit_breaker.as_dict(),
+            "rate_limit": self._rate_limiter.as_dict(),
+            "connection_pool": None if pool is None else pool.as_dict(),
+        }
 
     @property
     def client_id(self) -> str | None:
         """Return the client ID."""
         return getattr(self._oauth_session.implementation, "client_id", None)
 
-    async def list_vehicles(self) -> list[Vehicle]:
+    async def _paginate[_ItemT](
+        self,
+        type_: type[Response[list[_ItemT]]],
+        path: str,
+        path_params: dict[str, str] | None = None,
+        page_size: int | None = None,
+        prefetch: bool = False,
+    ) -> AsyncGenerator[list[_ItemT]]:
+        """Yield each page of a paginated endpoint, following the after cursor.
+
+        When prefetch is enabled the next page is requested while the caller
+        is still consuming the current one. PaginationError is raised if the
+        cursor stops advancing, rather than returning a truncated listing.
+        """
+        params: dict[str, Any] = {}
+        if page_size is not None:
+            params["pageSize"] = page_size
+        next_page: asyncio.Task[Response[list[_ItemT]]] | None = None
+        try:
+            response = await self._make_request(
+                type_,
+                method=METH_GET,
+                path=path,
+                path_params=path_params,
+                params=params,
+            )
+            while True:
+                after = response.pagination.after
+                if after is not None:
+                    params = {**params, "after": after}
+                    if prefetch:
+                        next_page = asyncio.create_task(
+                            self._make_request(
+                                type_,
+                                method=METH_GET,
+                                path=path,
+                                path_params=path_params,
+                                params=params,
+                            )
+                        )
+                yield response.data
+                if after is None:
+                    return
+                if next_page is None:
+                    response = await self._make_request(
+                        type_,
+                        method=METH_GET,
+                        path=path,
+                        path_params=path_params,
+                        params=params,
+                    )
+                else:
+                    response, next_page = await next_page, None
+                if response.pagination.after == after:
+                    raise PaginationError(path)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def iter_vehicles(
+        self,
+        user_id: str | None = None,
+        page_size: int | None = None,
+        prefetch: bool = False,
+        stream: bool = False,
+    ) -> AsyncGenerator[Vehicle]:
+        """Iterate over all vehicles, or those of a user, across every page.
+
+        When streaming, each vehicle is parsed as soon as its bytes arrive so
+        memory use stays proportional to a single vehicle instead of a page.
+        """
+        if user_id is None:
+            path, path_params = "/vehicles", None
+        else:
+            path, path_params = "/users/{user_id}/vehicles", {"user_id": user_id}
+        if stream:
+            async for vehicle in self._stream(
+                VehiclesResponse,
+                Vehicle,
+                path,
+                path_params=path_params,
+                page_size=page_size,
+            ):
+                yield vehicle
+            return
+        async for page in self._paginate(
+            VehiclesResponse,
+            path,
+            path_params=path_params,
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            for vehicle in page:
+                yield vehicle
+
+    async def list_vehicles(self, page_size: int | None = None) -> list[Vehicle]:
         """List vehicles."""
-        response = await self._make_request(
-            Response[list[Vehicle]], method=METH_GET, path="/vehicles"
-        )
-        return response.data
+        return [vehicle async for vehicle in self.iter_vehicles(page_size=page_size)]
 
-    async def list_user_vehicles(self, user_id: str) -> list[Vehicle]:
+    async def list_user_vehicles(
+        self, user_id: str, page_size: int | None = None
+    ) -> list[Vehicle]:
         """List vehicles."""
-        response = await self._make_request(
-            Response[list[Vehicle]],
-            method=METH_GET,
-            path=f"/users/{user_id}/vehicles",
-        )
-        return response.data
+        return [
+            vehicle
+            async for vehicle in self.iter_vehicles(user_id, page_size=page_size)
+        ]
 
     async def refresh_vehicle_data(self, vehicle: str | Vehicle) -> None:
         """Refresh vehicle data."""
@@ -120,7 +583,10 @@ class EnodeClient:
         return await self._make_request(
             None,
             method=METH_POST,
-            path=f"/vehicles/{vehicle}/refresh-hint",
+            path="/vehicles/{vehicle_id}/refresh-hint",
+            path_params={"vehicle_id": vehicle},
+            idempotency_key=uuid4().hex,
+            priority=RequestPriority.REFRESH,
         )
 
     async def user_link(
@@ -148,8 +614,10 @@ class EnodeClient:
         return await self._make_request(
             Link,
             method=METH_POST,
-            path=f"/users/{user_id}/link",
+            path="/users/{user_id}/link",
+            path_params={"user_id": user_id},
             json=data,
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def control_charging(
@@ -162,8 +630,11 @@ class EnodeClient:
         await self._make_request(
             ChargeAction,
             method=METH_POST,
-            path=f"/vehicles/{vehicle_id}/charging",
+            path="/vehicles/{vehicle_id}/charging",
+            path_params={"vehicle_id": vehicle_id},
             json=data,
+            idempotency_key=uuid4().hex,
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def create_webhook(
@@ -188,6 +659,7 @@ class EnodeClient:
             method=METH_POST,
             path="/webhooks",
             json=data,
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def delete_webhook(self, webhook: str | Webhook) -> None:
@@ -197,7 +669,9 @@ class EnodeClient:
         return await self._make_request(
             None,
             method=METH_DELETE,
-            path=f"/webhooks/{webhook}",
+            path="/webhooks/{webhook_id}",
+            path_params={"webhook_id": webhook},
+            priority=RequestPriority.INTERACTIVE,
         )
 
     async def test_webhook(self, webhook: str | Webhook) -> WebhookTest:
@@ -207,5 +681,7 @@ class EnodeClient:
         return await self._make_request(
             WebhookTest,
             method=METH_POST,
-            path=f"/webhooks/{webhook}/test",
+            path="/webhooks/{webhook_id}/test",
+            path_params={"webhook_id": webhook},
+            priority=RequestPriority.INTERACTIVE,
         )
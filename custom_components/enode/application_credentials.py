@@ -1,13 +1,16 @@
 """Application credentials platform for the Enode integration."""
 
+from functools import partial
 from json import JSONDecodeError
+import time
 from typing import Any, cast
 
 from aiohttp import BasicAuth, ClientError
 
 from homeassistant.components.application_credentials import ClientCredential
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.config_entry_oauth2_flow import (
     AbstractOAuth2Implementation,
@@ -17,6 +20,7 @@ from homeassistant.helpers.config_entry_oauth2_flow import (
 )
 
 from .api import EnodeClient
+from .connection import ConnectionPoolConfig
 from .const import (
     CONF_SANDBOX,
     LOGGER,
@@ -24,6 +28,7 @@ from .const import (
     PRODUCTION_OAUTH2_TOKEN,
     SANDBOX_OAUTH2_TOKEN,
 )
+from .oauth import SharedToken, async_get_shared_token
 
 
 class Oauth2Impl(LocalOAuth2Implementation):
@@ -42,8 +47,19 @@ class Oauth2Impl(LocalOAuth2Implementation):
         """Redirect back to HA because there is no authorization URL."""
         return self.redirect_uri
 
+    @property
+    def shared_token(self) -> SharedToken:
+        """Return the token shared by the entries using these credentials."""
+        return async_get_shared_token(
+            self.hass, self.token_url, self.client_id, self._async_request_token
+        )
+
     async def async_resolve_external_data(self, external_data: Any) -> dict:
         """Resolve the authorization code to tokens."""
+        return await self._async_request_token()
+
+    async def _async_request_token(self) -> dict:
+        """Request a token with the client credentials grant."""
         request_data: dict = {
             "grant_type": "client_credentials",
         }
@@ -51,8 +67,9 @@ class Oauth2Impl(LocalOAuth2Implementation):
         return await self._token_request(request_data)
 
     async def _async_refresh_token(self, token: dict) -> dict:
-        """Refresh the token by just repeating the authorize step."""
-        return await self.async_resolve_external_data({})
+        """Return the shared token, which is refreshed ahead of its expiry."""
+        token = await self.shared_token.async_get_token()
+        return {**token, "expires_in": int(token["expires_at"] - time.time())}
 
     async def _token_request(self, data: dict) -> dict:
         """Make a token request using basic auth."""
@@ -94,7 +111,44 @@ async def async_get_auth_implementation(
 
 
 async def get_client(hass: HomeAssistant, entry: ConfigEntry) -> EnodeClient:
-    """Get the Enode client."""
+    """Get the Enode client.
+
+    Config entries are not unloaded when Home Assistant stops, so the client
+    is also closed then, releasing its dedicated connection pool.
+    """
     implementation = await async_get_config_entry_implementation(hass, entry)
     sandbox = entry.data.get(CONF_SANDBOX, False)
-    return EnodeClient(OAuth2Session(hass, entry, implementation), sandbox=sandbox)
+    if isinstance(implementation, Oauth2Impl):
+        shared_token = implementation.shared_token
+        if "token" in entry.data:
+            shared_token.async_seed(entry.data["token"])
+        entry.async_on_unload(
+            shared_token.async_add_listener(partial(_async_update_token, hass, entry))
+        )
+    client = EnodeClient(
+        OAuth2Session(hass, entry, implementation),
+        sandbox=sandbox,
+        connection_pool=ConnectionPoolConfig(),
+    )
+    entry.async_on_unload(
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, partial(_async_close_client, client)
+        )
+    )
+    return client
+
+
+async def _async_close_client(client: EnodeClient, _event: Event) -> None:
+    """Close the client when Home Assistant stops."""
+    await client.async_close()
+
+
+@callback
+def _async_update_token(
+    hass: HomeAssistant, entry: ConfigEntry, token: dict[str, Any]
+) -> None:
+    """Store a refreshed shared token in the config entry."""
+    if entry.data.get("token") != token:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, "token": token}
+        )
@@ -12,7 +12,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import LOGGER
 from .coordinator import EnodeConfigEntry, EnodeCoordinators, EnodeVehiclesCoordinator
-from .entity import VehicleEntity
+from .entity import VehicleEntity, async_add_vehicle_entities
+from .models import Vehicle
 
 CHARGE_STATE_DESCRIPTIONS = [
     BinarySensorEntityDescription(
@@ -42,49 +43,44 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enode binary sensor platform."""
-    async_add_entities(_generate_sensors(config_entry.runtime_data))
-
-
-def _generate_sensors(
-    coordinator: EnodeCoordinators,
-) -> Generator[BinarySensorEntity]:
-    """Generate Enode sensors."""
-    yield from _generate_vehicle_sensors(coordinator.vehicles)
+    async_add_vehicle_entities(
+        config_entry, async_add_entities, _generate_vehicle_sensors
+    )
 
 
 def _generate_vehicle_sensors(
-    coordinator: EnodeVehiclesCoordinator,
+    coordinators: EnodeCoordinators, vehicle: Vehicle
 ) -> Generator[BinarySensorEntity]:
-    """Generate sensors for vehicles."""
-    for vehicle in coordinator.data or []:
-        LOGGER.debug("Generating binary sensors for vehicle %s", vehicle.id)
-        if vehicle.capabilities.charge_state.is_capable:
-            LOGGER.debug("Vehicle %s supports charge state", vehicle.id)
-            for description in CHARGE_STATE_DESCRIPTIONS:
-                yield VehicleChargeStateBinarySensor(
-                    coordinator=coordinator, vehicle=vehicle, description=description
-                )
-            # This is a special case where we check if the vehicle is capable of starting or
-            # stopping charging. If it is not, we create a readonly binary sensor for charging state.
-            if (
-                not vehicle.capabilities.stop_charging.is_capable
-                and not vehicle.capabilities.start_charging.is_capable
-            ):
-                yield VehicleChargeStateBinarySensor(
-                    coordinator=coordinator,
-                    vehicle=vehicle,
-                    description=BinarySensorEntityDescription(
-                        key="is_charging",
-                        translation_key="charge_state_is_charging",
-                        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-                    ),
-                )
-        if vehicle.capabilities.smart_charging.is_capable:
-            LOGGER.debug("Vehicle %s supports smart charging", vehicle.id)
-            for description in SMART_CHARGING_DESCRIPTIONS:
-                yield VehicleSmartChargingBinarySensor(
-                    coordinator=coordinator, vehicle=vehicle, description=description
-                )
+    """Generate binary sensors for a vehicle."""
+    coordinator = coordinators.vehicles
+    LOGGER.debug("Generating binary sensors for vehicle %s", vehicle.id)
+    if vehicle.capabilities.charge_state.is_capable:
+        LOGGER.debug("Vehicle %s supports charge state", vehicle.id)
+        for description in CHARGE_STATE_DESCRIPTIONS:
+            yield VehicleChargeStateBinarySensor(
+                coordinator=coordinator, vehicle=vehicle, description=description
+            )
+        # This is a special case where we check if the vehicle is capable of starting or
+        # stopping charging. If it is not, we create a readonly binary sensor for charging state.
+        if (
+            not vehicle.capabilities.stop_charging.is_capable
+            and not vehicle.capabilities.start_charging.is_capable
+        ):
+            yield VehicleChargeStateBinarySensor(
+                coordinator=coordinator,
+                vehicle=vehicle,
+                description=BinarySensorEntityDescription(
+                    key="is_charging",
+                    translation_key="charge_state_is_charging",
+                    device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+                ),
+            )
+    if vehicle.capabilities.smart_charging.is_capable:
+        LOGGER.debug("Vehicle %s supports smart charging", vehicle.id)
+        for description in SMART_CHARGING_DESCRIPTIONS:
+            yield VehicleSmartChargingBinarySensor(
+                coordinator=coordinator, vehicle=vehicle, description=description
+            )
 
 
 class VehicleBinarySensor(VehicleEntity[EnodeVehiclesCoordinator], BinarySensorEntity):
@@ -94,6 +90,8 @@ class VehicleBinarySensor(VehicleEntity[EnodeVehiclesCoordinator], BinarySensorE
 class VehicleChargeStateBinarySensor(VehicleBinarySensor):
     """Binary sensor for vehicle charge state."""
 
+    vehicle_fields = frozenset({"charge_state"})
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
@@ -105,6 +103,8 @@ class VehicleChargeStateBinarySensor(VehicleBinarySensor):
 class VehicleSmartChargingBinarySensor(VehicleBinarySensor):
     """Binary sensor for vehicle smart charging."""
 
+    vehicle_fields = frozenset({"smart_charging_policy"})
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
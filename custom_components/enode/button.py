@@ -10,12 +10,15 @@ from homeassistant.components.button import (
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .api import EnodeClient, EnodeError
-from .const import LOGGER
+from .api import EnodeError
+from .circuit import CircuitOpenError
+from .const import DOMAIN, LOGGER
 from .coordinator import EnodeConfigEntry, EnodeCoordinators, EnodeVehiclesCoordinator
-from .entity import VehicleEntity
+from .entity import VehicleEntity, async_add_vehicle_entities
+from .models import Vehicle
 
 
 async def async_setup_entry(
@@ -24,25 +27,18 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enode sensor platform."""
-    async_add_entities(_generate_buttons(config_entry.runtime_data))
-
-
-def _generate_buttons(
-    coordinator: EnodeCoordinators,
-) -> Generator[ButtonEntity]:
-    """Generate Enode buttons."""
-    yield from _generate_vehicle_buttons(coordinator.vehicles, coordinator.client)
+    async_add_vehicle_entities(
+        config_entry, async_add_entities, _generate_vehicle_buttons
+    )
 
 
 def _generate_vehicle_buttons(
-    coordinator: EnodeVehiclesCoordinator,
-    client: EnodeClient,
+    coordinators: EnodeCoordinators, vehicle: Vehicle
 ) -> Generator[ButtonEntity]:
-    """Generate buttons for vehicles."""
-    for vehicle in coordinator.data or []:
-        yield VehicleRefreshButton(
-            coordinator=coordinator, vehicle=vehicle, client=client
-        )
+    """Generate buttons for a vehicle."""
+    yield VehicleRefreshButton(
+        coordinator=coordinators.vehicles, vehicle=vehicle, client=coordinators.client
+    )
 
 
 class VehicleRefreshButton(VehicleEntity[EnodeVehiclesCoordinator], ButtonEntity):
@@ -59,6 +55,12 @@ class VehicleRefreshButton(VehicleEntity[EnodeVehiclesCoordinator], ButtonEntity
         """Press the button to refresh vehicle data."""
         try:
             await self.client.refresh_vehicle_data(self.vehicle_id)
+        except CircuitOpenError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="api_unavailable",
+                translation_placeholders={"retry_after": f"{err.retry_after:.0f}"},
+            ) from err
         except EnodeError as err:
             LOGGER.error(
                 "Failed to refresh data for vehicle %s: %s - %s",
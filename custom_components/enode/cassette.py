@@ -0,0 +1,278 @@
+"""Record and replay Enode API traffic.
+
+A recording cassette passes requests through to the API and keeps a redacted
+copy of every response. The interactions can be saved to a compact gzipped
+JSON lines file and replayed later, without touching the network, to profile
+or regression test the client on realistic payloads.
+"""
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+import gzip
+import json
+from pathlib import Path
+import time
+from typing import Any, Self
+
+from aiohttp import ClientResponse, ClientResponseError, RequestInfo
+from aiohttp.hdrs import CONTENT_TYPE
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .const import LOGGER
+from .ratelimit import HEADER_LIMIT, HEADER_REMAINING, HEADER_RESET, HEADER_RETRY_AFTER
+
+REDACTED = "**REDACTED**"
+TO_REDACT = frozenset(
+    {
+        "access_token",
+        "refresh_token",
+        "secret",
+        "linkToken",
+        "linkUrl",
+        "vin",
+        "latitude",
+        "longitude",
+    }
+)
+RECORDED_HEADERS = (
+    CONTENT_TYPE,
+    HEADER_LIMIT,
+    HEADER_REMAINING,
+    HEADER_RESET,
+    HEADER_RETRY_AFTER,
+)
+
+type Send = Callable[..., Awaitable[ClientResponse]]
+
+
+def _redact(data: Any) -> Any:
+    """Return the data with sensitive values replaced, keeping their types."""
+    if isinstance(data, dict):
+        return {
+            key: _redact_value(value) if key in TO_REDACT else _redact(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_redact(item) for item in data]
+    return data
+
+
+def _redact_value(value: Any) -> Any:
+    """Return a placeholder of the same type as the value."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, int | float):
+        return 0.0
+    return REDACTED
+
+
+def _request_url(url: URL, params: dict[str, Any] | None) -> URL:
+    """Return the URL of a request including its query parameters."""
+    return url.update_query(params) if params else url
+
+
+def _request_key(method: str, url: URL) -> str:
+    """Return the host independent key an interaction is matched on."""
+    query = "&".join(f"{key}={value}" for key, value in sorted(url.query.items()))
+    return f"{method} {url.path}?{query}" if query else f"{method} {url.path}"
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """A recorded request and its response."""
+
+    method: str
+    path: str
+    status: int
+    headers: dict[str, str]
+    body: str
+    offset: float
+    duration: float
+
+    @property
+    def key(self) -> str:
+        """Return the key the interaction is matched on."""
+        return _request_key(self.method, URL(self.path))
+
+
+def save_interactions(path: str | Path, interactions: Iterable[Interaction]) -> None:
+    """Write interactions to a gzipped JSON lines file.
+
+    This does blocking I/O and should be run in an executor from the event loop.
+    """
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        for interaction in interactions:
+            file.write(json.dumps(asdict(interaction), separators=(",", ":")))
+            file.write("\n")
+
+
+def load_interactions(path: str | Path) -> list[Interaction]:
+    """Read interactions from a gzipped JSON lines file.
+
+    This does blocking I/O and should be run in an executor from the event loop.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [Interaction(**json.loads(line)) for line in file if line.strip()]
+
+
+class _BufferedContent:
+    """Buffered body exposing the parts of StreamReader the client uses."""
+
+    def __init__(self, body: bytes) -> None:
+        """Initialize the content."""
+        self._body = body
+
+    async def iter_chunked(self, size: int) -> AsyncGenerator[bytes]:
+        """Yield the body in chunks of the given size."""
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class _RecordedResponse:
+    """Live response served from its body, which recording already read."""
+
+    def __init__(self, response: ClientResponse, body: bytes) -> None:
+        """Initialize the response."""
+        self._response = response
+        self.content = _BufferedContent(body)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the attribute of the live response."""
+        return getattr(self._response, name)
+
+
+class CassetteResponse:
+    """Replayed response exposing the parts of ClientResponse the client uses."""
+
+    def __init__(self, method: str, url: URL, interaction: Interaction) -> None:
+        """Initialize the response."""
+        self.method = method
+        self.url = url
+        self.status = interaction.status
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        self.history: tuple[ClientResponse, ...] = ()
+        self.request_info = RequestInfo(
+            url, method, CIMultiDictProxy(CIMultiDict()), url
+        )
+        self._body = interaction.body.encode()
+        self.content = _BufferedContent(self._body)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the status is below 400."""
+        return self.status < 400
+
+    @property
+    def content_length(self) -> int:
+        """Return the length of the body."""
+        return len(self._body)
+
+    async def read(self) -> bytes:
+        """Return the recorded body."""
+        return self._body
+
+    def release(self) -> None:
+        """Release the response, which holds no connection."""
+
+    def raise_for_status(self) -> None:
+        """Raise ClientResponseError if the status is 400 or higher."""
+        if not self.ok:
+            raise ClientResponseError(
+                self.request_info,
+                self.history,
+                status=self.status,
+                message=f"Replayed status {self.status}",
+                headers=self.headers,
+            )
+
+
+class CassetteRecorder:
+    """Pass requests through and record their redacted responses.
+
+    Recording reads the whole body, so callers streaming the response
+    afterwards are served the buffered body instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        self.interactions: list[Interaction] = []
+        self._started = time.perf_counter()
+
+    async def request(
+        self, send: Send, method: str, url: URL, **kwargs
+    ) -> _RecordedResponse:
+        """Send a request and record its response."""
+        started = time.perf_counter()
+        response = await send(method, url, **kwargs)
+        content = await response.read()
+        duration = time.perf_counter() - started
+        try:
+            body = json.dumps(_redact(json.loads(content)), separators=(",", ":"))
+        except ValueError:
+            body = content.decode(errors="replace")
+        self.interactions.append(
+            Interaction(
+                method=method,
+                path=str(_request_url(url, kwargs.get("params")).relative()),
+                status=response.status,
+                headers={
+                    name: response.headers[name]
+                    for name in RECORDED_HEADERS
+                    if name in response.headers
+                },
+                body=body,
+                offset=started - self._started,
+                duration=duration,
+            )
+        )
+        return _RecordedResponse(response, content)
+
+    def save(self, path: str | Path) -> None:
+        """Write the recorded interactions to a file."""
+        save_interactions(path, self.interactions)
+
+
+class CassettePlayer:
+    """Serve recorded responses instead of sending requests.
+
+    Interactions are matched on method, path and query, in the order they
+    were recorded. Each response is delayed by its recorded duration
+    multiplied by the time scale: 1 replays the original timing, smaller
+    values compress it and 0 replays without delay.
+    """
+
+    def __init__(
+        self, interactions: Iterable[Interaction], time_scale: float = 1.0
+    ) -> None:
+        """Initialize the player."""
+        self.time_scale = time_scale
+        self._interactions: defaultdict[str, deque[Interaction]] = defaultdict(deque)
+        for interaction in interactions:
+            self._interactions[interaction.key].append(interaction)
+
+    @classmethod
+    def load(cls, path: str | Path, time_scale: float = 1.0) -> Self:
+        """Create a player from a cassette file."""
+        return cls(load_interactions(path), time_scale)
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of interactions not yet replayed."""
+        return sum(len(queue) for queue in self._interactions.values())
+
+    async def request(
+        self, send: Send, method: str, url: URL, **kwargs
+    ) -> CassetteResponse:
+        """Return the next recorded response for the request."""
+        key = _request_key(method, _request_url(url, kwargs.get("params")))
+        queue = self._interactions.get(key)
+        if not queue:
+            raise LookupError(f"No recorded interaction for {key}")
+        interaction = queue.popleft()
+        if delay := interaction.duration * self.time_scale:
+            await asyncio.sleep(delay)
+        LOGGER.debug("Replaying %d response for %s", interaction.status, key)
+        return CassetteResponse(method, url, interaction)
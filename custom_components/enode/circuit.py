@@ -0,0 +1,121 @@
+"""Circuit breaker guarding the Enode API."""
+
+from collections.abc import Callable
+from datetime import timedelta
+from enum import StrEnum
+import time
+from typing import Any
+
+from aiohttp import ClientConnectionError
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT, LOGGER
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ClientConnectionError):
+    """Request rejected because the circuit breaker is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialize the error."""
+        self.retry_after = retry_after
+        super().__init__(
+            f"Enode API is unavailable, retrying in {retry_after:.0f} seconds"
+        )
+
+
+class CircuitBreaker:
+    """Stop calling the API after consecutive failures.
+
+    The circuit opens after ``failure_threshold`` consecutive failures and
+    rejects requests until ``recovery_timeout`` has passed. It then lets a
+    single probe request through while half open, closing again when the
+    probe succeeds and reopening when it fails.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: timedelta = CIRCUIT_RECOVERY_TIMEOUT,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._time = time_func
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout.total_seconds()
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._time() - self._opened_at < self.recovery_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Return the number of seconds until a probe is allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(self._opened_at + self.recovery_timeout - self._time(), 0.0)
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            LOGGER.debug("Circuit half open, probing the Enode API")
+            self._probing = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.retry_after)
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy API."""
+        if self._opened_at is not None:
+            LOGGER.info("Enode API recovered, closing circuit")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a request that failed because of the API or network."""
+        self.failures += 1
+        if self._probing or (
+            self._opened_at is None and self.failures >= self.failure_threshold
+        ):
+            LOGGER.warning(
+                "Enode API failed %d times, pausing requests for %.0f seconds",
+                self.failures,
+                self.recovery_timeout,
+            )
+            self.opened += 1
+            self._opened_at = self._time()
+        self._probing = False
+
+    def release(self) -> None:
+        """Record a request that ended without telling anything about the API."""
+        self._probing = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the circuit breaker as a dictionary."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_after": round(self.retry_after, 3),
+        }
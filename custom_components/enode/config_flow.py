@@ -160,7 +160,11 @@ class UserLinkFlowHandler(ConfigSubentryFlow):
         self, user_input: dict[str, Any]
     ) -> SubentryFlowResult:
         """Handle the user link step."""
-        self.hass.config_entries.async_schedule_reload(self._entry_id)
+        # Entities of newly linked vehicles are added by the refresh
+        entry: EnodeConfigEntry = self._get_entry()
+        entry.async_create_background_task(
+            self.hass, entry.runtime_data.async_refresh(), "enode_vehicles_refresh"
+        )
         return self.async_abort(reason="user_linked")
 
 
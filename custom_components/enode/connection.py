@@ -0,0 +1,226 @@
+"""Dedicated HTTP connection pool for the Enode API."""
+
+from dataclasses import dataclass
+from datetime import timedelta
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionCreateStartParams,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+    TraceConnectionReuseconnParams,
+    TraceDnsCacheHitParams,
+    TraceDnsCacheMissParams,
+)
+from aiohttp.hdrs import AUTHORIZATION, USER_AGENT
+from yarl import URL
+
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
+
+from .const import (
+    POOL_CONNECT_TIMEOUT,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+    POOL_REQUEST_TIMEOUT,
+)
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """Tuning options for the Enode connection pool."""
+
+    limit: int = POOL_LIMIT
+    limit_per_host: int = POOL_LIMIT_PER_HOST
+    keepalive_timeout: timedelta = POOL_KEEPALIVE_TIMEOUT
+    dns_cache_ttl: timedelta = POOL_DNS_CACHE_TTL
+    connect_timeout: timedelta = POOL_CONNECT_TIMEOUT
+    request_timeout: timedelta = POOL_REQUEST_TIMEOUT
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Counters describing how the connection pool is used."""
+
+    connections_created: int = 0
+    connections_reused: int = 0
+    connect_time: float = 0.0
+    queued: int = 0
+    queue_wait: float = 0.0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of requests that reused a pooled connection."""
+        if total := self.connections_created + self.connections_reused:
+            return self.connections_reused / total
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        reuse_ratio = self.reuse_ratio
+        return {
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": None if reuse_ratio is None else round(reuse_ratio, 3),
+            "connect_time": round(self.connect_time, 3),
+            "queued": self.queued,
+            "queue_wait": round(self.queue_wait, 3),
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+class _PoolConnector(TCPConnector):
+    """TCP connector that reports how many connections it holds open."""
+
+    @property
+    def open_connections(self) -> int:
+        """Return the number of idle and in-use connections."""
+        idle = sum(len(connections) for connections in self._conns.values())
+        return idle + len(self._acquired)
+
+
+class ConnectionPool:
+    """HTTP session with its own connector, dedicated to the Enode API.
+
+    Keeping Enode traffic off Home Assistant's shared session allows keep-alive,
+    DNS caching, connection limits and timeouts to be tuned for the API host.
+    The session is created lazily on first use, from within the event loop.
+    """
+
+    def __init__(self, config: ConnectionPoolConfig | None = None) -> None:
+        """Initialize the connection pool."""
+        self.config = config or ConnectionPoolConfig()
+        self.stats = ConnectionPoolStats()
+        self._connector: _PoolConnector | None = None
+        self._session: ClientSession | None = None
+
+    @property
+    def open_connections(self) -> int:
+        """Return the number of connections currently open."""
+        if self._connector is None or self._connector.closed:
+            return 0
+        return self._connector.open_connections
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pool statistics as a dictionary."""
+        return {"open_connections": self.open_connections, **self.stats.as_dict()}
+
+    def _trace_config(self) -> TraceConfig:
+        """Return a trace config that records pool statistics."""
+        stats = self.stats
+
+        async def on_queued_start(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceConnectionQueuedStartParams,
+        ) -> None:
+            context.queued_at = time.perf_counter()
+
+        async def on_queued_end(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceConnectionQueuedEndParams,
+        ) -> None:
+            stats.queued += 1
+            stats.queue_wait += time.perf_counter() - context.queued_at
+
+        async def on_create_start(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceConnectionCreateStartParams,
+        ) -> None:
+            context.connecting_at = time.perf_counter()
+
+        async def on_create_end(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceConnectionCreateEndParams,
+        ) -> None:
+            stats.connections_created += 1
+            stats.connect_time += time.perf_counter() - context.connecting_at
+
+        async def on_reuse(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceConnectionReuseconnParams,
+        ) -> None:
+            stats.connections_reused += 1
+
+        async def on_dns_cache_hit(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceDnsCacheHitParams,
+        ) -> None:
+            stats.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(
+            session: ClientSession,
+            context: SimpleNamespace,
+            params: TraceDnsCacheMissParams,
+        ) -> None:
+            stats.dns_cache_misses += 1
+
+        trace_config = TraceConfig()
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_start.append(on_create_start)
+        trace_config.on_connection_create_end.append(on_create_end)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            config = self.config
+            self._connector = _PoolConnector(
+                ssl=client_context(),
+                limit=config.limit,
+                limit_per_host=config.limit_per_host,
+                keepalive_timeout=config.keepalive_timeout.total_seconds(),
+                ttl_dns_cache=int(config.dns_cache_ttl.total_seconds()),
+            )
+            self._session = ClientSession(
+                connector=self._connector,
+                timeout=ClientTimeout(
+                    total=config.request_timeout.total_seconds(),
+                    connect=config.connect_timeout.total_seconds(),
+                ),
+                headers={USER_AGENT: SERVER_SOFTWARE},
+                trace_configs=[self._trace_config()],
+            )
+        return self._session
+
+    async def request(
+        self, method: str, url: str | URL, access_token: str, **kwargs
+    ) -> ClientResponse:
+        """Make a request authenticated with the given access token."""
+        headers = kwargs.pop("headers", {})
+        return await self.session.request(
+            method,
+            url,
+            headers={**headers, AUTHORIZATION: f"Bearer {access_token}"},
+            **kwargs,
+        )
+
+    async def async_close(self) -> None:
+        """Close the session and every pooled connection."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._connector = None
@@ -17,6 +17,7 @@ CONF_WEBHOOK_ID: Final[str] = "webhook_id"
 CONF_WEBHOOK_SECRET: Final[str] = "webhook_secret"
 
 DATA_COORDINATORS: Final[str] = "coordinators"
+DATA_SHARED_TOKENS: Final[str] = f"{DOMAIN}_shared_tokens"
 
 STATE_REACHABLE: Final[str] = "reachable"
 STATE_UNREACHABLE: Final[str] = "unreachable"
@@ -28,3 +29,43 @@ PRODUCTION_API_URL: Final[str] = "https://enode-api.production.enode.io"
 SANDBOX_API_URL: Final[str] = "https://enode-api.sandbox.enode.io"
 
 UPDATE_INTERVAL: Final[timedelta] = timedelta(minutes=5)
+UPDATE_INTERVAL_CHARGING: Final[timedelta] = timedelta(minutes=2)
+UPDATE_INTERVAL_WEBHOOKS_HEALTHY: Final[timedelta] = timedelta(minutes=30)
+WEBHOOK_HEALTH_TIMEOUT: Final[timedelta] = timedelta(minutes=15)
+WEBHOOK_COALESCE_WINDOW: Final[timedelta] = timedelta(seconds=1)
+WEBHOOK_QUEUE_SIZE: Final[int] = 100
+WEBHOOK_RETRY_AFTER: Final[timedelta] = timedelta(seconds=30)
+WEBHOOK_DELIVERIES_SIZE: Final[int] = 256
+WEBHOOK_DELIVERIES_TTL: Final[timedelta] = timedelta(hours=1)
+VEHICLES_PAGE_SIZE: Final[int] = 50
+STREAM_CHUNK_SIZE: Final[int] = 16 * 1024
+
+RATE_LIMIT_REQUESTS: Final[int] = 60
+RATE_LIMIT_PERIOD: Final[timedelta] = timedelta(minutes=1)
+RATE_LIMIT_LOW_WATERMARK: Final[float] = 0.2
+RATE_LIMIT_MAX_RETRIES: Final[int] = 3
+RATE_LIMIT_DEFAULT_RETRY_AFTER: Final[timedelta] = timedelta(seconds=30)
+RATE_LIMIT_INTERACTIVE_RESERVE: Final[float] = 0.1
+
+RETRY_MAX_ATTEMPTS: Final[int] = 4
+RETRY_BASE_DELAY: Final[timedelta] = timedelta(seconds=1)
+RETRY_MAX_DELAY: Final[timedelta] = timedelta(seconds=15)
+RETRY_DEADLINE: Final[timedelta] = timedelta(seconds=45)
+
+POOL_LIMIT: Final[int] = 10
+POOL_LIMIT_PER_HOST: Final[int] = 6
+POOL_KEEPALIVE_TIMEOUT: Final[timedelta] = timedelta(minutes=6)
+POOL_DNS_CACHE_TTL: Final[timedelta] = timedelta(minutes=10)
+POOL_CONNECT_TIMEOUT: Final[timedelta] = timedelta(seconds=10)
+POOL_REQUEST_TIMEOUT: Final[timedelta] = timedelta(seconds=30)
+
+METRICS_WINDOW: Final[int] = 200
+
+SNAPSHOT_STORAGE_VERSION: Final[int] = 1
+SNAPSHOT_SAVE_DELAY: Final[timedelta] = timedelta(seconds=30)
+
+CIRCUIT_FAILURE_THRESHOLD: Final[int] = 3
+CIRCUIT_RECOVERY_TIMEOUT: Final[timedelta] = timedelta(minutes=2)
+
+TOKEN_REFRESH_MARGIN: Final[timedelta] = timedelta(minutes=5)
+TOKEN_REFRESH_RETRY: Final[timedelta] = timedelta(seconds=30)
@@ -1,28 +1,262 @@
 """Coordinator for various Enode entities."""
 
 import asyncio
+from collections.abc import Callable, Collection, Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientResponseError
+from aiohttp import ClientError, ClientResponseError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import EnodeClient
-from .const import CONF_USER_ID, LOGGER, UPDATE_INTERVAL
+from .circuit import CircuitState
+from .const import CONF_USER_ID, LOGGER, UPDATE_INTERVAL, VEHICLES_PAGE_SIZE
 from .models import Vehicle
+from .polling import PollingSchedule
+from .snapshot import VehicleSnapshot
+
+if TYPE_CHECKING:
+    from .webhook import WebhookProcessor
 
 type EnodeConfigEntry = ConfigEntry[EnodeCoordinators]
 
+VEHICLE_FIELDS = frozenset(Vehicle.model_fields)
+TIMESTAMPED_SECTIONS = ("charge_state", "location", "odometer")
+
+
+def _changed_fields(old: Vehicle | None, new: Vehicle | None) -> frozenset[str]:
+    """Return the names of the vehicle fields that differ."""
+    if old is None or new is None:
+        return VEHICLE_FIELDS if old is not new else frozenset()
+    if old is new:
+        return frozenset()
+    return frozenset(
+        name for name in VEHICLE_FIELDS if getattr(old, name) != getattr(new, name)
+    )
+
+
+def _section_newer(section: Any, other: Any) -> bool:
+    """Return True if a vehicle section was updated after the other."""
+    updated = getattr(section, "last_updated", None)
+    other_updated = getattr(other, "last_updated", None)
+    return updated is not None and other_updated is not None and updated > other_updated
+
+
+def _newest_vehicle(current: Vehicle | None, incoming: Vehicle) -> Vehicle:
+    """Return the incoming vehicle without regressing data already held.
+
+    The vehicle seen last is kept, taking any section, such as the charge
+    state or location, that the other one has more recent data for.
+    """
+    if current is None:
+        return incoming
+    if incoming.last_seen < current.last_seen:
+        newest, other = current, incoming
+    else:
+        newest, other = incoming, current
+    update = {
+        name: getattr(other, name)
+        for name in TIMESTAMPED_SECTIONS
+        if _section_newer(getattr(other, name), getattr(newest, name))
+    }
+    return newest.model_copy(update=update) if update else newest
+
+
+class EnodeVehiclesCoordinator(DataUpdateCoordinator[dict[str, Vehicle]]):
+    """Vehicles coordinator for Enode, holding vehicles keyed by ID.
+
+    Vehicle entities listen with their vehicle ID as context so that an
+    update of a single vehicle only wakes the entities of that vehicle. New
+    data is compared with the current data field by field, so that vehicles
+    and entities whose fields did not change skip their state writes. The
+    data is flagged as stale while it is served without reaching the API,
+    and as complete once a poll has listed every vehicle.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the vehicles coordinator."""
+        super().__init__(*args, **kwargs)
+        self._context_listeners: dict[Any, list[CALLBACK_TYPE]] = {}
+        self._changes: dict[str, frozenset[str]] | None = None
+        self._changed_vehicles: Collection[str] | None = None
+        self._notified_success = True
+        self._notified_stale = False
+        self._refresh_due: float | None = None
+        self.stale = False
+        self.complete = False
+        self.skipped_writes = 0
+        self.outdated = 0
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule a refresh, remembering when it is due."""
+        delay = self._retry_after or self._update_interval_seconds
+        super()._schedule_refresh()
+        self._refresh_due = (
+            None
+            if self._unsub_refresh is None or delay is None
+            else self.hass.loop.time() + delay
+        )
+
+    @callback
+    def async_set_update_interval(self, interval: timedelta | None) -> None:
+        """Change how often to poll.
+
+        A pending refresh is brought forward when the new interval would have
+        it happen sooner, rather than waiting out the previous interval.
+        """
+        self.update_interval = interval
+        if (
+            interval is not None
+            and self._unsub_refresh is not None
+            and self._refresh_due is not None
+            and self.hass.loop.time() + interval.total_seconds() < self._refresh_due
+        ):
+            self._schedule_refresh()
+
+    @callback
+    def async_newest(self, vehicle: Vehicle) -> Vehicle:
+        """Return the vehicle, keeping any newer data already held for it."""
+        current = (self.data or {}).get(vehicle.id)
+        newest = _newest_vehicle(current, vehicle)
+        if newest is current and current is not vehicle:
+            self.outdated += 1
+            self.logger.debug("Ignoring outdated data for %s", vehicle.id)
+        return newest
+
+    @callback
+    def async_track_changes(self, data: dict[str, Vehicle]) -> bool:
+        """Record the fields of each vehicle that differ from the current data.
+
+        Return True if any vehicle changed.
+        """
+        current = self.data or {}
+        changes: dict[str, frozenset[str]] = {}
+        for vehicle_id in current.keys() | data.keys():
+            if fields := _changed_fields(current.get(vehicle_id), data.get(vehicle_id)):
+                changes[vehicle_id] = fields
+        self._changes = changes
+        return bool(changes)
+
+    @callback
+    def async_vehicle_changed(self, vehicle_id: str, fields: Iterable[str]) -> bool:
+        """Return True if any of the fields of a vehicle changed.
+
+        Listeners call this while being notified, and a False result is
+        counted as a skipped state write.
+        """
+        if self._changes is None:
+            return True
+        if self._changes.get(vehicle_id, frozenset()).isdisjoint(fields):
+            self.skipped_writes += 1
+            return False
+        return True
+
+    @callback
+    def async_changed_vehicles(self) -> Collection[str] | None:
+        """Return the IDs of the vehicles changed by the update being notified.
+
+        Listeners without context call this while being notified. None is
+        returned when the changes are unknown, and any vehicle may have
+        been added, changed or removed.
+        """
+        return self._changed_vehicles
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the vehicles that changed.
+
+        Every listener is updated when the changes are unknown, or when the
+        success of the last update or the staleness of the data flipped and
+        every entity has to follow.
+        """
+        changes = self._changes
+        self._changed_vehicles = None if changes is None else changes.keys()
+        try:
+            if (
+                changes is None
+                or self.last_update_success is not self._notified_success
+                or self.stale is not self._notified_stale
+            ):
+                self._changes = None
+                super().async_update_listeners()
+            else:
+                self.async_update_vehicle_listeners(changes)
+        finally:
+            self._changes = None
+            self._changed_vehicles = None
+            self._notified_success = self.last_update_success
+            self._notified_stale = self.stale
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by context."""
+        remove = super().async_add_listener(update_callback, context)
+        listeners = self._context_listeners.setdefault(context, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            remove()
+            listeners.remove(update_callback)
+            if not listeners and self._context_listeners.get(context) is listeners:
+                del self._context_listeners[context]
+
+        return remove_listener
+
+    @callback
+    def async_update_vehicle_listeners(self, vehicle_ids: Iterable[str]) -> None:
+        """Update the listeners of the given vehicles and those without context."""
+        for context in (None, *vehicle_ids):
+            for update_callback in list(self._context_listeners.get(context, ())):
+                update_callback()
+
+    @callback
+    def async_set_vehicle_data(self, vehicle: Vehicle) -> None:
+        """Replace the data of a single vehicle and notify its listeners.
+
+        Unlike async_set_updated_data the polling schedule is left alone, as
+        an update for one vehicle says nothing about the others.
+        """
+        self.async_set_vehicles_data((vehicle,))
 
-class EnodeVehiclesCoordinator(DataUpdateCoordinator[list[Vehicle]]):
-    """Vehicles coordinator for Enode."""
+    @callback
+    def async_set_vehicles_data(self, vehicles: Iterable[Vehicle]) -> None:
+        """Replace the data of some vehicles and notify their listeners once."""
+        if self.data is None:
+            self.data = {}
+        changes: dict[str, frozenset[str]] = {}
+        for incoming in vehicles:
+            vehicle = self.async_newest(incoming)
+            if fields := _changed_fields(self.data.get(vehicle.id), vehicle):
+                changes[vehicle.id] = changes.get(vehicle.id, frozenset()) | fields
+            self.data[vehicle.id] = vehicle
+            self.logger.debug("Manually updated %s data for %s", self.name, vehicle.id)
+        self._changes = changes
+        self.last_update_success = True
+        self.async_update_listeners()
+
+    @callback
+    def async_remove_vehicle(self, vehicle_id: str) -> None:
+        """Remove a single vehicle and notify its listeners."""
+        if not self.data or self.data.pop(vehicle_id, None) is None:
+            return
+        self._changes = {vehicle_id: VEHICLE_FIELDS}
+        self.logger.debug("Removed %s data for %s", self.name, vehicle_id)
+        self.async_update_listeners()
 
 
 class EnodeCoordinators:
     """Base coordinator for Enode."""
 
     test_future: asyncio.Future[bool] | None = None
+    webhooks: "WebhookProcessor | None" = None
 
     def __init__(
         self,
@@ -30,10 +264,16 @@ class EnodeCoordinators:
         client: EnodeClient,
         config_entry: ConfigEntry | None = None,
         use_update_interval: bool = True,
+        snapshot: VehicleSnapshot | None = None,
     ) -> None:
         """Initialize Enode Coordinator."""
+        self.hass = hass
         self.client = client
         self.user_id = config_entry.data.get(CONF_USER_ID) if config_entry else None
+        self.use_update_interval = use_update_interval
+        self.snapshot = snapshot
+        self.polling = PollingSchedule()
+        self._unsub_webhook_timeout: CALLBACK_TYPE | None = None
         self.vehicles = EnodeVehiclesCoordinator(
             hass=hass,
             logger=LOGGER,
@@ -43,14 +283,101 @@ class EnodeCoordinators:
             update_interval=UPDATE_INTERVAL if use_update_interval else None,
         )
 
-    async def _fetch_vehicles(self) -> list[Vehicle]:
-        """Update vehicles data."""
+    async def _fetch_vehicles(self) -> dict[str, Vehicle]:
+        """Update vehicles data.
+
+        While the circuit breaker is open the last good vehicle data is kept
+        and marked as stale, rather than making every entity unavailable.
+        """
+        vehicles: dict[str, Vehicle] | None = None
         try:
-            if self.user_id is None:
-                return await self.client.list_vehicles()
-            return await self.client.list_user_vehicles(self.user_id)
-        except ClientResponseError as err:
-            raise UpdateFailed from err
+            vehicles = await self._list_vehicles()
+        except (ClientError, TimeoutError) as err:
+            if (
+                self.vehicles.data is not None
+                and self.client.circuit_breaker.state is not CircuitState.CLOSED
+            ):
+                if not self.stale:
+                    LOGGER.warning("Enode API unavailable, serving stale data: %s", err)
+                self.vehicles.stale = True
+                self.vehicles.async_track_changes(self.vehicles.data)
+                return self.vehicles.data
+            if isinstance(err, ClientResponseError):
+                raise UpdateFailed from err
+            raise
+        finally:
+            self._adjust_update_interval(vehicles)
+        self.vehicles.stale = False
+        self.vehicles.complete = True
+        if self.vehicles.async_track_changes(vehicles) and self.snapshot:
+            self.snapshot.async_schedule_save(vehicles)
+        return vehicles
+
+    async def _list_vehicles(self) -> dict[str, Vehicle]:
+        """List every vehicle.
+
+        Until any vehicle is known, each page is published as soon as it has
+        been read, so the entities of its vehicles are added without waiting
+        for the last page. The vehicles are merged with the current data only
+        once the last page has been read, so a webhook that arrived while
+        later pages were in flight is not regressed by the older poll.
+        """
+        publish = self.vehicles.data is None
+        vehicles: dict[str, Vehicle] = {}
+        page: list[Vehicle] = []
+        async for vehicle in self.client.iter_vehicles(
+            self.user_id, page_size=VEHICLES_PAGE_SIZE, prefetch=True
+        ):
+            vehicles[vehicle.id] = vehicle
+            if publish:
+                page.append(vehicle)
+                if len(page) == VEHICLES_PAGE_SIZE:
+                    self.vehicles.async_set_vehicles_data(page)
+                    page = []
+        return {
+            vehicle_id: self.vehicles.async_newest(vehicle)
+            for vehicle_id, vehicle in vehicles.items()
+        }
+
+    @property
+    def stale(self) -> bool:
+        """Return True if the vehicle data is served without reaching the API."""
+        return self.vehicles.stale
+
+    def _adjust_update_interval(
+        self, vehicles: dict[str, Vehicle] | None = None
+    ) -> None:
+        """Adapt polling to webhook health, charging and the API budget."""
+        if not self.use_update_interval:
+            return
+        if vehicles is None:
+            vehicles = self.vehicles.data or {}
+        interval = self.polling.next_interval(vehicles.values())
+        rate_limiter = self.client.rate_limiter
+        if rate_limiter.is_low:
+            interval = max(interval, rate_limiter.reset_after)
+            LOGGER.debug(
+                "API budget is low (%d remaining), polling every %s",
+                rate_limiter.remaining,
+                interval,
+            )
+        if interval != self.vehicles.update_interval:
+            LOGGER.debug("Polling vehicles every %s", interval)
+        self.vehicles.async_set_update_interval(interval)
+
+    async def async_load_snapshot(self) -> bool:
+        """Serve the stored vehicles as stale data until the first refresh.
+
+        Return True if a snapshot was loaded.
+        """
+        if (
+            self.snapshot is None
+            or (vehicles := await self.snapshot.async_load()) is None
+        ):
+            return False
+        self.vehicles.data = vehicles
+        self.vehicles.stale = True
+        return True
 
     async def async_refresh(self) -> None:
         """Refresh data and log errors."""
@@ -65,9 +392,56 @@ class EnodeCoordinators:
         if self.test_future:
             self.test_future.cancel()
             self.test_future = None
+        self._cancel_webhook_timeout()
+        await self.client.async_close()
+
+    def record_webhook(self) -> None:
+        """Record the arrival of webhook events, which eases polling.
+
+        A timer notices webhooks going quiet, so polling tightens again
+        without waiting for the next, eased, poll.
+        """
+        self.polling.record_webhook()
+        self._adjust_update_interval()
+        if self.use_update_interval:
+            self._schedule_webhook_timeout(self.polling.health_timeout)
+
+    def _schedule_webhook_timeout(self, delay: float) -> None:
+        """Re-evaluate the polling interval once the delay has passed."""
+        self._cancel_webhook_timeout()
+        self._unsub_webhook_timeout = async_call_later(
+            self.hass, delay, self._handle_webhook_timeout
+        )
+
+    def _cancel_webhook_timeout(self) -> None:
+        """Cancel the webhook health timer."""
+        if self._unsub_webhook_timeout is not None:
+            self._unsub_webhook_timeout()
+            self._unsub_webhook_timeout = None
+
+    @callback
+    def _handle_webhook_timeout(self, _now: datetime) -> None:
+        """Tighten polling once webhooks have gone quiet."""
+        self._unsub_webhook_timeout = None
+        if remaining := self.polling.webhooks_healthy_for:
+            self._schedule_webhook_timeout(remaining)
+            return
+        LOGGER.debug("No webhooks received recently, polling more often")
+        self._adjust_update_interval()
 
     def update_vehicle_data(self, vehicle: Vehicle) -> None:
         """Update vehicle data."""
-        self.vehicles.async_set_updated_data(
-            [v for v in self.vehicles.data if v.id != vehicle.id] + [vehicle]
-        )
+        self.update_vehicles_data((vehicle,))
+
+    def update_vehicles_data(self, vehicles: Iterable[Vehicle]) -> None:
+        """Update the data of several vehicles at once."""
+        self.vehicles.async_set_vehicles_data(vehicles)
+        self._adjust_update_interval()
+        if self.snapshot:
+            self.snapshot.async_schedule_save(self.vehicles.data)
+
+    def remove_vehicle_data(self, vehicle_id: str) -> None:
+        """Remove the data of a deleted vehicle."""
+        self.vehicles.async_remove_vehicle(vehicle_id)
+        if self.snapshot and self.vehicles.data is not None:
+            self.snapshot.async_schedule_save(self.vehicles.data)
@@ -1,6 +1,7 @@
 """Device Tracker platform for Enode integration."""
 
 from collections.abc import Generator
+from typing import Any
 
 from homeassistant.components.device_tracker import (
     TrackerEntity,
@@ -11,7 +12,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import LOGGER
 from .coordinator import EnodeConfigEntry, EnodeCoordinators, EnodeVehiclesCoordinator
-from .entity import VehicleEntity
+from .entity import VehicleEntity, async_add_vehicle_entities
+from .models import Vehicle
 
 
 async def async_setup_entry(
@@ -20,30 +22,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enode sensor platform."""
-    async_add_entities(_generate_trackers(config_entry.runtime_data))
-
-
-def _generate_trackers(
-    coordinator: EnodeCoordinators,
-) -> Generator[TrackerEntity]:
-    """Generate Enode trackers."""
-    yield from _generate_vehicle_trackers(coordinator.vehicles)
+    async_add_vehicle_entities(
+        config_entry, async_add_entities, _generate_vehicle_trackers
+    )
 
 
 def _generate_vehicle_trackers(
-    coordinator: EnodeVehiclesCoordinator,
+    coordinators: EnodeCoordinators, vehicle: Vehicle
 ) -> Generator[TrackerEntity]:
-    """Generate trackers for vehicles."""
-    for vehicle in coordinator.data or []:
-        LOGGER.debug("Generating tracker for vehicle %s", vehicle.id)
-        if vehicle.capabilities.location.is_capable:
-            LOGGER.debug("Vehicle %s supports location", vehicle.id)
-            yield VehicleTracker(coordinator=coordinator, vehicle=vehicle)
+    """Generate trackers for a vehicle."""
+    coordinator = coordinators.vehicles
+    LOGGER.debug("Generating tracker for vehicle %s", vehicle.id)
+    if vehicle.capabilities.location.is_capable:
+        LOGGER.debug("Vehicle %s supports location", vehicle.id)
+        yield VehicleTracker(coordinator=coordinator, vehicle=vehicle)
 
 
 class VehicleTracker(VehicleEntity[EnodeVehiclesCoordinator], TrackerEntity):
     """Representation of a vehicle's location."""
 
+    vehicle_fields = frozenset({"location"})
+
     entity_description = TrackerEntityDescription(
         key="location",
         translation_key="location",
@@ -65,7 +64,7 @@ class VehicleTracker(VehicleEntity[EnodeVehiclesCoordinator], TrackerEntity):
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, str | None] | None:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes of the vehicle."""
         if vehicle := self.vehicle:
             last_updated = (
@@ -76,5 +75,6 @@ class VehicleTracker(VehicleEntity[EnodeVehiclesCoordinator], TrackerEntity):
             return {
                 "location_id": vehicle.location.id,
                 "last_updated": last_updated,
+                "stale": self.coordinator.stale,
             }
         return None
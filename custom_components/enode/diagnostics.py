@@ -0,0 +1,43 @@
+"""Diagnostics support for the Enode integration."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_WEBHOOK_SECRET
+from .coordinator import EnodeConfigEntry
+
+TO_REDACT = {
+    "access_token",
+    "refresh_token",
+    "token",
+    CONF_WEBHOOK_SECRET,
+    "vin",
+    "latitude",
+    "longitude",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: EnodeConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinators = entry.runtime_data
+    vehicles = (coordinators.vehicles.data or {}).values()
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "client": coordinators.client.diagnostics(),
+        "stale": coordinators.stale,
+        "skipped_writes": coordinators.vehicles.skipped_writes,
+        "outdated_updates": coordinators.vehicles.outdated,
+        "webhooks": coordinators.webhooks.as_dict() if coordinators.webhooks else None,
+        "polling": {
+            **coordinators.polling.as_dict(),
+            "update_interval": str(coordinators.vehicles.update_interval),
+        },
+        "vehicles": [
+            async_redact_data(vehicle.model_dump(mode="json"), TO_REDACT)
+            for vehicle in vehicles
+        ],
+    }
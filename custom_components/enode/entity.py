@@ -1,6 +1,13 @@
 """Enode entity module."""
 
-from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -8,8 +15,69 @@ from homeassistant.helpers.update_coordinator import (
 
 from .api import EnodeClient
 from .const import DOMAIN
+from .coordinator import EnodeConfigEntry, EnodeCoordinators
 from .models import Vehicle
 
+type VehicleEntitiesFactory = Callable[[EnodeCoordinators, Vehicle], Iterable[Entity]]
+
+
+@callback
+def async_add_vehicle_entities(
+    entry: EnodeConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    factory: VehicleEntitiesFactory,
+) -> None:
+    """Add the entities of each vehicle once its data is available.
+
+    Entities are added for the vehicles already known, then for vehicles
+    appearing in later coordinator updates, so platform setup does not have
+    to wait for the first refresh and linked vehicles need no reload. Only
+    the vehicles that changed are looked at, unless the changes are unknown.
+    A vehicle that reappears after being removed gets its entities again
+    only if its device, and with it the entities, was removed meanwhile.
+    """
+    coordinators = entry.runtime_data
+    added: set[str] = set()
+    removed: set[str] = set()
+
+    @callback
+    def add_new_vehicles() -> None:
+        vehicles = coordinators.vehicles.data or {}
+        changed = coordinators.vehicles.async_changed_vehicles()
+        new: list[Vehicle] = []
+        for vehicle_id in vehicles if changed is None else changed:
+            if (vehicle := vehicles.get(vehicle_id)) is None:
+                if vehicle_id in added:
+                    removed.add(vehicle_id)
+                continue
+            if vehicle_id in removed:
+                removed.discard(vehicle_id)
+                if _vehicle_device_removed(coordinators.hass, entry, vehicle_id):
+                    added.discard(vehicle_id)
+            if vehicle_id not in added:
+                new.append(vehicle)
+        if changed is None:
+            removed.update(added.difference(vehicles))
+        if not new:
+            return
+        added.update(vehicle.id for vehicle in new)
+        async_add_entities(
+            entity for vehicle in new for entity in factory(coordinators, vehicle)
+        )
+
+    add_new_vehicles()
+    entry.async_on_unload(coordinators.vehicles.async_add_listener(add_new_vehicles))
+
+
+@callback
+def _vehicle_device_removed(
+    hass: HomeAssistant, entry: EnodeConfigEntry, vehicle_id: str
+) -> bool:
+    """Return True if the device of a vehicle was removed from the entry."""
+    registry = dr.async_get(hass)
+    device = registry.async_get_device(identifiers={(DOMAIN, vehicle_id)})
+    return device is None or entry.entry_id not in device.config_entries
+
 
 def _get_vehicle_device_info(
     vehicle: Vehicle,
@@ -32,12 +100,49 @@ def _get_vehicle_device_info(
     return DeviceInfo(identifiers=indentifiers)
 
 
+def _get_service_device_info(entry_id: str) -> DeviceInfo:
+    """Get device info for the Enode API service."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name="Enode",
+        manufacturer="Enode",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+
+class ClientEntity[_DataUpdateCoordinatorT: DataUpdateCoordinator](
+    CoordinatorEntity[_DataUpdateCoordinatorT]
+):
+    """Base class for entities describing the API client itself."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: _DataUpdateCoordinatorT,
+        client: EnodeClient,
+        entry_id: str,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the client entity."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self.client = client
+        self.device_info = _get_service_device_info(entry_id)
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+
+
 class VehicleEntity[_DataUpdateCoordinatorT: DataUpdateCoordinator](
     CoordinatorEntity[_DataUpdateCoordinatorT]
 ):
-    """Base class for vehicle entities."""
+    """Base class for vehicle entities.
+
+    Subclasses list the vehicle fields their state is derived from, so that
+    coordinator updates leaving those fields unchanged skip the state write.
+    """
 
     _attr_has_entity_name = True
+    vehicle_fields: frozenset[str] = frozenset()
 
     def __init__(
         self,
@@ -47,7 +152,7 @@ class VehicleEntity[_DataUpdateCoordinatorT: DataUpdateCoordinator](
         description: EntityDescription | None = None,
     ) -> None:
         """Initialize the vehicle entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=vehicle.id)
         if description is not None:
             self.entity_description = description
         self.vehicle_id = vehicle.id
@@ -59,13 +164,23 @@ class VehicleEntity[_DataUpdateCoordinatorT: DataUpdateCoordinator](
             "user_id": vehicle.user_id,
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if the fields backing it changed."""
+        if self.coordinator.async_vehicle_changed(
+            self.vehicle_id, self.vehicle_fields | {"is_reachable"}
+        ):
+            super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes, flagging data served while stale."""
+        return {**self._attr_extra_state_attributes, "stale": self.coordinator.stale}
+
     @property
     def vehicle(self) -> Vehicle | None:
         """Return the vehicle object."""
-        for vehicle in self.coordinator.data:
-            if vehicle.id == self.vehicle_id:
-                return vehicle
-        return None
+        return self.coordinator.data.get(self.vehicle_id)
 
     @property
     def available(self) -> bool:
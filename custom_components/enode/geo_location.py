@@ -1,6 +1,7 @@
 """Geo Location platform for Enode integration."""
 
 from collections.abc import Generator
+from typing import Any
 
 from homeassistant.components.geo_location import GeolocationEvent
 from homeassistant.core import HomeAssistant
@@ -9,7 +10,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import LOGGER, STATE_REACHABLE, STATE_UNREACHABLE
 from .coordinator import EnodeConfigEntry, EnodeCoordinators, EnodeVehiclesCoordinator
-from .entity import VehicleEntity
+from .entity import VehicleEntity, async_add_vehicle_entities
+from .models import Vehicle
 
 
 async def async_setup_entry(
@@ -18,30 +20,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enode sensor platform."""
-    async_add_entities(_generate_sensors(config_entry.runtime_data))
-
-
-def _generate_sensors(
-    coordinator: EnodeCoordinators,
-) -> Generator[GeolocationEvent]:
-    """Generate Enode sensors."""
-    yield from _generate_vehicle_sensors(coordinator.vehicles)
+    async_add_vehicle_entities(
+        config_entry, async_add_entities, _generate_vehicle_sensors
+    )
 
 
 def _generate_vehicle_sensors(
-    coordinator: EnodeVehiclesCoordinator,
+    coordinators: EnodeCoordinators, vehicle: Vehicle
 ) -> Generator[GeolocationEvent]:
-    """Generate sensors for vehicles."""
-    for vehicle in coordinator.data or []:
-        LOGGER.debug("Generating sensors for vehicle %s", vehicle.id)
-        if vehicle.capabilities.location.is_capable:
-            LOGGER.debug("Vehicle %s supports location", vehicle.id)
-            yield VehicleGeolocation(coordinator=coordinator, vehicle=vehicle)
+    """Generate sensors for a vehicle."""
+    coordinator = coordinators.vehicles
+    LOGGER.debug("Generating sensors for vehicle %s", vehicle.id)
+    if vehicle.capabilities.location.is_capable:
+        LOGGER.debug("Vehicle %s supports location", vehicle.id)
+        yield VehicleGeolocation(coordinator=coordinator, vehicle=vehicle)
 
 
 class VehicleGeolocation(VehicleEntity[EnodeVehiclesCoordinator], GeolocationEvent):
     """Representation of a vehicle's geolocation."""
 
+    vehicle_fields = frozenset({"location", "vendor"})
+
     entity_description = EntityDescription(
         key="location",
         translation_key="location",
@@ -78,7 +77,7 @@ class VehicleGeolocation(VehicleEntity[EnodeVehiclesCoordinator], GeolocationEve
         return None
 
     @property
-    def extra_state_attributes(self) -> dict[str, str | None] | None:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes of the vehicle."""
         if vehicle := self.vehicle:
             last_updated = (
@@ -89,5 +88,6 @@ class VehicleGeolocation(VehicleEntity[EnodeVehiclesCoordinator], GeolocationEve
             return {
                 "location_id": vehicle.location.id,
                 "last_updated": last_updated,
+                "stale": self.coordinator.stale,
             }
         return None
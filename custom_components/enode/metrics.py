@@ -0,0 +1,167 @@
+"""Request instrumentation for the Enode API client."""
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from statistics import fmean
+import time
+from typing import Any
+
+from .const import METRICS_WINDOW
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    return ordered[round(percent / 100 * (len(ordered) - 1))]
+
+
+class Histogram:
+    """Rolling window of samples with percentile summaries."""
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Initialize the histogram."""
+        self._samples: deque[float] = deque(maxlen=size)
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self._samples.append(value)
+        self.count += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given percentile of the samples in the window."""
+        if not self._samples:
+            return None
+        return _percentile(sorted(self._samples), percent)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the samples in the window."""
+        if not self._samples:
+            return {"count": self.count}
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "mean": round(fmean(ordered), 6),
+            "p50": round(_percentile(ordered, 50), 6),
+            "p95": round(_percentile(ordered, 95), 6),
+            "p99": round(_percentile(ordered, 99), 6),
+            "max": round(ordered[-1], 6),
+        }
+
+
+@dataclass
+class RequestTiming:
+    """Timing of the attempt that produced a response.
+
+    The attempt starts once the rate limiter has let it through, so time
+    spent queueing or backing off between retries is not counted as API
+    latency. Queueing is measured separately by the rate limiter.
+    """
+
+    started: float = 0.0
+    time_to_first_byte: float = 0.0
+
+    def start(self) -> None:
+        """Mark the start of an attempt."""
+        self.started = time.perf_counter()
+        self.time_to_first_byte = 0.0
+
+    def first_byte(self) -> None:
+        """Mark the arrival of the response of the attempt."""
+        self.time_to_first_byte = time.perf_counter() - self.started
+
+    def elapsed(self) -> float:
+        """Return the time since the attempt started."""
+        return time.perf_counter() - self.started
+
+
+@dataclass
+class EndpointMetrics:
+    """Metrics for a single endpoint and method."""
+
+    size: int = METRICS_WINDOW
+    statuses: Counter[int] = field(default_factory=Counter)
+    errors: int = 0
+    bytes: Histogram = field(init=False)
+    time_to_first_byte: Histogram = field(init=False)
+    total_time: Histogram = field(init=False)
+    validation_time: Histogram = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the histograms."""
+        self.bytes = Histogram(self.size)
+        self.time_to_first_byte = Histogram(self.size)
+        self.total_time = Histogram(self.size)
+        self.validation_time = Histogram(self.size)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "statuses": dict(self.statuses),
+            "errors": self.errors,
+            "bytes": self.bytes.as_dict(),
+            "time_to_first_byte": self.time_to_first_byte.as_dict(),
+            "total_time": self.total_time.as_dict(),
+            "validation_time": self.validation_time.as_dict(),
+        }
+
+
+class RequestMetrics:
+    """Rolling per-endpoint request metrics.
+
+    Endpoints are keyed by method and path template, such as
+    ``GET /users/{user_id}/vehicles``, so that requests for different
+    vehicles or users are aggregated together.
+    """
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Initialize the request metrics."""
+        self.size = size
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.total_time = Histogram(size)
+        self.validation_time = Histogram(size)
+
+    def endpoint(self, method: str, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint."""
+        key = f"{method} {endpoint}"
+        if (metrics := self.endpoints.get(key)) is None:
+            metrics = self.endpoints[key] = EndpointMetrics(self.size)
+        return metrics
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        size: int,
+        time_to_first_byte: float,
+        total_time: float,
+        validation_time: float | None = None,
+    ) -> None:
+        """Record a completed request."""
+        metrics = self.endpoint(method, endpoint)
+        metrics.statuses[status] += 1
+        metrics.bytes.add(size)
+        metrics.time_to_first_byte.add(time_to_first_byte)
+        metrics.total_time.add(total_time)
+        self.total_time.add(total_time)
+        if validation_time is not None:
+            metrics.validation_time.add(validation_time)
+            self.validation_time.add(validation_time)
+
+    def record_error(self, method: str, endpoint: str) -> None:
+        """Record a request that failed without a response."""
+        self.endpoint(method, endpoint).errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "total_time": self.total_time.as_dict(),
+            "validation_time": self.validation_time.as_dict(),
+            "endpoints": {
+                key: metrics.as_dict() for key, metrics in self.endpoints.items()
+            },
+        }
@@ -2,13 +2,20 @@
 
 from datetime import datetime, time
 from enum import StrEnum
-from typing import Annotated, Literal, TypeVar
+from functools import cache
+from typing import Annotated, Any, Literal, TypeVar
 
-from pydantic import BaseModel, Field, RootModel
+from pydantic import BaseModel, Field, RootModel, TypeAdapter
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@cache
+def type_adapter(type_: Any) -> TypeAdapter[Any]:
+    """Return a cached type adapter for validating a type."""
+    return TypeAdapter(type_)
+
+
 class Language(StrEnum):
     """Language options for Enode."""
 
@@ -259,6 +266,9 @@ class Vehicle(BaseModel):
     scopes: list[str]
 
 
+VehiclesResponse = Response[list[Vehicle]]
+
+
 class ActionState(StrEnum):
     """Action state enumeration."""
 
@@ -422,6 +432,50 @@ class WebhookEvents(RootModel):
         return self.root[item]
 
 
+class WebhookUnhandledEvent(BaseModel):
+    """Webhook event without a handler, ignoring everything but its type."""
+
+    event: Literal[
+        "user:vehicle:smart-charging-status-updated",
+        "user:charge-action:updated",
+        "user:vendor-action:updated",
+        "user:schedule:execution-updated",
+        "user:charger:discovered",
+        "user:charger:updated",
+        "user:charger:deleted",
+        "user:hvac:discovered",
+        "user:hvac:updated",
+        "user:hvac:deleted",
+        "user:inverter:discovered",
+        "user:inverter:updated",
+        "user:inverter:deleted",
+        "user:inverter:statistics-updated",
+        "user:battery:discovered",
+        "user:battery:updated",
+        "user:battery:deleted",
+        "user:meter:discovered",
+        "user:meter:updated",
+        "user:meter:deleted",
+    ]
+
+
+class WebhookPayload(RootModel):
+    """Webhook payload model, validating only the events that have a handler."""
+
+    root: list[
+        Annotated[
+            WebhookSystemHeartbeatEvent
+            | WebhookTestEvent
+            | WebhookUserVehicleDiscoveredEvent
+            | WebhookUserVehicleUpdatedEvent
+            | WebhookUserVehicleDeletedEvent
+            | WebhookUserCredentialsInvalidatedEvent
+            | WebhookUnhandledEvent,
+            Field(discriminator="event"),
+        ]
+    ]
+
+
 class WebhookTestEndpoint(BaseModel):
     """Webhook test endpoint response model."""
 
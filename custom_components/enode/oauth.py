@@ -0,0 +1,149 @@
+"""Client credentials tokens shared between config entries."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.config_entry_oauth2_flow import CLOCK_OUT_OF_SYNC_MAX_SEC
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_SHARED_TOKENS, LOGGER, TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_RETRY
+
+type TokenRequest = Callable[[], Awaitable[dict[str, Any]]]
+type TokenListener = Callable[[dict[str, Any]], None]
+
+
+class SharedToken:
+    """Client credentials token shared by the entries using the same credentials.
+
+    The token is refreshed in the background ahead of its expiry while any
+    listener is registered, so requests do not wait on a token round trip.
+    Concurrent refreshes are coalesced into a single token request.
+    """
+
+    def __init__(self, hass: HomeAssistant, request_token: TokenRequest) -> None:
+        """Initialize the shared token."""
+        self.hass = hass
+        self.request_token = request_token
+        self.token: dict[str, Any] | None = None
+        self.refreshes = 0
+        self._refresh: asyncio.Future[dict[str, Any]] | None = None
+        self._listeners: list[TokenListener] = []
+        self._cancel_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def valid(self) -> bool:
+        """Return True if the token is present and not about to expire."""
+        return (
+            self.token is not None
+            and self.token["expires_at"] > time.time() + CLOCK_OUT_OF_SYNC_MAX_SEC
+        )
+
+    @callback
+    def async_seed(self, token: dict[str, Any]) -> None:
+        """Adopt an existing token if it outlives the current one."""
+        if self.token is None or token["expires_at"] > self.token["expires_at"]:
+            self.token = token
+            self._schedule_refresh()
+
+    @callback
+    def async_add_listener(self, listener: TokenListener) -> CALLBACK_TYPE:
+        """Listen for new tokens, keeping the token refreshed meanwhile."""
+        self._listeners.append(listener)
+        self._schedule_refresh()
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+            if not self._listeners:
+                self._cancel_refresh()
+
+        return remove_listener
+
+    async def async_get_token(self) -> dict[str, Any]:
+        """Return a valid token, requesting a new one when needed."""
+        if self.valid:
+            return self.token
+        return await self.async_refresh()
+
+    async def async_refresh(self) -> dict[str, Any]:
+        """Request a new token, joining a refresh already in progress."""
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Future[dict[str, Any]]:
+        """Start a refresh unless one is already in progress."""
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._async_refresh())
+            self._refresh.add_done_callback(self._refresh_done)
+        return self._refresh
+
+    async def _async_refresh(self) -> dict[str, Any]:
+        """Request a new token and notify the listeners."""
+        LOGGER.debug("Refreshing shared access token")
+        token = await self.request_token()
+        token["expires_in"] = int(token["expires_in"])
+        token["expires_at"] = time.time() + token["expires_in"]
+        self.token = token
+        self.refreshes += 1
+        self._schedule_refresh()
+        for listener in list(self._listeners):
+            listener(token)
+        return token
+
+    def _refresh_done(self, refresh: asyncio.Future[dict[str, Any]]) -> None:
+        """Forget a completed refresh, retrying later if it failed."""
+        if self._refresh is refresh:
+            self._refresh = None
+        if refresh.cancelled() or (err := refresh.exception()) is None:
+            return
+        LOGGER.warning("Failed to refresh access token: %s", err)
+        self._schedule_refresh(TOKEN_REFRESH_RETRY.total_seconds())
+
+    def _refresh_delay(self) -> float | None:
+        """Return the number of seconds until the token should be refreshed."""
+        if self.token is None:
+            return None
+        lifetime = self.token.get("expires_in", 0)
+        margin = min(TOKEN_REFRESH_MARGIN.total_seconds(), lifetime / 2)
+        margin = max(margin, CLOCK_OUT_OF_SYNC_MAX_SEC)
+        return max(self.token["expires_at"] - margin - time.time(), 0.0)
+
+    def _schedule_refresh(self, delay: float | None = None) -> None:
+        """Schedule a background refresh while there are listeners."""
+        self._cancel_refresh()
+        if not self._listeners:
+            return
+        if delay is None and (delay := self._refresh_delay()) is None:
+            return
+        self._cancel_timer = async_call_later(self.hass, delay, self._refresh_due)
+
+    def _cancel_refresh(self) -> None:
+        """Cancel the scheduled background refresh."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+    @callback
+    def _refresh_due(self, _now: datetime) -> None:
+        """Start the scheduled background refresh."""
+        self._cancel_timer = None
+        self._start_refresh()
+
+
+@callback
+def async_get_shared_token(
+    hass: HomeAssistant, token_url: str, client_id: str, request_token: TokenRequest
+) -> SharedToken:
+    """Return the token shared by the entries using the given client."""
+    tokens: dict[tuple[str, str], SharedToken] = hass.data.setdefault(
+        DATA_SHARED_TOKENS, {}
+    )
+    if (shared := tokens.get((token_url, client_id))) is None:
+        shared = tokens[token_url, client_id] = SharedToken(hass, request_token)
+    else:
+        # Pick up a client secret changed since the token was first shared
+        shared.request_token = request_token
+    return shared
@@ -0,0 +1,82 @@
+"""Adaptive polling interval for the Enode vehicles coordinator."""
+
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import time
+from typing import Any
+
+from .const import (
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_CHARGING,
+    UPDATE_INTERVAL_WEBHOOKS_HEALTHY,
+    WEBHOOK_HEALTH_TIMEOUT,
+)
+from .models import PowerDeliveryState, Vehicle
+
+
+class PollingSchedule:
+    """Choose how often to poll based on webhook health and charging activity.
+
+    Webhooks are healthy while any webhook, heartbeats included, arrived
+    within ``health_timeout``. Polling then only acts as a safety net and
+    backs off to ``healthy_interval``. When webhooks go quiet it falls back
+    to ``interval``, and it tightens to ``charging_interval`` while any
+    vehicle is charging.
+    """
+
+    def __init__(
+        self,
+        interval: timedelta = UPDATE_INTERVAL,
+        healthy_interval: timedelta = UPDATE_INTERVAL_WEBHOOKS_HEALTHY,
+        charging_interval: timedelta = UPDATE_INTERVAL_CHARGING,
+        health_timeout: timedelta = WEBHOOK_HEALTH_TIMEOUT,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the polling schedule."""
+        self._time = time_func
+        self.interval = interval
+        self.healthy_interval = healthy_interval
+        self.charging_interval = charging_interval
+        self.health_timeout = health_timeout.total_seconds()
+        self.webhooks = 0
+        self.charging = False
+        self._last_webhook: float | None = None
+
+    @property
+    def webhooks_healthy(self) -> bool:
+        """Return True if a webhook arrived recently."""
+        return (
+            self._last_webhook is not None
+            and self._time() - self._last_webhook < self.health_timeout
+        )
+
+    @property
+    def webhooks_healthy_for(self) -> float:
+        """Return the seconds until webhooks are no longer healthy."""
+        if self._last_webhook is None:
+            return 0.0
+        return max(0.0, self._last_webhook + self.health_timeout - self._time())
+
+    def record_webhook(self) -> None:
+        """Record the arrival of a webhook."""
+        self._last_webhook = self._time()
+        self.webhooks += 1
+
+    def next_interval(self, vehicles: Iterable[Vehicle]) -> timedelta:
+        """Return the interval until the next poll of the given vehicles."""
+        self.charging = any(
+            vehicle.charge_state.power_delivery_state is PowerDeliveryState.CHARGING
+            for vehicle in vehicles
+        )
+        interval = self.healthy_interval if self.webhooks_healthy else self.interval
+        if self.charging:
+            interval = min(interval, self.charging_interval)
+        return interval
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the schedule state as a dictionary."""
+        return {
+            "webhooks": self.webhooks,
+            "webhooks_healthy": self.webhooks_healthy,
+            "charging": self.charging,
+        }
@@ -0,0 +1,220 @@
+"""Rate limiting for the Enode API client."""
+
+import asyncio
+from collections.abc import Callable, Mapping
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+import heapq
+from itertools import count
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    LOGGER,
+    RATE_LIMIT_INTERACTIVE_RESERVE,
+    RATE_LIMIT_LOW_WATERMARK,
+    RATE_LIMIT_PERIOD,
+    RATE_LIMIT_REQUESTS,
+)
+from .metrics import Histogram
+
+HEADER_LIMIT = "X-RateLimit-Limit"
+HEADER_REMAINING = "X-RateLimit-Remaining"
+HEADER_RESET = "X-RateLimit-Reset"
+HEADER_RETRY_AFTER = "Retry-After"
+
+
+class RequestPriority(IntEnum):
+    """Priority of a request waiting for the rate limiter, highest first."""
+
+    INTERACTIVE = 0
+    REFRESH = 1
+    BACKGROUND = 2
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    """Return a numeric header value, if present and valid."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Return the number of seconds requested by a Retry-After header."""
+    if (seconds := _header_float(headers, HEADER_RETRY_AFTER)) is not None:
+        return max(seconds, 0.0)
+    value = headers.get(HEADER_RETRY_AFTER)
+    if not isinstance(value, str):
+        return None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - dt_util.utcnow()).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Token bucket tracking the request budget of the Enode API.
+
+    The bucket refills at ``requests / period`` and is kept in step with the
+    rate limit headers returned by the API. Callers wait in
+    :meth:`acquire` until a token is available rather than failing.
+
+    Waiting callers are served in priority order, and a share of the budget
+    is reserved for interactive requests so that a user's command is not
+    stuck behind background polling.
+    """
+
+    def __init__(
+        self,
+        requests: int = RATE_LIMIT_REQUESTS,
+        period: timedelta = RATE_LIMIT_PERIOD,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the rate limiter."""
+        self._time = time_func
+        self._waiters: list[tuple[RequestPriority, int]] = []
+        self._sequence = count()
+        self._changed = asyncio.Event()
+        self.wait_time = {priority: Histogram() for priority in RequestPriority}
+        self.capacity = float(requests)
+        self.period = period.total_seconds()
+        self._tokens = self.capacity
+        self._updated_at = time_func()
+        self._blocked_until = 0.0
+        self._reset_at: float | None = None
+
+    @property
+    def rate(self) -> float:
+        """Return the number of tokens added per second."""
+        return self.capacity / self.period
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of requests that can be made right now."""
+        self._refill()
+        if self._time() < self._blocked_until:
+            return 0
+        return int(self._tokens)
+
+    @property
+    def reset_after(self) -> timedelta:
+        """Return the time until the budget is fully restored."""
+        self._refill()
+        now = self._time()
+        if self._reset_at is not None:
+            seconds = self._reset_at - now
+        else:
+            seconds = (self.capacity - self._tokens) / self.rate
+        return timedelta(seconds=max(seconds, self._blocked_until - now, 0.0))
+
+    @property
+    def is_low(self) -> bool:
+        """Return True when the remaining budget is below the low watermark."""
+        return self.remaining < self.capacity * RATE_LIMIT_LOW_WATERMARK
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill.
+
+        While the API has announced a reset time the budget is restored in
+        one go at that time instead of continuously.
+        """
+        now = self._time()
+        if self._reset_at is None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        elif now >= self._reset_at:
+            self._tokens = self.capacity
+            self._reset_at = None
+        self._updated_at = now
+
+    def _reserve(self, priority: RequestPriority) -> int:
+        """Return the number of tokens the priority must leave in the bucket."""
+        if priority is RequestPriority.INTERACTIVE:
+            return 0
+        return int(self.capacity * RATE_LIMIT_INTERACTIVE_RESERVE)
+
+    def _delay(self, priority: RequestPriority) -> float:
+        """Return how long to wait before a token can be taken."""
+        self._refill()
+        now = self._time()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        needed = 1 + self._reserve(priority)
+        if self._tokens >= needed:
+            return 0.0
+        if self._reset_at is not None:
+            return self._reset_at - now
+        return (needed - self._tokens) / self.rate
+
+    def _notify(self) -> None:
+        """Wake the waiting callers to check whether it is their turn."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.BACKGROUND
+    ) -> None:
+        """Wait for and take a token from the bucket.
+
+        Only the highest priority waiter takes tokens, so a newly arrived
+        interactive request overtakes queued background requests.
+        """
+        waiter = (priority, next(self._sequence))
+        heapq.heappush(self._waiters, waiter)
+        started = self._time()
+        try:
+            while True:
+                changed = self._changed
+                if self._waiters[0] != waiter:
+                    await changed.wait()
+                elif (delay := self._delay(priority)) > 0:
+                    LOGGER.debug(
+                        "Rate limited, waiting %.2f seconds (%s)",
+                        delay,
+                        priority.name.lower(),
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    break
+        finally:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            self._notify()
+        self._tokens -= 1
+        self.wait_time[priority].add(self._time() - started)
+
+    def block(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        self._blocked_until = max(self._blocked_until, self._time() + seconds)
+        self._tokens = min(self._tokens, 0.0)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Synchronise the bucket with the rate limit headers of a response."""
+        if (limit := _header_float(headers, HEADER_LIMIT)) is not None and limit > 0:
+            self.capacity = limit
+        if (remaining := _header_float(headers, HEADER_REMAINING)) is not None:
+            self._refill()
+            self._tokens = min(self._tokens, remaining)
+        if (reset := _header_float(headers, HEADER_RESET)) is not None:
+            self._reset_at = self._time() + reset
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the rate limiter as a dictionary."""
+        return {
+            "capacity": self.capacity,
+            "remaining": self.remaining,
+            "reset_after": self.reset_after.total_seconds(),
+            "waiting": len(self._waiters),
+            "wait_time": {
+                priority.name.lower(): histogram.as_dict()
+                for priority, histogram in self.wait_time.items()
+            },
+        }
@@ -0,0 +1,66 @@
+"""Retry policy for transient Enode API failures."""
+
+from dataclasses import dataclass
+from datetime import timedelta
+import random
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from .const import RETRY_BASE_DELAY, RETRY_DEADLINE, RETRY_MAX_ATTEMPTS, RETRY_MAX_DELAY
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+RETRY_EXCEPTIONS = (ClientConnectionError, ClientPayloadError, TimeoutError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a deadline."""
+
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+    base_delay: timedelta = RETRY_BASE_DELAY
+    max_delay: timedelta = RETRY_MAX_DELAY
+    deadline: timedelta = RETRY_DEADLINE
+    jitter: bool = True
+
+    def delay(self, attempt: int) -> float:
+        """Return the number of seconds to wait after the given attempt."""
+        delay = min(
+            self.max_delay.total_seconds(),
+            self.base_delay.total_seconds() * 2 ** (attempt - 1),
+        )
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def should_retry(self, attempt: int, elapsed: float, delay: float) -> bool:
+        """Return True if another attempt fits within the policy."""
+        return (
+            attempt < self.max_attempts
+            and elapsed + delay < self.deadline.total_seconds()
+        )
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+@dataclass
+class RetryStats:
+    """Counters describing the cost of retried requests."""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    retry_delay: float = 0.0
+    retry_latency: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the statistics as a dictionary."""
+        return {
+            "requests": self.requests,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "failures": self.failures,
+            "retry_delay": round(self.retry_delay, 3),
+            "retry_latency": round(self.retry_latency, 3),
+        }
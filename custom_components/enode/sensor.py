@@ -1,7 +1,8 @@
 """Sensor platform for Enode integration."""
 
 from abc import abstractmethod
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
 from datetime import datetime, time
 from typing import Any
 
@@ -13,6 +14,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfElectricCurrent,
     UnitOfEnergy,
     UnitOfLength,
@@ -20,11 +22,14 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 
+from .api import EnodeClient
+from .circuit import CircuitState
 from .const import LOGGER
 from .coordinator import EnodeConfigEntry, EnodeCoordinators, EnodeVehiclesCoordinator
-from .entity import VehicleEntity
-from .models import ChargeState, PowerDeliveryState
+from .entity import ClientEntity, VehicleEntity, async_add_vehicle_entities
+from .models import ChargeState, PowerDeliveryState, Vehicle
 
 CHARGE_STATE_DESCRIPTIONS = [
     SensorEntityDescription(
@@ -110,51 +115,141 @@ SMART_CHARGING_DESCRIPTIONS = [
 ]
 
 
+@dataclass(frozen=True, kw_only=True)
+class ClientSensorEntityDescription(SensorEntityDescription):
+    """Describes an Enode API client sensor."""
+
+    value_fn: Callable[[EnodeClient], StateType]
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds."""
+    return None if seconds is None else seconds * 1000
+
+
+CLIENT_DESCRIPTIONS = [
+    ClientSensorEntityDescription(
+        key="api_latency",
+        translation_key="api_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: _milliseconds(client.metrics.total_time.percentile(95)),
+    ),
+    ClientSensorEntityDescription(
+        key="api_validation_time",
+        translation_key="api_validation_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: _milliseconds(
+            client.metrics.validation_time.percentile(95)
+        ),
+    ),
+    ClientSensorEntityDescription(
+        key="api_rate_limit_remaining",
+        translation_key="api_rate_limit_remaining",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: client.rate_limiter.remaining,
+    ),
+    ClientSensorEntityDescription(
+        key="api_circuit_state",
+        translation_key="api_circuit_state",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in CircuitState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: client.circuit_breaker.state.value,
+    ),
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: EnodeConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enode sensor platform."""
-    async_add_entities(_generate_sensors(config_entry.runtime_data))
+    async_add_entities(
+        _generate_client_sensors(config_entry.runtime_data, config_entry.entry_id)
+    )
+    async_add_vehicle_entities(
+        config_entry, async_add_entities, _generate_vehicle_sensors
+    )
 
 
-def _generate_sensors(
+def _generate_client_sensors(
     coordinator: EnodeCoordinators,
+    entry_id: str,
 ) -> Generator[SensorEntity]:
-    """Generate Enode sensors."""
-    yield from _generate_vehicle_sensors(coordinator.vehicles)
+    """Generate diagnostic sensors for the API client."""
+    for description in CLIENT_DESCRIPTIONS:
+        yield ClientSensor(
+            coordinator=coordinator.vehicles,
+            client=coordinator.client,
+            entry_id=entry_id,
+            description=description,
+        )
 
 
 def _generate_vehicle_sensors(
-    coordinator: EnodeVehiclesCoordinator,
+    coordinators: EnodeCoordinators, vehicle: Vehicle
 ) -> Generator[SensorEntity]:
-    """Generate sensors for vehicles."""
-    for vehicle in coordinator.data or []:
-        LOGGER.debug("Generating sensors for vehicle %s", vehicle.id)
-        if vehicle.capabilities.charge_state.is_capable:
-            LOGGER.debug("Vehicle %s supports charge state", vehicle.id)
-            for description in CHARGE_STATE_DESCRIPTIONS:
-                yield VehicleChargeStateSensor(
-                    coordinator=coordinator, vehicle=vehicle, description=description
-                )
-        if vehicle.capabilities.odometer.is_capable:
-            LOGGER.debug("Vehicle %s supports odometer", vehicle.id)
-            for description in ODOMETER_DESCRIPTIONS:
-                yield VehicleOdometerSensor(
-                    coordinator=coordinator, vehicle=vehicle, description=description
-                )
-        if vehicle.capabilities.smart_charging.is_capable:
-            LOGGER.debug("Vehicle %s supports smart charging", vehicle.id)
-            for description in SMART_CHARGING_DESCRIPTIONS:
-                yield VehicleSmartChargingSensor(
-                    coordinator=coordinator, vehicle=vehicle, description=description
-                )
+    """Generate sensors for a vehicle."""
+    coordinator = coordinators.vehicles
+    LOGGER.debug("Generating sensors for vehicle %s", vehicle.id)
+    if vehicle.capabilities.charge_state.is_capable:
+        LOGGER.debug("Vehicle %s supports charge state", vehicle.id)
+        for description in CHARGE_STATE_DESCRIPTIONS:
+            yield VehicleChargeStateSensor(
+                coordinator=coordinator, vehicle=vehicle, description=description
+            )
+    if vehicle.capabilities.odometer.is_capable:
+        LOGGER.debug("Vehicle %s supports odometer", vehicle.id)
+        for description in ODOMETER_DESCRIPTIONS:
+            yield VehicleOdometerSensor(
+                coordinator=coordinator, vehicle=vehicle, description=description
+            )
+    if vehicle.capabilities.smart_charging.is_capable:
+        LOGGER.debug("Vehicle %s supports smart charging", vehicle.id)
+        for description in SMART_CHARGING_DESCRIPTIONS:
+            yield VehicleSmartChargingSensor(
+                coordinator=coordinator, vehicle=vehicle, description=description
+            )
+
+
+class ClientSensor(ClientEntity[EnodeVehiclesCoordinator], SensorEntity):
+    """Diagnostic sensor for the API client.
+
+    The value is refreshed whenever the vehicles coordinator updates.
+    """
+
+    entity_description: ClientSensorEntityDescription
+
+    @property
+    def available(self) -> bool:
+        """Return True, the client is always available."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.client)
 
 
 class VehicleSensor(VehicleEntity[EnodeVehiclesCoordinator], SensorEntity):
     """Sensor for vehicle data."""
 
+    vehicle_fields = frozenset({"last_seen"})
+
     @property
     def last_reset(self) -> datetime | None:
         """Return if the sensor supports last reset."""
@@ -178,6 +273,8 @@ class VehicleSensor(VehicleEntity[EnodeVehiclesCoordinator], SensorEntity):
 class VehicleChargeStateSensor(VehicleSensor):
     """Sensor for vehicle charge state."""
 
+    vehicle_fields = frozenset({"charge_state"})
+
     @property
     def charge_state(self) -> ChargeState | None:
         """Return the charge state."""
@@ -203,6 +300,8 @@ class VehicleChargeStateSensor(VehicleSensor):
 class VehicleOdometerSensor(VehicleSensor):
     """Sensor for vehicle odometer."""
 
+    vehicle_fields = frozenset({"odometer"})
+
     @property
     def _last_reset(self) -> datetime | None:
         """Return the last reset time."""
@@ -221,6 +320,8 @@ class VehicleOdometerSensor(VehicleSensor):
 class VehicleSmartChargingSensor(VehicleSensor):
     """Sensor for vehicle smart charging."""
 
+    vehicle_fields = VehicleSensor.vehicle_fields | {"smart_charging_policy"}
+
     @property
     def native_value(self) -> float | time | None:
         """Return the value of the sensor."""
@@ -0,0 +1,64 @@
+"""Persistent snapshot of the vehicles of a config entry."""
+
+from typing import Any, TypedDict
+
+from pydantic import ValidationError
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+from .models import Vehicle, type_adapter
+
+
+class SnapshotData(TypedDict):
+    """Stored snapshot data."""
+
+    vehicles: list[dict[str, Any]]
+
+
+class VehicleSnapshot:
+    """Last validated vehicles, stored to build entities before the API answers.
+
+    Vehicles are stored in their API form, leaving out unset values, so the
+    snapshot stays compact and validates with the same models as responses.
+    Saves are delayed, so consecutive updates are written once.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot."""
+        self._store: Store[SnapshotData] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.vehicles"
+        )
+
+    async def async_load(self) -> dict[str, Vehicle] | None:
+        """Return the stored vehicles, or None if there is no usable snapshot."""
+        if (data := await self._store.async_load()) is None:
+            return None
+        try:
+            vehicles = type_adapter(list[Vehicle]).validate_python(data["vehicles"])
+        except (KeyError, TypeError, ValidationError) as err:
+            LOGGER.warning("Ignoring invalid vehicle snapshot: %s", err)
+            return None
+        LOGGER.debug("Loaded %d vehicles from snapshot", len(vehicles))
+        return {vehicle.id: vehicle for vehicle in vehicles}
+
+    @callback
+    def async_schedule_save(self, vehicles: dict[str, Vehicle]) -> None:
+        """Save the vehicles after a delay, replacing a pending save."""
+        self._store.async_delay_save(
+            lambda: _serialize(vehicles), SNAPSHOT_SAVE_DELAY.total_seconds()
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the stored snapshot."""
+        await self._store.async_remove()
+
+
+def _serialize(vehicles: dict[str, Vehicle]) -> SnapshotData:
+    """Return the stored form of the vehicles."""
+    return {
+        "vehicles": type_adapter(list[Vehicle]).dump_python(
+            list(vehicles.values()), mode="json", by_alias=True, exclude_none=True
+        )
+    }
@@ -0,0 +1,131 @@
+"""Incremental splitting of JSON arrays in streamed responses."""
+
+import re
+
+_STRUCTURAL = re.compile(rb'["\[\]{},:]')
+_STRING = re.compile(rb'["\\]')
+
+
+class JsonArrayItems:
+    """Split the items of an array member of a JSON object as bytes arrive.
+
+    Feeding the raw body in chunks returns the encoded items of the array
+    under ``key`` as soon as each one is complete, so only the current item
+    has to be buffered. Everything else in the object is kept and returned by
+    :meth:`envelope`, with the array emptied, to be parsed once the body has
+    been read.
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        """Initialize the splitter."""
+        self._key = key.encode()
+        self._buffer = bytearray()
+        self._envelope = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start: int | None = None
+        self._last_string: bytes | None = None
+        self._expect_array = False
+        self._array_depth: int | None = None
+        self._item_start: int | None = None
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume a chunk of the body and return the items it completed."""
+        self._buffer += chunk
+        items: list[bytes] = []
+        pos: int | None = self._pos
+        while pos is not None:
+            self._pos = pos
+            if self._in_string:
+                pos = self._scan_string(pos)
+            else:
+                pos = self._scan_structure(pos, items)
+        self._compact()
+        return items
+
+    def _scan_string(self, pos: int) -> int | None:
+        """Find the end of the current string, or None if more bytes are needed."""
+        buffer = self._buffer
+        if (match := _STRING.search(buffer, pos)) is None:
+            return None
+        index = match.start()
+        if buffer[index] == 0x5C:  # backslash, skip the escaped byte
+            return index + 2
+        self._in_string = False
+        if self._string_start is not None:
+            self._last_string = bytes(buffer[self._string_start + 1 : index])
+            self._string_start = None
+        return index + 1
+
+    def _scan_structure(self, pos: int, items: list[bytes]) -> int | None:
+        """Handle the next structural byte, or return None if more are needed."""
+        buffer = self._buffer
+        if (match := _STRUCTURAL.search(buffer, pos)) is None:
+            return None
+        index = match.start()
+        pos = index + 1
+        char = buffer[index]
+        if char == 0x22:  # "
+            self._in_string = True
+            if self._depth == 1:
+                self._string_start = index
+        elif char == 0x3A:  # :
+            if self._depth == 1:
+                self._expect_array = self._last_string == self._key
+        elif char in b"[{":
+            self._open(char, pos)
+        elif char in b"]}":
+            if self._depth == self._array_depth and char == 0x5D:
+                pos = self._close_array(items, index)
+            self._depth -= 1
+        elif self._depth == self._array_depth:  # comma between items
+            self._append_item(items, index)
+            self._item_start = pos
+        return pos
+
+    def _open(self, char: int, pos: int) -> None:
+        """Enter an object or array, starting the items if it is the target."""
+        self._depth += 1
+        if char == 0x5B and self._depth == 2 and self._expect_array:
+            self._array_depth = self._depth
+            self._envelope += self._buffer[:pos]
+            self._item_start = pos
+        self._expect_array = False
+
+    def _close_array(self, items: list[bytes], index: int) -> int:
+        """Finish the array at the given index and return the position after it."""
+        self._append_item(items, index)
+        self._array_depth = None
+        # Keep the closing bracket for the envelope, dropping the items
+        del self._buffer[:index]
+        return 1
+
+    def _append_item(self, items: list[bytes], end: int) -> None:
+        """Add the item ending at the given index, unless it is empty."""
+        if item := bytes(self._buffer[self._item_start : end]).strip():
+            items.append(item)
+        self._item_start = None
+
+    def _compact(self) -> None:
+        """Drop the consumed part of the buffer, keeping any partial token."""
+        if self._array_depth is not None:
+            keep = self._item_start
+        elif self._string_start is not None:
+            keep = self._string_start
+            self._envelope += self._buffer[:keep]
+        else:
+            keep = min(self._pos, len(self._buffer))
+            self._envelope += self._buffer[:keep]
+        if not keep:
+            return
+        del self._buffer[:keep]
+        self._pos -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+        if self._item_start is not None:
+            self._item_start -= keep
+
+    def envelope(self) -> bytes:
+        """Return the object read so far, with the array emptied."""
+        return bytes(self._envelope + self._buffer)
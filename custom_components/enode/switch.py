@@ -9,12 +9,15 @@ from homeassistant.components.switch import (
     SwitchEntityDescription,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .api import EnodeClient, EnodeError
-from .const import ACTION_START, ACTION_STOP, LOGGER
+from .api import EnodeError
+from .circuit import CircuitOpenError
+from .const import ACTION_START, ACTION_STOP, DOMAIN, LOGGER
 from .coordinator import EnodeConfigEntry, EnodeCoordinators, EnodeVehiclesCoordinator
-from .entity import VehicleEntity
+from .entity import VehicleEntity, async_add_vehicle_entities
+from .models import Vehicle
 
 
 async def async_setup_entry(
@@ -23,35 +26,32 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Enode binary sensor platform."""
-    async_add_entities(_generate_switches(config_entry.runtime_data))
-
-
-def _generate_switches(
-    coordinator: EnodeCoordinators,
-) -> Generator[SwitchEntity]:
-    """Generate Enode switches."""
-    yield from _generate_vehicle_switches(coordinator.vehicles, coordinator.client)
+    async_add_vehicle_entities(
+        config_entry, async_add_entities, _generate_vehicle_switches
+    )
 
 
 def _generate_vehicle_switches(
-    coordinator: EnodeVehiclesCoordinator,
-    client: EnodeClient,
+    coordinators: EnodeCoordinators, vehicle: Vehicle
 ) -> Generator[SwitchEntity]:
-    """Generate vehicle switches."""
-    for vehicle in coordinator.data or []:
-        if (
-            vehicle.capabilities.start_charging.is_capable
-            or vehicle.capabilities.stop_charging.is_capable
-        ):
-            LOGGER.debug("Adding vehicle charge switch for %s", vehicle.id)
-            yield VehicleChargeSwitch(
-                coordinator=coordinator, client=client, vehicle=vehicle
-            )
+    """Generate switches for a vehicle."""
+    if (
+        vehicle.capabilities.start_charging.is_capable
+        or vehicle.capabilities.stop_charging.is_capable
+    ):
+        LOGGER.debug("Adding vehicle charge switch for %s", vehicle.id)
+        yield VehicleChargeSwitch(
+            coordinator=coordinators.vehicles,
+            client=coordinators.client,
+            vehicle=vehicle,
+        )
 
 
 class VehicleChargeSwitch(VehicleEntity[EnodeVehiclesCoordinator], SwitchEntity):
     """Switch for vehicle charge state."""
 
+    vehicle_fields = frozenset({"charge_state"})
+
     entity_description = SwitchEntityDescription(
         key="is_charging",
         translation_key="charge_state_is_charging",
@@ -84,6 +84,12 @@ class VehicleChargeSwitch(VehicleEntity[EnodeVehiclesCoordinator], SwitchEntity)
             await self.client.control_charging(
                 vehicle_id=self.vehicle_id, action=action
             )
+        except CircuitOpenError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="api_unavailable",
+                translation_placeholders={"retry_after": f"{err.retry_after:.0f}"},
+            ) from err
         except EnodeError as err:
             LOGGER.error(
                 "Failed to control charging for vehicle %s: %s - %s",
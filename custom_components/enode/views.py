@@ -5,16 +5,16 @@ from hashlib import sha1
 import hmac
 
 from aiohttp import web, web_response
-from aiohttp.web_exceptions import HTTPBadRequest, HTTPNotFound
+from aiohttp.hdrs import RETRY_AFTER
+from aiohttp.web_exceptions import HTTPBadRequest, HTTPNotFound, HTTPServiceUnavailable
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import UnknownFlow
 
-from .const import CONF_WEBHOOK_SECRET, LOGGER
-from .models import WebhookEvents
-from .webhook import process_webhook_events
+from .const import CONF_WEBHOOK_SECRET, LOGGER, WEBHOOK_RETRY_AFTER
+from .webhook import enqueue_webhook_events, is_duplicate_delivery, parse_webhook_events
 
 HEADER_SIGNATURE = "X-Enode-Signature"
 QUERY_FLOW_ID = "flow_id"
@@ -79,12 +79,17 @@ class EnodeWebhookView(HomeAssistantView):
         if not hmac.compare_digest(request_signature, entry_signature):
             LOGGER.debug("Signature does not match")
             raise HTTPBadRequest(reason="Signature does not match")
-        webhook_events = WebhookEvents.model_validate_json(content)
-        entry.async_create_background_task(
-            hass=hass,
-            target=process_webhook_events(hass, entry, webhook_events),
-            name="enode_webhook",
-        )
+        if is_duplicate_delivery(entry, request_signature):
+            return web_response.Response(
+                status=200,
+                text="Webhook events already received",
+            )
+        webhook_events = parse_webhook_events(content)
+        if not enqueue_webhook_events(entry, webhook_events, request_signature):
+            raise HTTPServiceUnavailable(
+                headers={RETRY_AFTER: str(int(WEBHOOK_RETRY_AFTER.total_seconds()))},
+                reason="Webhook queue is full",
+            )
         return web_response.Response(
             status=200,
             text="Webhook events received",
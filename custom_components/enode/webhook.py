@@ -1,33 +1,135 @@
 """Webhook handling for Enode integration."""
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import time
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 
-from .const import LOGGER
+from .const import (
+    LOGGER,
+    WEBHOOK_COALESCE_WINDOW,
+    WEBHOOK_DELIVERIES_SIZE,
+    WEBHOOK_DELIVERIES_TTL,
+    WEBHOOK_QUEUE_SIZE,
+)
 from .coordinator import EnodeConfigEntry
 from .models import (
     WebhookEvents,
+    WebhookPayload,
     WebhookSystemHeartbeatEvent,
     WebhookTestEvent,
+    WebhookUnhandledEvent,
     WebhookUserCredentialsInvalidatedEvent,
+    WebhookUserVehicleDeletedEvent,
+    WebhookUserVehicleDiscoveredEvent,
     WebhookUserVehicleUpdatedEvent,
 )
 
+type VehicleEvent = WebhookUserVehicleDiscoveredEvent | WebhookUserVehicleUpdatedEvent
+
+
+class DeliveryCache:
+    """Recently accepted webhook deliveries, bounded in size and age.
+
+    Deliveries are identified by their signature, an HMAC of the body, so a
+    redelivered payload is recognised without parsing it. The least recently
+    seen delivery is evicted once the cache is full.
+    """
+
+    def __init__(
+        self,
+        size: int = WEBHOOK_DELIVERIES_SIZE,
+        ttl: timedelta = WEBHOOK_DELIVERIES_TTL,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache."""
+        self._time = time_func
+        self.size = size
+        self.ttl = ttl.total_seconds()
+        self._deliveries: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached deliveries."""
+        return len(self._deliveries)
+
+    def seen(self, delivery: str) -> bool:
+        """Return True if the delivery was accepted within the TTL."""
+        if (accepted := self._deliveries.get(delivery)) is None:
+            return False
+        if self._time() - accepted >= self.ttl:
+            del self._deliveries[delivery]
+            return False
+        self._deliveries.move_to_end(delivery)
+        return True
+
+    def add(self, delivery: str) -> None:
+        """Remember an accepted delivery."""
+        self._deliveries[delivery] = self._time()
+        self._deliveries.move_to_end(delivery)
+        while len(self._deliveries) > self.size:
+            self._deliveries.popitem(last=False)
+
 
 class WebhookProcessor:
-    """Process webhook events."""
+    """Process webhook events.
+
+    Payloads are queued and processed in order by a single worker. The queue
+    is bounded, so a storm of deliveries is rejected for Enode to redeliver
+    later rather than piling up in memory. Accepted deliveries are remembered
+    so that redeliveries are acknowledged without being processed again.
 
-    def __init__(self, hass: HomeAssistant, entry: EnodeConfigEntry) -> None:
+    Vehicle updates are coalesced: only the newest event per vehicle within
+    ``window`` is applied, and the vehicles updated in that window are passed
+    to the coordinator together. A window of zero still folds the updates
+    carried by a single payload.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: EnodeConfigEntry,
+        window: timedelta = WEBHOOK_COALESCE_WINDOW,
+        queue_size: int = WEBHOOK_QUEUE_SIZE,
+    ) -> None:
         """Initialize the webhook processor."""
         self.hass = hass
         self.entry = entry
+        self.window = window.total_seconds()
+        self.received = 0
+        self.folded = 0
+        self.applied = 0
+        self.rejected = 0
+        self.duplicates = 0
+        self.deliveries = DeliveryCache()
+        self._pending: dict[str, VehicleEvent] = {}
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._queue: asyncio.Queue[WebhookEvents] = asyncio.Queue(queue_size)
+        self._worker: asyncio.Task[None] | None = None
+
+    def handle_user_vehicle_discovered(
+        self, event: WebhookUserVehicleDiscoveredEvent
+    ) -> None:
+        """Handle user vehicle discovered webhook."""
+        self._coalesce(event)
 
     def handle_user_vehicle_updated(
         self, event: WebhookUserVehicleUpdatedEvent
     ) -> None:
         """Handle user vehicle updated webhook."""
-        self.entry.runtime_data.update_vehicle_data(event.vehicle)
+        self._coalesce(event)
+
+    def handle_user_vehicle_deleted(
+        self, event: WebhookUserVehicleDeletedEvent
+    ) -> None:
+        """Handle user vehicle deleted webhook."""
+        if self._pending.pop(event.vehicle.id, None) is not None:
+            self.folded += 1
+        self.entry.runtime_data.remove_vehicle_data(event.vehicle.id)
 
     def handle_system_heartbeat(self, event: WebhookSystemHeartbeatEvent) -> None:
         """Handle system heartbeat webhook."""
@@ -48,21 +150,148 @@ class WebhookProcessor:
         """Handle user credentials invalidated webhook."""
         self.entry.async_start_reauth(self.hass)
 
+    @callback
+    def async_start(self) -> None:
+        """Start the worker processing queued payloads."""
+        self._worker = self.entry.async_create_background_task(
+            self.hass, self._async_work(), "enode_webhook_worker"
+        )
+
+    @callback
+    def async_is_duplicate(self, delivery: str) -> bool:
+        """Return True if the delivery was already accepted."""
+        if self.deliveries.seen(delivery):
+            self.duplicates += 1
+            LOGGER.debug("Ignoring redelivered webhook %s", delivery)
+            return True
+        return False
+
+    @callback
+    def async_enqueue(self, events: WebhookEvents, delivery: str | None = None) -> bool:
+        """Queue a payload, returning False if the queue is full."""
+        try:
+            self._queue.put_nowait(events)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            LOGGER.debug("Webhook queue is full, rejecting %d events", len(events.root))
+            return False
+        if delivery is not None:
+            self.deliveries.add(delivery)
+        return True
+
+    async def _async_work(self) -> None:
+        """Process queued payloads in the order they arrived."""
+        while True:
+            events = await self._queue.get()
+            try:
+                self.process(events)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Failed to process webhook events")
+            finally:
+                self._queue.task_done()
+
+    async def async_join(self) -> None:
+        """Wait until every queued payload has been processed."""
+        await self._queue.join()
+
     def process(self, events: WebhookEvents) -> None:
         """Process webhook events."""
+        self.entry.runtime_data.record_webhook()
         for event in events:
+            self.received += 1
             handler_name = f"handle_{event.event.replace(':', '_').lower()}"
             if handler := getattr(self, handler_name, None):
                 handler(event)
             else:
                 LOGGER.debug("Received unsupported webhook event: %s", event.event)
+        if not self._pending or self._cancel_flush is not None:
+            return
+        if self.window:
+            self._cancel_flush = async_call_later(self.hass, self.window, self._flush)
+        else:
+            self.async_flush()
+
+    def _coalesce(self, event: VehicleEvent) -> None:
+        """Keep the newest pending event of the vehicle."""
+        pending = self._pending.get(event.vehicle.id)
+        if pending is not None:
+            self.folded += 1
+            if pending.created_at > event.created_at:
+                return
+        self._pending[event.vehicle.id] = event
+
+    @callback
+    def _flush(self, _now: datetime) -> None:
+        """Apply the pending vehicle updates once the window has passed."""
+        self._cancel_flush = None
+        self.async_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Apply the pending vehicle updates."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        if not self._pending:
+            return
+        vehicles = [event.vehicle for event in self._pending.values()]
+        self._pending.clear()
+        self.applied += len(vehicles)
+        self.entry.runtime_data.update_vehicles_data(vehicles)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the worker and drop the queued and pending events."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._pending.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the webhook counters as a dictionary."""
+        return {
+            "received": self.received,
+            "folded": self.folded,
+            "applied": self.applied,
+            "pending": len(self._pending),
+            "rejected": self.rejected,
+            "queued": self._queue.qsize(),
+            "duplicates": self.duplicates,
+        }
+
+
+def parse_webhook_events(content: bytes) -> WebhookEvents:
+    """Validate the events of a payload that have a handler.
+
+    The payload is validated in one pass, reading only the type of the events
+    without a handler, such as the vehicle of a vendor action, which are then
+    skipped.
+    """
+    events = []
+    for event in WebhookPayload.model_validate_json(content).root:
+        if isinstance(event, WebhookUnhandledEvent):
+            LOGGER.debug("Skipping unsupported webhook event: %s", event.event)
+            continue
+        events.append(event)
+    return WebhookEvents.model_construct(events)
+
+
+def is_duplicate_delivery(entry: EnodeConfigEntry, delivery: str) -> bool:
+    """Return True if the webhook delivery was already accepted."""
+    return entry.runtime_data.webhooks.async_is_duplicate(delivery)
 
 
-async def process_webhook_events(
-    hass: HomeAssistant, entry: EnodeConfigEntry, events: WebhookEvents
-) -> None:
-    """Process webhook events."""
-    WebhookProcessor(hass, entry).process(events)
+def enqueue_webhook_events(
+    entry: EnodeConfigEntry, events: WebhookEvents, delivery: str | None = None
+) -> bool:
+    """Queue webhook events, returning False if they should be redelivered."""
+    return entry.runtime_data.webhooks.async_enqueue(events, delivery)
 
 
 def prepare_test_webhook(
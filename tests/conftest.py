@@ -4,10 +4,30 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.enode.circuit import CircuitBreaker
 from custom_components.enode.models import Vehicle
+from custom_components.enode.ratelimit import RateLimiter
 from homeassistant.core import HomeAssistant
 
 
+class FakeClock:
+    """Controllable monotonic clock."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Return a controllable monotonic clock."""
+    return FakeClock()
+
+
 @pytest.fixture
 def mock_vehicle_data():
     """Return mock vehicle data."""
@@ -73,6 +93,8 @@ def hass():
 def mock_enode_client():
     """Mock Enode client."""
     with patch("custom_components.enode.api.EnodeClient", autospec=True) as mock:
+        mock.return_value.rate_limiter = RateLimiter()
+        mock.return_value.circuit_breaker = CircuitBreaker()
         yield mock.return_value
 
 
@@ -1,12 +1,24 @@
 """Tests for Enode API client."""
 
+import asyncio
+from datetime import timedelta
+import json
 from unittest.mock import AsyncMock, MagicMock
 
-from aiohttp import ClientResponse
+from aiohttp import ClientConnectionError, ClientResponse
 import pytest
 
-from custom_components.enode.api import EnodeClient, EnodeError
+from custom_components.enode.api import EnodeClient, EnodeError, PaginationError
+from custom_components.enode.circuit import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
 from custom_components.enode.models import Link, Vehicle, Webhook, WebhookTest
+from custom_components.enode.ratelimit import RateLimiter
+from custom_components.enode.retry import NO_RETRY, RetryPolicy
+
+NO_DELAY_RETRY_POLICY = RetryPolicy(base_delay=timedelta(0), jitter=False)
 
 
 class TestEnodeClient:
@@ -27,11 +39,13 @@ class TestEnodeClient:
         mock_response = AsyncMock(spec=ClientResponse)
         mock_response.status = 200
         mock_response.ok = True
-        mock_response.json = AsyncMock(
-            return_value={
-                "data": [mock_vehicle_data],
-                "pagination": {"before": None, "after": None},
-            }
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "data": [mock_vehicle_data],
+                    "pagination": {"before": None, "after": None},
+                }
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response
@@ -50,11 +64,13 @@ class TestEnodeClient:
         mock_response = AsyncMock(spec=ClientResponse)
         mock_response.status = 200
         mock_response.ok = True
-        mock_response.json = AsyncMock(
-            return_value={
-                "data": [mock_vehicle_data],
-                "pagination": {"before": None, "after": None},
-            }
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "data": [mock_vehicle_data],
+                    "pagination": {"before": None, "after": None},
+                }
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response
@@ -65,6 +81,174 @@ class TestEnodeClient:
         assert "/users/test_user/vehicles" in str(
             mock_oauth_session.async_request.call_args[1]["url"]
         )
+        metrics = client.metrics.endpoints["GET /users/{user_id}/vehicles"]
+        assert metrics.statuses == {200: 1}
+        assert len(metrics.total_time) == 1
+        assert len(metrics.validation_time) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [False, True])
+    async def test_iter_vehicles_follows_cursor(
+        self, mock_oauth_session, mock_vehicle_data, prefetch
+    ):
+        """Test iterating vehicles across pages."""
+        client = EnodeClient(mock_oauth_session)
+
+        def page(vehicle_id, after):
+            mock_response = AsyncMock(spec=ClientResponse)
+            mock_response.status = 200
+            mock_response.ok = True
+            mock_response.read = AsyncMock(
+                return_value=json.dumps(
+                    {
+                        "data": [{**mock_vehicle_data, "id": vehicle_id}],
+                        "pagination": {"before": None, "after": after},
+                    }
+                ).encode()
+            )
+            return mock_response
+
+        mock_oauth_session.async_request.side_effect = [
+            page("v1", "c1"),
+            page("v2", "c2"),
+            page("v3", None),
+        ]
+
+        vehicles = [
+            vehicle
+            async for vehicle in client.iter_vehicles(
+                "test_user", page_size=1, prefetch=prefetch
+            )
+        ]
+
+        assert [vehicle.id for vehicle in vehicles] == ["v1", "v2", "v3"]
+        params = [
+            call[1]["params"]
+            for call in mock_oauth_session.async_request.call_args_list
+        ]
+        assert params == [
+            {"pageSize": 1},
+            {"pageSize": 1, "after": "c1"},
+            {"pageSize": 1, "after": "c2"},
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_iter_vehicles_stuck_cursor(
+        self, mock_oauth_session, mock_vehicle_data, stream
+    ):
+        """Test a cursor that does not advance fails rather than truncating."""
+        client = EnodeClient(mock_oauth_session)
+        content = json.dumps(
+            {
+                "data": [mock_vehicle_data],
+                "pagination": {"before": None, "after": "c1"},
+            }
+        ).encode()
+
+        async def iter_chunked(size):
+            yield content
+
+        def page():
+            mock_response = AsyncMock(spec=ClientResponse)
+            mock_response.status = 200
+            mock_response.ok = True
+            mock_response.read = AsyncMock(return_value=content)
+            mock_response.content = MagicMock()
+            mock_response.content.iter_chunked = iter_chunked
+            mock_response.release = MagicMock()
+            return mock_response
+
+        mock_oauth_session.async_request.side_effect = [page(), page()]
+
+        with pytest.raises(PaginationError):
+            async for _ in client.iter_vehicles(stream=stream):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_iter_vehicles_streamed(self, mock_oauth_session, mock_vehicle_data):
+        """Test streaming vehicles parses them as chunks arrive."""
+        client = EnodeClient(mock_oauth_session)
+
+        def page(vehicle_ids, after):
+            content = json.dumps(
+                {
+                    "data": [
+                        {**mock_vehicle_data, "id": vehicle_id}
+                        for vehicle_id in vehicle_ids
+                    ],
+                    "pagination": {"before": None, "after": after},
+                }
+            ).encode()
+
+            async def iter_chunked(size):
+                for start in range(0, len(content), 100):
+                    yield content[start : start + 100]
+
+            mock_response = AsyncMock(spec=ClientResponse)
+            mock_response.status = 200
+            mock_response.content = MagicMock()
+            mock_response.content.iter_chunked = iter_chunked
+            mock_response.release = MagicMock()
+            return mock_response
+
+        first, second = page(["v1", "v2"], "c1"), page(["v3"], None)
+        mock_oauth_session.async_request.side_effect = [first, second]
+
+        vehicles = [
+            vehicle
+            async for vehicle in client.iter_vehicles(
+                "test_user", page_size=2, stream=True
+            )
+        ]
+
+        assert [vehicle.id for vehicle in vehicles] == ["v1", "v2", "v3"]
+        assert mock_oauth_session.async_request.call_args[1]["params"] == {
+            "pageSize": 2,
+            "after": "c1",
+        }
+        first.release.assert_called_once()
+        second.release.assert_called_once()
+        metrics = client.metrics.endpoints["GET /users/{user_id}/vehicles"]
+        assert metrics.statuses == {200: 2}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_are_coalesced(
+        self, mock_oauth_session, mock_vehicle_data
+    ):
+        """Test concurrent identical GET requests share one round trip."""
+        client = EnodeClient(mock_oauth_session)
+        release = asyncio.Event()
+
+        mock_response = AsyncMock(spec=ClientResponse)
+        mock_response.status = 200
+        mock_response.ok = True
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "data": [mock_vehicle_data],
+                    "pagination": {"before": None, "after": None},
+                }
+            ).encode()
+        )
+
+        async def async_request(**kwargs):
+            await release.wait()
+            return mock_response
+
+        mock_oauth_session.async_request.side_effect = async_request
+
+        tasks = [asyncio.create_task(client.list_vehicles()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert mock_oauth_session.async_request.call_count == 1
+        assert results[0] == results[1] == results[2]
+        assert client.coalesced_requests == 2
+
+        await client.list_vehicles()
+        assert mock_oauth_session.async_request.call_count == 2
 
     @pytest.mark.asyncio
     async def test_refresh_vehicle_data(self, mock_oauth_session):
@@ -91,8 +275,10 @@ class TestEnodeClient:
         mock_response = AsyncMock(spec=ClientResponse)
         mock_response.status = 200
         mock_response.ok = True
-        mock_response.json = AsyncMock(
-            return_value={"linkUrl": "https://link.url", "linkToken": "test_token"}
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {"linkUrl": "https://link.url", "linkToken": "test_token"}
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response
@@ -113,17 +299,19 @@ class TestEnodeClient:
         mock_response = AsyncMock(spec=ClientResponse)
         mock_response.status = 200
         mock_response.ok = True
-        mock_response.json = AsyncMock(
-            return_value={
-                "id": "act1",
-                "userId": "u1",
-                "createdAt": "2023-01-01T00:00:00Z",
-                "updatedAt": "2023-01-01T00:00:00Z",
-                "state": "PENDING",
-                "targetId": "v1",
-                "targetType": "vehicle",
-                "kind": "START",
-            }
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "id": "act1",
+                    "userId": "u1",
+                    "createdAt": "2023-01-01T00:00:00Z",
+                    "updatedAt": "2023-01-01T00:00:00Z",
+                    "state": "PENDING",
+                    "targetId": "v1",
+                    "targetType": "vehicle",
+                    "kind": "START",
+                }
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response
@@ -143,15 +331,17 @@ class TestEnodeClient:
         mock_response_create = AsyncMock(spec=ClientResponse)
         mock_response_create.status = 201
         mock_response_create.ok = True
-        mock_response_create.json = AsyncMock(
-            return_value={
-                "id": "wh1",
-                "url": "https://wh.url",
-                "events": ["*"],
-                "isActive": True,
-                "createdAt": "2023-01-01T00:00:00Z",
-                "lastSuccess": "2023-01-01T00:00:00Z",
-            }
+        mock_response_create.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "id": "wh1",
+                    "url": "https://wh.url",
+                    "events": ["*"],
+                    "isActive": True,
+                    "createdAt": "2023-01-01T00:00:00Z",
+                    "lastSuccess": "2023-01-01T00:00:00Z",
+                }
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response_create
@@ -163,12 +353,14 @@ class TestEnodeClient:
         mock_response_test = AsyncMock(spec=ClientResponse)
         mock_response_test.status = 200
         mock_response_test.ok = True
-        mock_response_test.json = AsyncMock(
-            return_value={
-                "status": "SUCCESS",
-                "description": "Webhook test succeeded",
-                "response": {"code": 200, "body": "OK"},
-            }
+        mock_response_test.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "status": "SUCCESS",
+                    "description": "Webhook test succeeded",
+                    "response": {"code": 200, "body": "OK"},
+                }
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response_test
@@ -187,6 +379,177 @@ class TestEnodeClient:
             mock_oauth_session.async_request.call_args[1]["url"]
         )
 
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(
+        self, mock_oauth_session, mock_vehicle_data
+    ):
+        """Test a 429 response is retried after Retry-After."""
+        client = EnodeClient(
+            mock_oauth_session, rate_limiter=RateLimiter(period=timedelta(seconds=1))
+        )
+
+        mock_limited = AsyncMock(spec=ClientResponse)
+        mock_limited.status = 429
+        mock_limited.ok = False
+        mock_limited.headers = {"Retry-After": "0"}
+        mock_limited.release = MagicMock()
+
+        mock_response = AsyncMock(spec=ClientResponse)
+        mock_response.status = 200
+        mock_response.ok = True
+        mock_response.headers = {
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": "42",
+        }
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "data": [mock_vehicle_data],
+                    "pagination": {"before": None, "after": None},
+                }
+            ).encode()
+        )
+
+        mock_oauth_session.async_request.side_effect = [mock_limited, mock_response]
+
+        vehicles = await client.list_vehicles()
+
+        assert len(vehicles) == 1
+        assert mock_oauth_session.async_request.call_count == 2
+        mock_limited.release.assert_called_once()
+        assert client.rate_limiter.capacity == 100
+
+    @pytest.mark.asyncio
+    async def test_get_is_retried(self, mock_oauth_session, mock_vehicle_data):
+        """Test transient failures of GET requests are retried."""
+        client = EnodeClient(mock_oauth_session, retry_policy=NO_DELAY_RETRY_POLICY)
+
+        mock_unavailable = AsyncMock(spec=ClientResponse)
+        mock_unavailable.status = 503
+        mock_unavailable.ok = False
+        mock_unavailable.release = MagicMock()
+
+        mock_response = AsyncMock(spec=ClientResponse)
+        mock_response.status = 200
+        mock_response.ok = True
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "data": [mock_vehicle_data],
+                    "pagination": {"before": None, "after": None},
+                }
+            ).encode()
+        )
+
+        mock_oauth_session.async_request.side_effect = [
+            ClientConnectionError(),
+            mock_unavailable,
+            mock_response,
+        ]
+
+        vehicles = await client.list_vehicles()
+
+        assert len(vehicles) == 1
+        assert mock_oauth_session.async_request.call_count == 3
+        mock_unavailable.release.assert_called_once()
+        assert client.retry_stats.retries == 2
+        assert client.retry_stats.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_excludes_queueing_and_backoff(
+        self, mock_oauth_session, mock_vehicle_data
+    ):
+        """Test request latency is measured from the attempt that succeeded."""
+        client = EnodeClient(
+            mock_oauth_session,
+            retry_policy=RetryPolicy(base_delay=timedelta(seconds=0.1), jitter=False),
+        )
+        acquire = client.rate_limiter.acquire
+
+        async def slow_acquire(priority):
+            await asyncio.sleep(0.1)
+            await acquire(priority)
+
+        client.rate_limiter.acquire = slow_acquire
+
+        mock_unavailable = AsyncMock(spec=ClientResponse)
+        mock_unavailable.status = 503
+        mock_unavailable.ok = False
+        mock_unavailable.release = MagicMock()
+
+        mock_response = AsyncMock(spec=ClientResponse)
+        mock_response.status = 200
+        mock_response.ok = True
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "data": [mock_vehicle_data],
+                    "pagination": {"before": None, "after": None},
+                }
+            ).encode()
+        )
+        mock_oauth_session.async_request.side_effect = [
+            mock_unavailable,
+            mock_response,
+        ]
+
+        await client.list_vehicles()
+
+        metrics = client.metrics.endpoints["GET /vehicles"]
+        assert metrics.time_to_first_byte.percentile(100) < 0.05
+        assert metrics.total_time.percentile(100) < 0.05
+        assert client.retry_stats.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_post_without_idempotency_key_is_not_retried(
+        self, mock_oauth_session
+    ):
+        """Test POST requests are not retried unless they are idempotent."""
+        client = EnodeClient(mock_oauth_session, retry_policy=NO_DELAY_RETRY_POLICY)
+        mock_oauth_session.async_request.side_effect = ClientConnectionError()
+
+        with pytest.raises(ClientConnectionError):
+            await client.user_link("test_user", "https://redirect.uri")
+
+        assert mock_oauth_session.async_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_control_charging_is_retried_with_idempotency_key(
+        self, mock_oauth_session
+    ):
+        """Test control charging retries reuse the same idempotency key."""
+        client = EnodeClient(mock_oauth_session, retry_policy=NO_DELAY_RETRY_POLICY)
+        mock_oauth_session.async_request.side_effect = ClientConnectionError()
+
+        with pytest.raises(ClientConnectionError):
+            await client.control_charging("v1", "STOP")
+
+        calls = mock_oauth_session.async_request.call_args_list
+        assert len(calls) == NO_DELAY_RETRY_POLICY.max_attempts
+        keys = {call[1]["headers"]["Idempotency-Key"] for call in calls}
+        assert len(keys) == 1
+        assert client.retry_stats.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, mock_oauth_session):
+        """Test requests fail fast once the circuit breaker opens."""
+        client = EnodeClient(
+            mock_oauth_session,
+            retry_policy=NO_RETRY,
+            circuit_breaker=CircuitBreaker(failure_threshold=2),
+        )
+        mock_oauth_session.async_request.side_effect = ClientConnectionError()
+
+        for _ in range(2):
+            with pytest.raises(ClientConnectionError):
+                await client.list_vehicles()
+        with pytest.raises(CircuitOpenError):
+            await client.list_vehicles()
+
+        assert mock_oauth_session.async_request.call_count == 2
+        assert client.circuit_breaker.state is CircuitState.OPEN
+        assert client.circuit_breaker.rejected == 1
+
     @pytest.mark.asyncio
     async def test_enode_error(self, mock_oauth_session):
         """Test EnodeError handling."""
@@ -195,12 +558,14 @@ class TestEnodeClient:
         mock_response = AsyncMock(spec=ClientResponse)
         mock_response.status = 400
         mock_response.ok = False
-        mock_response.json = AsyncMock(
-            return_value={
-                "type": "error",
-                "title": "Bad Request",
-                "detail": "Invalid parameter",
-            }
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "type": "error",
+                    "title": "Bad Request",
+                    "detail": "Invalid parameter",
+                }
+            ).encode()
         )
 
         mock_oauth_session.async_request.return_value = mock_response
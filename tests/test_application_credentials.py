@@ -0,0 +1,37 @@
+"""Tests for the Enode application credentials platform."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.enode.application_credentials import get_client
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+
+
+@pytest.mark.asyncio
+async def test_get_client_closes_pool_on_stop(hass):
+    """Test the dedicated connection pool is closed when Home Assistant stops."""
+    hass.bus = MagicMock()
+    entry = MagicMock()
+    entry.data = {}
+
+    with (
+        patch(
+            "custom_components.enode.application_credentials."
+            "async_get_config_entry_implementation",
+            new_callable=AsyncMock,
+        ),
+        patch("custom_components.enode.application_credentials.OAuth2Session"),
+    ):
+        client = await get_client(hass, entry)
+
+    session = client.connection_pool.session
+    event_type, listener = hass.bus.async_listen_once.call_args.args
+    assert event_type == EVENT_HOMEASSISTANT_CLOSE
+    entry.async_on_unload.assert_called_once_with(
+        hass.bus.async_listen_once.return_value
+    )
+
+    await listener(MagicMock())
+
+    assert session.closed
@@ -18,7 +18,7 @@ class TestVehicleChargeStateBinarySensor:
     def test_is_on(self, mock_vehicle):
         """Test is_on property."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         description = BinarySensorEntityDescription(key="is_plugged_in")
         sensor = VehicleChargeStateBinarySensor(
             coordinator, mock_vehicle, description=description
@@ -32,7 +32,7 @@ class TestVehicleChargeStateBinarySensor:
     def test_is_on_missing(self, mock_vehicle):
         """Test is_on when value is None."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         mock_vehicle.charge_state.is_plugged_in = None
         description = BinarySensorEntityDescription(key="is_plugged_in")
         sensor = VehicleChargeStateBinarySensor(
@@ -44,7 +44,7 @@ class TestVehicleChargeStateBinarySensor:
     def test_is_on_no_vehicle(self, mock_vehicle):
         """Test is_on when vehicle is None."""
         coordinator = MagicMock()
-        coordinator.data = []
+        coordinator.data = {}
         description = BinarySensorEntityDescription(key="is_plugged_in")
         sensor = VehicleChargeStateBinarySensor(
             coordinator, mock_vehicle, description=description
@@ -67,7 +67,7 @@ class TestVehicleSmartChargingBinarySensor:
         vehicle = Vehicle.model_validate(mock_vehicle_data)
 
         coordinator = MagicMock()
-        coordinator.data = [vehicle]
+        coordinator.data = {vehicle.id: vehicle}
         description = BinarySensorEntityDescription(key="is_enabled")
         sensor = VehicleSmartChargingBinarySensor(
             coordinator, vehicle, description=description
@@ -81,7 +81,7 @@ class TestVehicleSmartChargingBinarySensor:
     def test_is_on_missing_policy(self, mock_vehicle):
         """Test is_on when smart_charging_policy is None."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         mock_vehicle.smart_charging_policy = None
         description = BinarySensorEntityDescription(key="is_enabled")
         sensor = VehicleSmartChargingBinarySensor(
@@ -94,7 +94,7 @@ class TestVehicleSmartChargingBinarySensor:
     def test_is_on_no_vehicle(self, mock_vehicle):
         """Test is_on when vehicle is None."""
         coordinator = MagicMock()
-        coordinator.data = []
+        coordinator.data = {}
         description = BinarySensorEntityDescription(key="is_enabled")
         sensor = VehicleSmartChargingBinarySensor(
             coordinator, mock_vehicle, description=description
@@ -0,0 +1,41 @@
+"""Tests for Enode buttons."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.enode.button import VehicleRefreshButton
+from custom_components.enode.circuit import CircuitOpenError
+from homeassistant.exceptions import HomeAssistantError
+
+
+class TestVehicleRefreshButton:
+    """Test VehicleRefreshButton class."""
+
+    @pytest.mark.asyncio
+    async def test_async_press(self, mock_vehicle):
+        """Test async_press."""
+        coordinator = MagicMock()
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
+        client = MagicMock()
+        client.refresh_vehicle_data = AsyncMock()
+        button = VehicleRefreshButton(coordinator, mock_vehicle, client=client)
+
+        await button.async_press()
+
+        client.refresh_vehicle_data.assert_called_once_with(mock_vehicle.id)
+
+    @pytest.mark.asyncio
+    async def test_async_press_circuit_open(self, mock_vehicle):
+        """Test pressing fails fast while the circuit breaker is open."""
+        coordinator = MagicMock()
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
+        client = MagicMock()
+        client.refresh_vehicle_data = AsyncMock(side_effect=CircuitOpenError(42))
+        button = VehicleRefreshButton(coordinator, mock_vehicle, client=client)
+
+        with pytest.raises(HomeAssistantError) as exc_info:
+            await button.async_press()
+
+        assert exc_info.value.translation_key == "api_unavailable"
+        assert exc_info.value.translation_placeholders == {"retry_after": "42"}
@@ -0,0 +1,92 @@
+"""Tests for recording and replaying Enode API traffic."""
+
+from unittest.mock import MagicMock
+
+from aiohttp import ClientSession
+import pytest
+
+from benchmarks.emulator import EmulatorConfig, EmulatorOAuthSession, EnodeEmulator
+from custom_components.enode.api import EnodeClient
+from custom_components.enode.cassette import REDACTED, CassettePlayer, CassetteRecorder
+from custom_components.enode.retry import NO_RETRY
+
+
+@pytest.fixture
+async def recorded(aiohttp_server):
+    """Record a vehicle listing and a charge command against the emulator."""
+    emulator = EnodeEmulator(EmulatorConfig(vehicles=30))
+    server = await aiohttp_server(emulator.create_app())
+    url = str(server.make_url("/"))
+    recorder = CassetteRecorder()
+    async with ClientSession() as session:
+        client = EnodeClient(
+            EmulatorOAuthSession(session, url), api_url=url, cassette=recorder
+        )
+        vehicles = await client.list_vehicles(page_size=20)
+        await client.control_charging("vehicle-1", "STOP")
+    return recorder, vehicles
+
+
+@pytest.mark.asyncio
+async def test_record_redacts_sensitive_fields(recorded):
+    """Test recorded responses do not contain sensitive values."""
+    recorder, vehicles = recorded
+
+    assert [interaction.key for interaction in recorder.interactions] == [
+        "GET /vehicles?pageSize=20",
+        "GET /vehicles?after=20&pageSize=20",
+        "POST /vehicles/vehicle-1/charging",
+    ]
+    body = recorder.interactions[0].body
+    assert vehicles[0].information.vin not in body
+    assert REDACTED in body
+
+
+@pytest.mark.asyncio
+async def test_record_streamed_vehicles(aiohttp_server):
+    """Test streamed responses are still readable after being recorded."""
+    emulator = EnodeEmulator(EmulatorConfig(vehicles=30))
+    server = await aiohttp_server(emulator.create_app())
+    url = str(server.make_url("/"))
+    recorder = CassetteRecorder()
+    async with ClientSession() as session:
+        client = EnodeClient(
+            EmulatorOAuthSession(session, url), api_url=url, cassette=recorder
+        )
+        vehicles = [
+            vehicle async for vehicle in client.iter_vehicles(page_size=20, stream=True)
+        ]
+
+    assert len(vehicles) == 30
+    assert [interaction.key for interaction in recorder.interactions] == [
+        "GET /vehicles?pageSize=20",
+        "GET /vehicles?after=20&pageSize=20",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_from_file(recorded, tmp_path):
+    """Test a saved cassette replays the same responses offline."""
+    recorder, vehicles = recorded
+    path = tmp_path / "enode.jsonl.gz"
+    recorder.save(path)
+    player = CassettePlayer.load(path, time_scale=0)
+    oauth_session = MagicMock()
+    client = EnodeClient(oauth_session, cassette=player, retry_policy=NO_RETRY)
+
+    replayed = await client.list_vehicles(page_size=20)
+    await client.control_charging("vehicle-1", "STOP")
+
+    assert [vehicle.id for vehicle in replayed] == [vehicle.id for vehicle in vehicles]
+    assert replayed[0].information.vin == REDACTED
+    assert player.remaining == 0
+    oauth_session.async_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_replay_unrecorded_request():
+    """Test replaying a request that was never recorded fails loudly."""
+    client = EnodeClient(MagicMock(), cassette=CassettePlayer([]))
+
+    with pytest.raises(LookupError):
+        await client.list_vehicles()
@@ -0,0 +1,78 @@
+"""Tests for the Enode API circuit breaker."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.enode.circuit import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    @pytest.fixture
+    def breaker(self, clock):
+        """Return a circuit breaker opening after two failures."""
+        return CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=timedelta(seconds=60),
+            time_func=clock,
+        )
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test the circuit opens after the failure threshold."""
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after == 60
+
+    def test_half_open_allows_single_probe(self, breaker, clock):
+        """Test only one probe is let through after the recovery timeout."""
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 60
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Test a failed probe opens the circuit again."""
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 60
+        breaker.before_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after == 60
+        assert breaker.opened == 2
+
+    def test_released_probe(self, breaker, clock):
+        """Test a probe that ends without a result lets another through."""
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 60
+        breaker.before_request()
+
+        breaker.release()
+
+        breaker.before_request()
@@ -90,11 +90,15 @@ class TestUserLinkFlowHandler:
         assert result["type"] == "external_done"
         assert result["step_id"] == "user_linked"
 
-        with patch.object(hass.config_entries, "async_schedule_reload") as mock_reload:
-            result = await handler.async_step_user_linked(user_input={})
-            assert result["type"] == "abort"
-            assert result["reason"] == "user_linked"
-            mock_reload.assert_called_once()
+        result = await handler.async_step_user_linked(user_input={})
+        assert result["type"] == "abort"
+        assert result["reason"] == "user_linked"
+        mock_entry.async_create_background_task.assert_called_once_with(
+            hass,
+            mock_entry.runtime_data.async_refresh.return_value,
+            "enode_vehicles_refresh",
+        )
+        hass.config_entries.async_schedule_reload.assert_not_called()
 
 
 class TestWebhookFlowHandler:
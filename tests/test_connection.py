@@ -0,0 +1,41 @@
+"""Tests for Enode connection pool."""
+
+from aiohttp import web
+import pytest
+
+from custom_components.enode.connection import ConnectionPool
+
+
+class TestConnectionPool:
+    """Test ConnectionPool class."""
+
+    @pytest.fixture
+    async def server(self, aiohttp_server):
+        """Start a server echoing the authorization header."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response(
+                {"authorization": request.headers.get("Authorization")}
+            )
+
+        app = web.Application()
+        app.router.add_get("/vehicles", handler)
+        return await aiohttp_server(app)
+
+    @pytest.mark.asyncio
+    async def test_request_reuses_connections(self, server):
+        """Test requests are authenticated and reuse pooled connections."""
+        pool = ConnectionPool()
+
+        for _ in range(3):
+            response = await pool.request("GET", server.make_url("/vehicles"), "t0k3n")
+            assert await response.json() == {"authorization": "Bearer t0k3n"}
+
+        stats = pool.as_dict()
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["reuse_ratio"] == pytest.approx(0.667)
+        assert stats["open_connections"] == 1
+
+        await pool.async_close()
+        assert pool.open_connections == 0
@@ -1,11 +1,28 @@
 """Tests for Enode coordinator."""
 
-from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
 
+from aiohttp import ClientConnectionError
 import pytest
 
+from custom_components.enode.circuit import CircuitBreaker, CircuitOpenError
+from custom_components.enode.const import (
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_CHARGING,
+    UPDATE_INTERVAL_WEBHOOKS_HEALTHY,
+    VEHICLES_PAGE_SIZE,
+    WEBHOOK_HEALTH_TIMEOUT,
+)
 from custom_components.enode.coordinator import EnodeCoordinators
-from custom_components.enode.models import Vehicle
+from custom_components.enode.models import PowerDeliveryState, Vehicle
+from custom_components.enode.polling import PollingSchedule
+
+
+async def _aiter(items):
+    """Return an async iterator over items."""
+    for item in items:
+        yield item
 
 
 class TestEnodeCoordinators:
@@ -14,7 +31,7 @@ class TestEnodeCoordinators:
     @pytest.mark.asyncio
     async def test_fetch_vehicles(self, hass, mock_enode_client, mock_vehicle):
         """Test fetching vehicles in the coordinator."""
-        mock_enode_client.list_user_vehicles = AsyncMock(return_value=[mock_vehicle])
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter([mock_vehicle]))
 
         config_entry = MagicMock()
         config_entry.data = {"user_id": "test_user"}
@@ -23,16 +40,18 @@ class TestEnodeCoordinators:
 
         vehicles = await coordinator._fetch_vehicles()  # noqa: SLF001
 
-        assert vehicles == [mock_vehicle]
-        assert isinstance(vehicles[0], Vehicle)
-        mock_enode_client.list_user_vehicles.assert_called_once_with("test_user")
+        assert vehicles == {mock_vehicle.id: mock_vehicle}
+        assert isinstance(vehicles[mock_vehicle.id], Vehicle)
+        mock_enode_client.iter_vehicles.assert_called_once_with(
+            "test_user", page_size=VEHICLES_PAGE_SIZE, prefetch=True
+        )
 
     @pytest.mark.asyncio
     async def test_fetch_vehicles_no_user_id(
         self, hass, mock_enode_client, mock_vehicle
     ):
         """Test fetching vehicles in the coordinator when no user_id is provided."""
-        mock_enode_client.list_vehicles = AsyncMock(return_value=[mock_vehicle])
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter([mock_vehicle]))
 
         config_entry = MagicMock()
         config_entry.data = {}
@@ -41,9 +60,102 @@ class TestEnodeCoordinators:
 
         vehicles = await coordinator._fetch_vehicles()  # noqa: SLF001
 
-        assert vehicles == [mock_vehicle]
-        assert isinstance(vehicles[0], Vehicle)
-        mock_enode_client.list_vehicles.assert_called_once()
+        assert vehicles == {mock_vehicle.id: mock_vehicle}
+        assert isinstance(vehicles[mock_vehicle.id], Vehicle)
+        mock_enode_client.iter_vehicles.assert_called_once_with(
+            None, page_size=VEHICLES_PAGE_SIZE, prefetch=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_vehicles_serves_stale_data_while_circuit_open(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test the last good data is kept while the API is unavailable."""
+        mock_enode_client.iter_vehicles = MagicMock(side_effect=CircuitOpenError(60))
+        mock_enode_client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        mock_enode_client.circuit_breaker.record_failure()
+        coordinator = EnodeCoordinators(hass, mock_enode_client)
+        coordinator.vehicles.data = {mock_vehicle.id: mock_vehicle}
+
+        vehicles = await coordinator._fetch_vehicles()  # noqa: SLF001
+
+        assert vehicles == {mock_vehicle.id: mock_vehicle}
+        assert coordinator.stale is True
+
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter([mock_vehicle]))
+        await coordinator._fetch_vehicles()  # noqa: SLF001
+
+        assert coordinator.stale is False
+
+    @pytest.mark.asyncio
+    async def test_fetch_vehicles_fails_while_circuit_closed(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test failures are raised while the circuit is closed."""
+        mock_enode_client.iter_vehicles = MagicMock(side_effect=ClientConnectionError())
+        coordinator = EnodeCoordinators(hass, mock_enode_client)
+        coordinator.vehicles.data = {mock_vehicle.id: mock_vehicle}
+
+        with pytest.raises(ClientConnectionError):
+            await coordinator._fetch_vehicles()  # noqa: SLF001
+
+        assert coordinator.stale is False
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_publishes_each_page(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test vehicles are published page by page until any are known."""
+        fleet = [
+            mock_vehicle.model_copy(update={"id": f"v{index}"})
+            for index in range(VEHICLES_PAGE_SIZE + 1)
+        ]
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        vehicles = coordinator.vehicles
+        published = []
+        vehicles.async_add_listener(lambda: published.append(len(vehicles.data)))
+
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter(fleet))
+        await coordinator.async_refresh()
+        assert published == [VEHICLES_PAGE_SIZE, VEHICLES_PAGE_SIZE + 1]
+
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter(fleet[:1]))
+        await coordinator.async_refresh()
+        assert published[2:] == [1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("known", [False, True])
+    async def test_poll_keeps_webhook_between_pages(
+        self, hass, mock_enode_client, mock_vehicle, known
+    ):
+        """Test a webhook arriving while later pages are read is not regressed."""
+        fleet = [
+            mock_vehicle.model_copy(update={"id": f"v{index}"})
+            for index in range(VEHICLES_PAGE_SIZE + 1)
+        ]
+        newer = fleet[0].model_copy(
+            update={"last_seen": mock_vehicle.last_seen + timedelta(hours=1)}
+        )
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        if known:
+            coordinator.vehicles.data = {vehicle.id: vehicle for vehicle in fleet}
+
+        async def pages():
+            for vehicle in fleet[:VEHICLES_PAGE_SIZE]:
+                yield vehicle
+            coordinator.update_vehicle_data(newer)
+            for vehicle in fleet[VEHICLES_PAGE_SIZE:]:
+                yield vehicle
+
+        mock_enode_client.iter_vehicles = MagicMock(return_value=pages())
+        await coordinator.async_refresh()
+
+        assert coordinator.vehicles.data["v0"].last_seen == newer.last_seen
+        assert len(coordinator.vehicles.data) == VEHICLES_PAGE_SIZE + 1
 
     @pytest.mark.asyncio
     async def test_update_vehicle_data(self, hass, mock_enode_client, mock_vehicle):
@@ -54,14 +166,254 @@ class TestEnodeCoordinators:
         coordinator = EnodeCoordinators(
             hass, mock_enode_client, config_entry, use_update_interval=False
         )
-        coordinator.vehicles.async_set_updated_data([mock_vehicle])
+        coordinator.vehicles.async_set_updated_data({mock_vehicle.id: mock_vehicle})
 
         new_vehicle_data = mock_vehicle.model_copy(update={"vendor": "NewVendor"})
         coordinator.update_vehicle_data(new_vehicle_data)
 
-        assert coordinator.vehicles.data[0].vendor == "NewVendor"
+        assert coordinator.vehicles.data[mock_vehicle.id].vendor == "NewVendor"
         assert len(coordinator.vehicles.data) == 1
 
+    @pytest.mark.asyncio
+    async def test_update_vehicle_data_notifies_vehicle_listeners(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test a vehicle update only wakes the listeners of that vehicle."""
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        other = mock_vehicle.model_copy(update={"id": "v2"})
+        coordinator.vehicles.data = {mock_vehicle.id: mock_vehicle, other.id: other}
+        vehicle_listener, other_listener, client_listener = (
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+        )
+        coordinator.vehicles.async_add_listener(vehicle_listener, mock_vehicle.id)
+        remove = coordinator.vehicles.async_add_listener(other_listener, other.id)
+        coordinator.vehicles.async_add_listener(client_listener)
+
+        other = other.model_copy(update={"vendor": "OTHER"})
+        coordinator.update_vehicle_data(other)
+        remove()
+        coordinator.update_vehicle_data(other.model_copy(update={"vendor": "NEW"}))
+
+        vehicle_listener.assert_not_called()
+        other_listener.assert_called_once()
+        assert client_listener.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fields_skip_listeners(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test listeners only pass when the fields they depend on changed."""
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        vehicles = coordinator.vehicles
+        vehicles.data = {mock_vehicle.id: mock_vehicle}
+        changed = []
+        vehicles.async_add_listener(
+            lambda: changed.append(
+                vehicles.async_vehicle_changed(mock_vehicle.id, {"vendor"})
+            ),
+            mock_vehicle.id,
+        )
+
+        coordinator.update_vehicle_data(mock_vehicle.model_copy())
+        coordinator.update_vehicle_data(
+            mock_vehicle.model_copy(update={"odometer": None})
+        )
+        coordinator.update_vehicle_data(
+            mock_vehicle.model_copy(update={"vendor": "OTHER"})
+        )
+
+        assert changed == [False, True]
+        assert vehicles.skipped_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_poll_skips_vehicle_listeners(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test a poll without changes only wakes the listeners without context."""
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        vehicles = coordinator.vehicles
+        vehicles.data = {mock_vehicle.id: mock_vehicle}
+        vehicle_listener, client_listener = MagicMock(), MagicMock()
+        vehicles.async_add_listener(vehicle_listener, mock_vehicle.id)
+        vehicles.async_add_listener(client_listener)
+
+        vehicles.async_track_changes({mock_vehicle.id: mock_vehicle.model_copy()})
+        vehicles.async_set_updated_data({mock_vehicle.id: mock_vehicle.model_copy()})
+
+        vehicle_listener.assert_not_called()
+        client_listener.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_availability_change_wakes_all_listeners(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test a failed update wakes every listener so availability follows."""
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        vehicles = coordinator.vehicles
+        vehicles.data = {mock_vehicle.id: mock_vehicle}
+        vehicle_listener = MagicMock()
+        vehicles.async_add_listener(vehicle_listener, mock_vehicle.id)
+
+        vehicles.async_track_changes(vehicles.data)
+        vehicles.last_update_success = False
+        vehicles.async_update_listeners()
+        vehicles.async_track_changes(vehicles.data)
+        vehicles.async_update_listeners()
+
+        vehicle_listener.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_change_wakes_all_listeners(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test entering and leaving stale data wakes every listener."""
+        mock_enode_client.iter_vehicles = MagicMock(side_effect=CircuitOpenError(60))
+        mock_enode_client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        mock_enode_client.circuit_breaker.record_failure()
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        vehicles = coordinator.vehicles
+        vehicles.data = {mock_vehicle.id: mock_vehicle}
+        vehicle_listener = MagicMock()
+        vehicles.async_add_listener(vehicle_listener, mock_vehicle.id)
+
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+        assert coordinator.stale is True
+        assert vehicle_listener.call_count == 1
+
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter([mock_vehicle]))
+        await coordinator.async_refresh()
+        assert coordinator.stale is False
+        assert vehicle_listener.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_update_interval_follows_webhooks_and_charging(
+        self, hass, mock_enode_client, mock_vehicle, clock
+    ):
+        """Test webhooks ease polling and charging vehicles tighten it."""
+        hass.loop = MagicMock()
+        hass.loop.time.side_effect = clock
+        coordinator = EnodeCoordinators(hass, mock_enode_client)
+        coordinator.polling = PollingSchedule(time_func=clock)
+        vehicles = coordinator.vehicles
+        charge_state = mock_vehicle.charge_state.model_copy(
+            update={"power_delivery_state": PowerDeliveryState.STOPPED}
+        )
+        vehicles.data = {
+            mock_vehicle.id: mock_vehicle.model_copy(
+                update={"charge_state": charge_state}
+            )
+        }
+
+        def next_refresh():
+            return hass.loop.call_at.call_args.args[0] - clock.now
+
+        with patch(
+            "custom_components.enode.coordinator.async_call_later"
+        ) as call_later:
+            coordinator.record_webhook()
+            vehicles.async_add_listener(MagicMock())
+            assert vehicles.update_interval == UPDATE_INTERVAL_WEBHOOKS_HEALTHY
+            assert next_refresh() == pytest.approx(1800, abs=1)
+
+            # Webhooks going quiet brings the pending poll forward
+            clock.now = WEBHOOK_HEALTH_TIMEOUT.total_seconds()
+            (_hass, delay, timeout), _ = call_later.call_args
+            assert delay == WEBHOOK_HEALTH_TIMEOUT.total_seconds()
+            timeout(None)
+            assert vehicles.update_interval == UPDATE_INTERVAL
+            assert next_refresh() == pytest.approx(300, abs=1)
+
+            # As does a vehicle starting to charge
+            clock.now += 60
+            coordinator.record_webhook()
+            coordinator.update_vehicle_data(mock_vehicle)
+            assert vehicles.update_interval == UPDATE_INTERVAL_CHARGING
+            assert next_refresh() == pytest.approx(120, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_remove_vehicle_data(self, hass, mock_enode_client, mock_vehicle):
+        """Test removing a vehicle notifies the listeners of that vehicle."""
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        coordinator.vehicles.data = {mock_vehicle.id: mock_vehicle}
+        changed = []
+        coordinator.vehicles.async_add_listener(
+            lambda: changed.append(
+                coordinator.vehicles.async_vehicle_changed(
+                    mock_vehicle.id, {"is_reachable"}
+                )
+            ),
+            mock_vehicle.id,
+        )
+
+        coordinator.remove_vehicle_data(mock_vehicle.id)
+        coordinator.remove_vehicle_data(mock_vehicle.id)
+
+        assert coordinator.vehicles.data == {}
+        assert changed == [True]
+
+    @pytest.mark.asyncio
+    async def test_outdated_vehicle_update_is_ignored(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test a vehicle seen before the current data does not regress it."""
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        coordinator.vehicles.data = {mock_vehicle.id: mock_vehicle}
+        older = mock_vehicle.model_copy(
+            update={
+                "last_seen": mock_vehicle.last_seen - timedelta(minutes=1),
+                "vendor": "OLDER",
+            }
+        )
+
+        coordinator.update_vehicle_data(older)
+
+        assert coordinator.vehicles.data[mock_vehicle.id] is mock_vehicle
+        assert coordinator.vehicles.outdated == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_keeps_newer_sections(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test a poll does not regress sections updated by a newer webhook."""
+        charge_state = mock_vehicle.charge_state.model_copy(
+            update={
+                "battery_level": 99.0,
+                "last_updated": mock_vehicle.charge_state.last_updated
+                + timedelta(minutes=1),
+            }
+        )
+        current = mock_vehicle.model_copy(update={"charge_state": charge_state})
+        polled = mock_vehicle.model_copy(
+            update={"last_seen": mock_vehicle.last_seen + timedelta(minutes=1)}
+        )
+        mock_enode_client.iter_vehicles = MagicMock(return_value=_aiter([polled]))
+        coordinator = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        coordinator.vehicles.data = {current.id: current}
+
+        vehicles = await coordinator._fetch_vehicles()  # noqa: SLF001
+
+        assert vehicles[current.id].last_seen == polled.last_seen
+        assert vehicles[current.id].charge_state == charge_state
+
     @pytest.mark.asyncio
     async def test_async_shutdown(self, hass, mock_enode_client):
         """Test async_shutdown method."""
@@ -0,0 +1,85 @@
+"""Tests for EnodeClient against the local API emulator."""
+
+from hashlib import sha1
+import hmac
+
+from aiohttp import ClientSession, web
+import pytest
+
+from benchmarks.emulator import EmulatorConfig, EmulatorOAuthSession, EnodeEmulator
+from custom_components.enode.api import EnodeClient
+from custom_components.enode.connection import ConnectionPoolConfig
+
+
+@pytest.fixture
+async def start_emulator(aiohttp_server):
+    """Return a factory starting an emulator and a client connected to it."""
+    sessions = []
+
+    async def start(config: EmulatorConfig) -> tuple[EnodeEmulator, EnodeClient]:
+        emulator = EnodeEmulator(config)
+        server = await aiohttp_server(emulator.create_app())
+        url = str(server.make_url("/"))
+        session = ClientSession()
+        sessions.append(session)
+        client = EnodeClient(
+            EmulatorOAuthSession(session, url),
+            connection_pool=ConnectionPoolConfig(),
+            api_url=url,
+        )
+        return emulator, client
+
+    yield start
+    for session in sessions:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_list_vehicles_paginates(start_emulator):
+    """Test the client follows pagination across the emulated fleet."""
+    emulator, client = await start_emulator(EmulatorConfig(vehicles=120, users=2))
+
+    vehicles = await client.list_user_vehicles("user-1", page_size=25)
+
+    assert len(vehicles) == 60
+    assert {vehicle.user_id for vehicle in vehicles} == {"user-1"}
+    assert emulator.stats.endpoints["GET /users/{user_id}/vehicles"] == 3
+    assert emulator.stats.tokens_issued == 1
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_control_charging(start_emulator):
+    """Test charge control updates the emulated vehicle."""
+    emulator, client = await start_emulator(EmulatorConfig(vehicles=1))
+
+    await client.control_charging("vehicle-0", "STOP")
+
+    assert emulator.vehicles[0]["chargeState"]["isCharging"] is False
+    await client.async_close()
+
+
+@pytest.mark.asyncio
+async def test_webhook_test_delivery(start_emulator, aiohttp_server):
+    """Test a webhook test delivers a signed event."""
+    received = []
+
+    async def receive(request: web.Request) -> web.Response:
+        received.append((request.headers["X-Enode-Signature"], await request.read()))
+        return web.Response(text="OK")
+
+    app = web.Application()
+    app.router.add_post("/webhook", receive)
+    receiver = await aiohttp_server(app)
+    emulator, client = await start_emulator(EmulatorConfig(vehicles=1))
+
+    webhook = await client.create_webhook(receiver.make_url("/webhook"), "secret")
+    result = await client.test_webhook(webhook)
+
+    assert result.is_success
+    signature, content = received[0]
+    digest = hmac.new(b"secret", content, sha1).hexdigest()
+    assert signature == f"sha1={digest}"
+    await client.delete_webhook(webhook)
+    assert emulator.webhooks == {}
+    await client.async_close()
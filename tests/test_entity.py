@@ -1,8 +1,9 @@
 """Tests for Enode entities."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from custom_components.enode.entity import VehicleEntity
+from custom_components.enode.coordinator import EnodeCoordinators
+from custom_components.enode.entity import VehicleEntity, async_add_vehicle_entities
 from homeassistant.helpers.entity import EntityDescription
 
 
@@ -17,13 +18,27 @@ class TestVehicleEntity:
 
         assert entity.vehicle_id == mock_vehicle.id
         assert entity.unique_id == f"vehicle_{mock_vehicle.id}_test"
+        assert entity.coordinator_context == mock_vehicle.id
         assert entity.extra_state_attributes["vehicle_id"] == mock_vehicle.id
         assert entity.extra_state_attributes["user_id"] == mock_vehicle.user_id
 
+    def test_stale_attribute(self, mock_vehicle):
+        """Test the entity flags data served while the API is unreachable."""
+        coordinator = MagicMock()
+        coordinator.stale = False
+        entity = VehicleEntity(
+            coordinator, mock_vehicle, description=EntityDescription(key="test")
+        )
+
+        assert entity.extra_state_attributes["stale"] is False
+
+        coordinator.stale = True
+        assert entity.extra_state_attributes["stale"] is True
+
     def test_vehicle_property(self, mock_vehicle):
         """Test vehicle property."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         entity = VehicleEntity(
             coordinator, mock_vehicle, description=EntityDescription(key="test")
         )
@@ -31,13 +46,13 @@ class TestVehicleEntity:
         assert entity.vehicle == mock_vehicle
 
         # Test when not in coordinator data
-        coordinator.data = []
+        coordinator.data = {}
         assert entity.vehicle is None
 
     def test_available(self, mock_vehicle):
         """Test available property."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         entity = VehicleEntity(
             coordinator, mock_vehicle, description=EntityDescription(key="test")
         )
@@ -47,5 +62,66 @@ class TestVehicleEntity:
         mock_vehicle.is_reachable = False
         assert entity.available is False
 
-        coordinator.data = []
+        coordinator.data = {}
         assert entity.available is False
+
+
+class TestAsyncAddVehicleEntities:
+    """Test async_add_vehicle_entities helper."""
+
+    def test_adds_entities_as_vehicles_arrive(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test entities are added once for each vehicle, when its data arrives."""
+        coordinators = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        entry = MagicMock()
+        entry.runtime_data = coordinators
+        added = []
+
+        def add_entities(entities):
+            added.extend(entities)
+
+        async_add_vehicle_entities(
+            entry, add_entities, lambda _coordinators, vehicle: [vehicle.id]
+        )
+        assert added == []
+
+        coordinators.vehicles.async_set_updated_data({mock_vehicle.id: mock_vehicle})
+        other = mock_vehicle.model_copy(update={"id": "v2"})
+        coordinators.update_vehicle_data(other)
+        coordinators.update_vehicle_data(other)
+
+        assert added == [mock_vehicle.id, other.id]
+        entry.async_on_unload.assert_called_once()
+
+    def test_readds_entities_only_once_device_removed(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test a returning vehicle gets its entities again once they were removed."""
+        coordinators = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False
+        )
+        entry = MagicMock()
+        entry.entry_id = "test_entry"
+        entry.runtime_data = coordinators
+        added = []
+        async_add_vehicle_entities(
+            entry, added.extend, lambda _coordinators, vehicle: [vehicle.id]
+        )
+
+        with patch("custom_components.enode.entity.dr.async_get") as mock_registry:
+            device = mock_registry.return_value.async_get_device.return_value
+            device.config_entries = {"test_entry"}
+
+            coordinators.update_vehicle_data(mock_vehicle)
+            # Deleted before a complete poll, so its device is kept
+            coordinators.remove_vehicle_data(mock_vehicle.id)
+            coordinators.update_vehicle_data(mock_vehicle)
+            assert added == [mock_vehicle.id]
+
+            coordinators.remove_vehicle_data(mock_vehicle.id)
+            mock_registry.return_value.async_get_device.return_value = None
+            coordinators.update_vehicle_data(mock_vehicle)
+            assert added == [mock_vehicle.id, mock_vehicle.id]
@@ -4,8 +4,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.enode import async_setup_entry, async_unload_entry
-from custom_components.enode.coordinator import EnodeConfigEntry
+from custom_components.enode import (
+    _async_track_vehicle_devices,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.enode.const import DOMAIN
+from custom_components.enode.coordinator import EnodeConfigEntry, EnodeCoordinators
 
 
 @pytest.mark.asyncio
@@ -15,18 +20,24 @@ async def test_setup_unload_entry(hass):
     entry.data = {"user_id": "test_user"}
     entry.runtime_data = None
     entry.entry_id = "test_entry"
+    entry.async_create_background_task = MagicMock()
+    entry.async_on_unload = MagicMock()
 
     hass.config_entries.async_forward_entry_setups = AsyncMock()
     hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
 
     with (
         patch("custom_components.enode.get_client", new_callable=AsyncMock),
+        patch("custom_components.enode.VehicleSnapshot", autospec=True),
+        patch("custom_components.enode._async_track_vehicle_devices"),
+        patch("custom_components.enode.WebhookProcessor", autospec=True),
         patch(
             "custom_components.enode.EnodeCoordinators", autospec=True
         ) as mock_coordinators_class,
     ):
         mock_coordinators = mock_coordinators_class.return_value
-        mock_coordinators.async_refresh = AsyncMock()
+        mock_coordinators.async_load_snapshot = AsyncMock(return_value=False)
+        mock_coordinators.async_refresh = MagicMock()
         mock_coordinators.async_shutdown = AsyncMock()
 
         # Setup
@@ -36,3 +47,91 @@ async def test_setup_unload_entry(hass):
         # Unload
         assert await async_unload_entry(hass, entry) is True
         mock_coordinators.async_shutdown.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_setup_entry_refreshes_in_background(hass):
+    """Test platforms are set up without waiting for the first refresh."""
+    entry = MagicMock(spec=EnodeConfigEntry)
+    entry.data = {"user_id": "test_user"}
+    entry.entry_id = "test_entry"
+    entry.async_create_background_task = MagicMock()
+    entry.async_on_unload = MagicMock()
+
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+
+    with (
+        patch("custom_components.enode.get_client", new_callable=AsyncMock),
+        patch("custom_components.enode.VehicleSnapshot", autospec=True),
+        patch("custom_components.enode._async_track_vehicle_devices"),
+        patch("custom_components.enode.WebhookProcessor", autospec=True),
+        patch(
+            "custom_components.enode.EnodeCoordinators", autospec=True
+        ) as mock_coordinators_class,
+    ):
+        mock_coordinators = mock_coordinators_class.return_value
+        mock_coordinators.async_load_snapshot = AsyncMock(return_value=True)
+        mock_coordinators.async_refresh = MagicMock()
+
+        assert await async_setup_entry(hass, entry) is True
+
+    mock_coordinators.async_load_snapshot.assert_awaited_once()
+    entry.async_create_background_task.assert_called_once_with(
+        hass,
+        mock_coordinators.async_refresh.return_value,
+        "enode_vehicles_refresh",
+    )
+    hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_removed_vehicle_devices(hass, mock_enode_client, mock_vehicle):
+    """Test the devices of vehicles missing from a complete poll are removed."""
+    coordinators = EnodeCoordinators(hass, mock_enode_client, use_update_interval=False)
+    coordinators.vehicles.data = {mock_vehicle.id: mock_vehicle}
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    entry.runtime_data = coordinators
+    devices = [
+        MagicMock(id="service", identifiers={(DOMAIN, "test_entry")}),
+        MagicMock(id="vehicle", identifiers={(DOMAIN, mock_vehicle.id)}),
+        MagicMock(id="deleted", identifiers={(DOMAIN, "v2"), (DOMAIN, "vin")}),
+    ]
+
+    with (
+        patch("custom_components.enode.dr.async_get") as mock_registry,
+        patch(
+            "custom_components.enode.dr.async_entries_for_config_entry",
+            return_value=devices,
+        ) as mock_entries,
+    ):
+        registry = mock_registry.return_value
+        registry.async_get_device.side_effect = lambda identifiers: next(
+            (device for device in devices if identifiers <= device.identifiers), None
+        )
+
+        # Neither the snapshot nor a webhook lists every vehicle
+        _async_track_vehicle_devices(hass, entry)
+        coordinators.update_vehicle_data(mock_vehicle.model_copy(update={"id": "v3"}))
+        registry.async_update_device.assert_not_called()
+
+        mock_enode_client.iter_vehicles = MagicMock()
+        mock_enode_client.iter_vehicles.return_value.__aiter__.return_value = [
+            mock_vehicle
+        ]
+        await coordinators.async_refresh()
+        registry.async_update_device.assert_called_once_with(
+            "deleted", remove_config_entry_id="test_entry"
+        )
+
+        # Later updates only look at the devices of the vehicles that changed
+        registry.reset_mock()
+        mock_entries.reset_mock()
+        coordinators.update_vehicle_data(mock_vehicle.model_copy(update={"id": "v4"}))
+        coordinators.remove_vehicle_data(mock_vehicle.id)
+        registry.async_update_device.assert_called_once_with(
+            "vehicle", remove_config_entry_id="test_entry"
+        )
+        mock_entries.assert_not_called()
+
+    entry.async_on_unload.assert_called_once()
@@ -0,0 +1,51 @@
+"""Tests for Enode request metrics."""
+
+from custom_components.enode.metrics import Histogram, RequestMetrics
+
+
+class TestHistogram:
+    """Test Histogram class."""
+
+    def test_rolling_window(self):
+        """Test only the most recent samples are summarised."""
+        histogram = Histogram(size=10)
+        for value in range(100):
+            histogram.add(value)
+
+        assert len(histogram) == 10
+        assert histogram.percentile(0) == 90
+        assert histogram.percentile(100) == 99
+        summary = histogram.as_dict()
+        assert summary["count"] == 100
+        assert summary["p50"] == 94
+        assert summary["max"] == 99
+
+    def test_empty(self):
+        """Test an empty histogram."""
+        histogram = Histogram()
+
+        assert histogram.percentile(95) is None
+        assert histogram.as_dict() == {"count": 0}
+
+
+class TestRequestMetrics:
+    """Test RequestMetrics class."""
+
+    def test_record(self):
+        """Test requests are aggregated per endpoint."""
+        metrics = RequestMetrics()
+
+        metrics.record("GET", "/vehicles", 200, 1024, 0.1, 0.2, 0.05)
+        metrics.record("GET", "/vehicles", 200, 2048, 0.1, 0.3, 0.05)
+        metrics.record("POST", "/vehicles/{vehicle_id}/charging", 400, 64, 0.1, 0.1)
+        metrics.record_error("GET", "/vehicles")
+
+        summary = metrics.as_dict()
+        vehicles = summary["endpoints"]["GET /vehicles"]
+        assert vehicles["statuses"] == {200: 2}
+        assert vehicles["errors"] == 1
+        assert vehicles["bytes"]["max"] == 2048
+        charging = summary["endpoints"]["POST /vehicles/{vehicle_id}/charging"]
+        assert charging["validation_time"] == {"count": 0}
+        assert summary["total_time"]["count"] == 3
+        assert summary["validation_time"]["count"] == 2
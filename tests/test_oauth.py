@@ -0,0 +1,114 @@
+"""Tests for shared client credentials tokens."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.enode.const import TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_RETRY
+from custom_components.enode.oauth import SharedToken, async_get_shared_token
+
+
+def _token(expires_in: int = 3600) -> dict:
+    """Return a token response."""
+    return {"access_token": "token", "token_type": "bearer", "expires_in": expires_in}
+
+
+@pytest.fixture
+def mock_call_later():
+    """Patch scheduling of background refreshes."""
+    with patch("custom_components.enode.oauth.async_call_later") as mock:
+        yield mock
+
+
+class TestSharedToken:
+    """Test SharedToken."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_coalesced(self, hass):
+        """Test concurrent callers share a single token request."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def request_token() -> dict:
+            started.set()
+            await release.wait()
+            return _token()
+
+        request = AsyncMock(side_effect=request_token)
+        shared = SharedToken(hass, request)
+
+        tasks = [asyncio.create_task(shared.async_get_token()) for _ in range(5)]
+        await started.wait()
+        release.set()
+        tokens = await asyncio.gather(*tasks)
+
+        request.assert_awaited_once()
+        assert all(token is tokens[0] for token in tokens)
+        assert tokens[0]["expires_at"] == pytest.approx(time.time() + 3600, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_valid_token_is_reused(self, hass):
+        """Test a valid token is returned without a request."""
+        request = AsyncMock(return_value=_token())
+        shared = SharedToken(hass, request)
+
+        await shared.async_get_token()
+        await shared.async_get_token()
+
+        assert request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_of_expiry(self, hass, mock_call_later):
+        """Test the token is refreshed in the background before it expires."""
+        listener = MagicMock()
+        shared = SharedToken(hass, AsyncMock(return_value=_token()))
+        shared.async_seed({**_token(), "expires_at": time.time() + 3600})
+
+        shared.async_add_listener(listener)
+
+        delay = mock_call_later.call_args.args[1]
+        assert delay == pytest.approx(
+            3600 - TOKEN_REFRESH_MARGIN.total_seconds(), abs=5
+        )
+        refresh_due = mock_call_later.call_args.args[2]
+        refresh_due(None)
+        await shared.async_refresh()
+
+        assert shared.refreshes == 1
+        listener.assert_called_once_with(shared.token)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_retried(self, hass, mock_call_later):
+        """Test a failed background refresh is scheduled again."""
+        shared = SharedToken(hass, AsyncMock(side_effect=TimeoutError))
+        shared.async_add_listener(MagicMock())
+
+        with pytest.raises(TimeoutError):
+            await shared.async_refresh()
+        await asyncio.sleep(0)
+
+        mock_call_later.assert_called_once()
+        assert mock_call_later.call_args.args[1] == TOKEN_REFRESH_RETRY.total_seconds()
+
+    @pytest.mark.asyncio
+    async def test_removing_last_listener_stops_refreshing(self, hass, mock_call_later):
+        """Test background refreshes stop when no entry uses the token."""
+        shared = SharedToken(hass, AsyncMock())
+        shared.async_seed({**_token(), "expires_at": time.time() + 3600})
+        remove = shared.async_add_listener(MagicMock())
+
+        remove()
+
+        mock_call_later.return_value.assert_called_once()
+
+
+def test_shared_between_entries(hass):
+    """Test the token is shared by entries using the same client."""
+    first = async_get_shared_token(hass, "https://token", "client", AsyncMock())
+    second = async_get_shared_token(hass, "https://token", "client", AsyncMock())
+    other = async_get_shared_token(hass, "https://token", "other", AsyncMock())
+
+    assert first is second
+    assert first is not other
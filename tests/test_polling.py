@@ -0,0 +1,83 @@
+"""Tests for the adaptive polling schedule."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.enode.const import (
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_CHARGING,
+    UPDATE_INTERVAL_WEBHOOKS_HEALTHY,
+    WEBHOOK_HEALTH_TIMEOUT,
+)
+from custom_components.enode.models import PowerDeliveryState
+from custom_components.enode.polling import PollingSchedule
+
+
+class TestPollingSchedule:
+    """Test PollingSchedule class."""
+
+    @pytest.fixture
+    def schedule(self, clock):
+        """Return a polling schedule using the fake clock."""
+        return PollingSchedule(time_func=clock)
+
+    @pytest.fixture
+    def idle_vehicle(self, mock_vehicle):
+        """Return a vehicle that is not charging."""
+        charge_state = mock_vehicle.charge_state.model_copy(
+            update={"power_delivery_state": PowerDeliveryState.STOPPED}
+        )
+        return mock_vehicle.model_copy(update={"charge_state": charge_state})
+
+    def test_regular_interval_without_webhooks(self, schedule, idle_vehicle):
+        """Test polling is regular until a webhook arrives."""
+        assert not schedule.webhooks_healthy
+        assert schedule.next_interval([idle_vehicle]) == UPDATE_INTERVAL
+
+    def test_backs_off_while_webhooks_healthy(self, schedule, clock, idle_vehicle):
+        """Test polling backs off while webhooks arrive and resumes once quiet."""
+        schedule.record_webhook()
+
+        assert schedule.next_interval([idle_vehicle]) == (
+            UPDATE_INTERVAL_WEBHOOKS_HEALTHY
+        )
+
+        clock.now += WEBHOOK_HEALTH_TIMEOUT.total_seconds()
+
+        assert schedule.next_interval([idle_vehicle]) == UPDATE_INTERVAL
+        assert schedule.as_dict() == {
+            "webhooks": 1,
+            "webhooks_healthy": False,
+            "charging": False,
+        }
+
+    def test_webhooks_healthy_for(self, schedule, clock):
+        """Test the time left until webhooks are considered quiet."""
+        assert schedule.webhooks_healthy_for == 0
+
+        schedule.record_webhook()
+        clock.now += 60
+
+        assert schedule.webhooks_healthy_for == (
+            WEBHOOK_HEALTH_TIMEOUT.total_seconds() - 60
+        )
+        clock.now += WEBHOOK_HEALTH_TIMEOUT.total_seconds()
+        assert schedule.webhooks_healthy_for == 0
+
+    def test_tightens_while_charging(self, schedule, mock_vehicle, idle_vehicle):
+        """Test polling tightens while any vehicle is charging."""
+        schedule.record_webhook()
+
+        assert schedule.next_interval([idle_vehicle, mock_vehicle]) == (
+            UPDATE_INTERVAL_CHARGING
+        )
+        assert schedule.charging
+
+    def test_never_slower_than_regular_while_charging(self, clock, mock_vehicle):
+        """Test a long charging interval does not slow down regular polling."""
+        schedule = PollingSchedule(
+            charging_interval=timedelta(hours=1), time_func=clock
+        )
+
+        assert schedule.next_interval([mock_vehicle]) == UPDATE_INTERVAL
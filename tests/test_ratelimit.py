@@ -0,0 +1,109 @@
+"""Tests for Enode rate limiting."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.enode.ratelimit import (
+    RateLimiter,
+    RequestPriority,
+    parse_retry_after,
+)
+
+
+class TestRateLimiter:
+    """Test RateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self, clock):
+        """Test acquire waits once the bucket is empty."""
+        limiter = RateLimiter(requests=2, period=timedelta(seconds=2), time_func=clock)
+
+        async def fake_sleep(delay):
+            clock.now += delay
+
+        with patch("custom_components.enode.ratelimit.asyncio.sleep", fake_sleep):
+            await limiter.acquire()
+            await limiter.acquire()
+            assert clock.now == 0
+            await limiter.acquire()
+
+        assert clock.now == pytest.approx(1.0)
+        assert limiter.remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_budget_is_reserved(self, clock):
+        """Test background requests leave the reserve to interactive ones."""
+        limiter = RateLimiter(requests=20, time_func=clock)
+        limiter.update({"X-RateLimit-Remaining": "2"})
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await limiter.acquire(RequestPriority.BACKGROUND)
+        async with asyncio.timeout(0.01):
+            await limiter.acquire(RequestPriority.INTERACTIVE)
+            await limiter.acquire(RequestPriority.INTERACTIVE)
+
+        assert limiter.remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_by_priority(self):
+        """Test queued requests are let through highest priority first."""
+        limiter = RateLimiter(requests=1, period=timedelta(milliseconds=20))
+        await limiter.acquire()
+        order = []
+
+        async def acquire(priority: RequestPriority) -> None:
+            await limiter.acquire(priority)
+            order.append(priority)
+
+        await asyncio.gather(
+            acquire(RequestPriority.BACKGROUND),
+            acquire(RequestPriority.REFRESH),
+            acquire(RequestPriority.INTERACTIVE),
+        )
+
+        assert order == [
+            RequestPriority.INTERACTIVE,
+            RequestPriority.REFRESH,
+            RequestPriority.BACKGROUND,
+        ]
+
+    def test_update_from_headers(self, clock):
+        """Test the bucket follows the rate limit headers."""
+        limiter = RateLimiter(time_func=clock)
+
+        limiter.update(
+            {
+                "X-RateLimit-Limit": "10",
+                "X-RateLimit-Remaining": "1",
+                "X-RateLimit-Reset": "30",
+            }
+        )
+
+        assert limiter.remaining == 1
+        assert limiter.is_low
+        assert limiter.reset_after == timedelta(seconds=30)
+
+        clock.now = 30
+        assert limiter.remaining == 10
+        assert not limiter.is_low
+
+    def test_block(self, clock):
+        """Test blocking the bucket."""
+        limiter = RateLimiter(time_func=clock)
+
+        limiter.block(5)
+
+        assert limiter.remaining == 0
+        assert limiter.reset_after >= timedelta(seconds=5)
+
+
+def test_parse_retry_after():
+    """Test parsing the Retry-After header."""
+    assert parse_retry_after({"Retry-After": "12"}) == 12
+    assert parse_retry_after({"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"}) == 0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
@@ -0,0 +1,33 @@
+"""Tests for Enode retry policy."""
+
+from datetime import timedelta
+
+from custom_components.enode.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy class."""
+
+    def test_delay_backs_off_exponentially(self):
+        """Test delays double up to the maximum."""
+        policy = RetryPolicy(
+            base_delay=timedelta(seconds=1),
+            max_delay=timedelta(seconds=5),
+            jitter=False,
+        )
+
+        assert [policy.delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    def test_delay_with_jitter(self):
+        """Test jitter never exceeds the backoff delay."""
+        policy = RetryPolicy(base_delay=timedelta(seconds=1))
+
+        assert all(0 <= policy.delay(3) <= 4 for _ in range(100))
+
+    def test_should_retry(self):
+        """Test attempts and deadline bound retries."""
+        policy = RetryPolicy(max_attempts=3, deadline=timedelta(seconds=10))
+
+        assert policy.should_retry(1, elapsed=0, delay=1)
+        assert not policy.should_retry(3, elapsed=0, delay=1)
+        assert not policy.should_retry(1, elapsed=9, delay=2)
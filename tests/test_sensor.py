@@ -27,7 +27,7 @@ class TestVehicleChargeStateSensor:
     def coordinator(self, mock_vehicle):
         """Mock coordinator."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         return coordinator
 
     @pytest.fixture
@@ -50,7 +50,7 @@ class TestVehicleChargeStateSensor:
 
     def test_last_reset_no_vehicle(self, sensor, coordinator):
         """Test last_reset when vehicle is None."""
-        coordinator.data = []
+        coordinator.data = {}
         assert sensor.last_reset is None
 
     def test_charge_state(self, sensor, mock_vehicle):
@@ -72,7 +72,7 @@ class TestVehicleChargeStateSensor:
     def test_native_value_no_vehicle(self, mock_vehicle, description):
         """Test native_value when vehicle is None."""
         coordinator = MagicMock()
-        coordinator.data = []
+        coordinator.data = {}
         sensor = VehicleChargeStateSensor(
             coordinator, mock_vehicle, description=description
         )
@@ -91,7 +91,7 @@ class TestVehicleOdometerSensor:
     def coordinator(self, mock_vehicle):
         """Mock coordinator."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         return coordinator
 
     @pytest.fixture
@@ -118,7 +118,7 @@ class TestVehicleOdometerSensor:
     def test_native_value_no_vehicle(self, mock_vehicle, description):
         """Test native_value when vehicle is None."""
         coordinator = MagicMock()
-        coordinator.data = []
+        coordinator.data = {}
         sensor = VehicleOdometerSensor(
             coordinator, mock_vehicle, description=description
         )
@@ -143,7 +143,7 @@ class TestVehicleSmartChargingSensor:
         vehicle = Vehicle.model_validate(mock_vehicle_data)
 
         coordinator = MagicMock()
-        coordinator.data = [vehicle]
+        coordinator.data = {vehicle.id: vehicle}
         sensor = VehicleSmartChargingSensor(
             coordinator, vehicle, description=description
         )
@@ -152,7 +152,7 @@ class TestVehicleSmartChargingSensor:
     def test_native_value_missing_policy(self, mock_vehicle, description):
         """Test native_value when smart_charging_policy is None."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         mock_vehicle.smart_charging_policy = None
         sensor = VehicleSmartChargingSensor(
             coordinator, mock_vehicle, description=description
@@ -163,7 +163,7 @@ class TestVehicleSmartChargingSensor:
     def test_native_value_no_vehicle(self, mock_vehicle, description):
         """Test native_value when vehicle is None."""
         coordinator = MagicMock()
-        coordinator.data = []
+        coordinator.data = {}
         sensor = VehicleSmartChargingSensor(
             coordinator, mock_vehicle, description=description
         )
@@ -0,0 +1,83 @@
+"""Tests for the vehicle snapshot store."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.enode.const import SNAPSHOT_SAVE_DELAY
+from custom_components.enode.coordinator import EnodeCoordinators
+from custom_components.enode.snapshot import VehicleSnapshot
+
+
+@pytest.fixture
+def mock_store():
+    """Patch the storage helper used by the snapshot."""
+    with patch("custom_components.enode.snapshot.Store", autospec=True) as mock:
+        yield mock.return_value
+
+
+class TestVehicleSnapshot:
+    """Test VehicleSnapshot class."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, hass, mock_store, mock_vehicle):
+        """Test saved vehicles load back as the same models."""
+        snapshot = VehicleSnapshot(hass, "entry")
+        snapshot.async_schedule_save({mock_vehicle.id: mock_vehicle})
+
+        data_func, delay = mock_store.async_delay_save.call_args.args
+        data = data_func()
+        mock_store.async_load.return_value = data
+
+        assert delay == SNAPSHOT_SAVE_DELAY.total_seconds()
+        assert "smartChargingPolicy" not in data["vehicles"][0]
+        assert await snapshot.async_load() == {mock_vehicle.id: mock_vehicle}
+
+    @pytest.mark.asyncio
+    async def test_load_missing(self, hass, mock_store):
+        """Test there are no vehicles before anything was saved."""
+        mock_store.async_load.return_value = None
+
+        assert await VehicleSnapshot(hass, "entry").async_load() is None
+
+    @pytest.mark.asyncio
+    async def test_load_invalid(self, hass, mock_store):
+        """Test an invalid snapshot is ignored."""
+        mock_store.async_load.return_value = {"vehicles": [{"id": "v1"}]}
+
+        assert await VehicleSnapshot(hass, "entry").async_load() is None
+
+
+class TestCoordinatorSnapshot:
+    """Test the coordinators with a snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_load_snapshot_serves_stale_data(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test loaded vehicles are served as stale data."""
+        snapshot = AsyncMock(spec=VehicleSnapshot)
+        snapshot.async_load.return_value = {mock_vehicle.id: mock_vehicle}
+        coordinators = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False, snapshot=snapshot
+        )
+
+        assert await coordinators.async_load_snapshot()
+        assert coordinators.vehicles.data == {mock_vehicle.id: mock_vehicle}
+        assert coordinators.stale
+
+    @pytest.mark.asyncio
+    async def test_vehicle_update_saves_snapshot(
+        self, hass, mock_enode_client, mock_vehicle
+    ):
+        """Test vehicle updates are saved to the snapshot."""
+        snapshot = AsyncMock(spec=VehicleSnapshot)
+        coordinators = EnodeCoordinators(
+            hass, mock_enode_client, use_update_interval=False, snapshot=snapshot
+        )
+
+        coordinators.update_vehicle_data(mock_vehicle)
+
+        snapshot.async_schedule_save.assert_called_once_with(
+            {mock_vehicle.id: mock_vehicle}
+        )
@@ -0,0 +1,53 @@
+"""Tests for incremental JSON array splitting."""
+
+import json
+
+import pytest
+
+from custom_components.enode.streaming import JsonArrayItems
+
+DOCUMENT = {
+    "pagination": {"before": 'a\\"b[,', "after": "c1"},
+    "da\\ta": [0],
+    "data": [{"id": "v1", "tags": ["x", "]"]}, 'quote \\" ,]', [1, [2]], 3, None],
+    "other": {"data": [9]},
+}
+
+
+def _split(body: bytes, size: int) -> tuple[list[bytes], bytes]:
+    """Feed the body in chunks of the given size."""
+    splitter = JsonArrayItems()
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(splitter.feed(body[start : start + size]))
+    return items, splitter.envelope()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_split_items(indent, size):
+    """Test items are split regardless of chunk boundaries."""
+    body = json.dumps(DOCUMENT, indent=indent).encode()
+
+    items, envelope = _split(body, size)
+
+    assert [json.loads(item) for item in items] == DOCUMENT["data"]
+    assert json.loads(envelope) == {**DOCUMENT, "data": []}
+
+
+def test_items_returned_as_completed():
+    """Test an item is returned as soon as it is complete."""
+    splitter = JsonArrayItems()
+
+    assert splitter.feed(b'{"data": [{"id": 1}') == []
+    assert splitter.feed(b', {"id"') == [b'{"id": 1}']
+    assert splitter.feed(b': 2}], "pagination": {}}') == [b'{"id": 2}']
+    assert json.loads(splitter.envelope()) == {"data": [], "pagination": {}}
+
+
+def test_empty_array():
+    """Test an empty array yields no items."""
+    items, envelope = _split(b'{"data": [], "pagination": {"after": null}}', 5)
+
+    assert items == []
+    assert json.loads(envelope) == {"data": [], "pagination": {"after": None}}
@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from custom_components.enode.circuit import CircuitOpenError
 from custom_components.enode.switch import VehicleChargeSwitch
+from homeassistant.exceptions import HomeAssistantError
 
 
 class TestVehicleChargeSwitch:
@@ -13,7 +15,7 @@ class TestVehicleChargeSwitch:
     def test_is_on(self, mock_vehicle):
         """Test is_on property."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         client = MagicMock()
         switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
 
@@ -25,7 +27,7 @@ class TestVehicleChargeSwitch:
     def test_is_on_missing(self, mock_vehicle):
         """Test is_on when is_charging is None."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         mock_vehicle.charge_state.is_charging = None
         client = MagicMock()
         switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
@@ -35,7 +37,7 @@ class TestVehicleChargeSwitch:
     def test_is_on_no_vehicle(self, mock_vehicle):
         """Test is_on when vehicle is None."""
         coordinator = MagicMock()
-        coordinator.data = []
+        coordinator.data = {}
         client = MagicMock()
         switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
 
@@ -45,7 +47,7 @@ class TestVehicleChargeSwitch:
     async def test_async_turn_on(self, mock_vehicle):
         """Test async_turn_on."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         client = MagicMock()
         client.control_charging = AsyncMock()
         switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
@@ -59,7 +61,7 @@ class TestVehicleChargeSwitch:
     async def test_async_turn_off(self, mock_vehicle):
         """Test async_turn_off."""
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         client = MagicMock()
         client.control_charging = AsyncMock()
         switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
@@ -74,10 +76,25 @@ class TestVehicleChargeSwitch:
         """Test async_turn_on when not capable."""
         mock_vehicle.capabilities.start_charging.is_capable = False
         coordinator = MagicMock()
-        coordinator.data = [mock_vehicle]
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
         client = MagicMock()
         client.control_charging = AsyncMock()
         switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
 
         await switch.async_turn_on()
         client.control_charging.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_turn_on_circuit_open(self, mock_vehicle):
+        """Test turning on fails fast while the circuit breaker is open."""
+        coordinator = MagicMock()
+        coordinator.data = {mock_vehicle.id: mock_vehicle}
+        client = MagicMock()
+        client.control_charging = AsyncMock(side_effect=CircuitOpenError(42))
+        switch = VehicleChargeSwitch(coordinator, mock_vehicle, client=client)
+
+        with pytest.raises(HomeAssistantError) as exc_info:
+            await switch.async_turn_on()
+
+        assert exc_info.value.translation_key == "api_unavailable"
+        assert exc_info.value.translation_placeholders == {"retry_after": "42"}
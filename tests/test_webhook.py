@@ -0,0 +1,261 @@
+"""Tests for Enode webhook processing."""
+
+import asyncio
+from datetime import timedelta
+import json
+from typing import get_args
+from unittest.mock import MagicMock, patch
+
+from pydantic import ValidationError
+import pytest
+
+from custom_components.enode.models import (
+    WebhookEvents,
+    WebhookEventType,
+    WebhookPayload,
+)
+from custom_components.enode.webhook import (
+    DeliveryCache,
+    WebhookProcessor,
+    parse_webhook_events,
+)
+
+
+def _vehicle_event(event, vehicle_data, created_at, **vehicle):
+    """Return a vehicle webhook event payload."""
+    return {
+        "event": event,
+        "version": "2024-10-01",
+        "createdAt": created_at,
+        "user": {"id": "u1"},
+        "vehicle": {**vehicle_data, **vehicle},
+    }
+
+
+def _events(*events):
+    """Return validated webhook events."""
+    return WebhookEvents.model_validate(list(events))
+
+
+class TestWebhookProcessor:
+    """Test WebhookProcessor class."""
+
+    @pytest.fixture
+    def entry(self):
+        """Return a mock config entry."""
+        return MagicMock()
+
+    def test_folds_updates_in_payload(self, hass, entry, mock_vehicle_data):
+        """Test only the newest update of each vehicle in a payload is applied."""
+        processor = WebhookProcessor(hass, entry, window=timedelta(0))
+
+        processor.process(
+            _events(
+                _vehicle_event(
+                    "user:vehicle:updated",
+                    mock_vehicle_data,
+                    "2024-01-01T00:00:02Z",
+                    vendor="NEWEST",
+                ),
+                _vehicle_event(
+                    "user:vehicle:updated",
+                    mock_vehicle_data,
+                    "2024-01-01T00:00:01Z",
+                    vendor="OLDER",
+                ),
+                _vehicle_event(
+                    "user:vehicle:discovered",
+                    mock_vehicle_data,
+                    "2024-01-01T00:00:00Z",
+                    id="v2",
+                ),
+            )
+        )
+
+        (vehicles,) = entry.runtime_data.update_vehicles_data.call_args.args
+        assert [(vehicle.id, vehicle.vendor) for vehicle in vehicles] == [
+            ("v1", "NEWEST"),
+            ("v2", "Tesla"),
+        ]
+        assert processor.as_dict() == {
+            "received": 3,
+            "folded": 1,
+            "applied": 2,
+            "pending": 0,
+            "rejected": 0,
+            "queued": 0,
+            "duplicates": 0,
+        }
+        entry.runtime_data.record_webhook.assert_called_once()
+
+    def test_folds_updates_across_window(self, hass, entry, mock_vehicle_data):
+        """Test updates arriving within the window are applied together."""
+        processor = WebhookProcessor(hass, entry)
+
+        with patch("custom_components.enode.webhook.async_call_later") as call_later:
+            for second, vendor in ((0, "FIRST"), (1, "SECOND")):
+                processor.process(
+                    _events(
+                        _vehicle_event(
+                            "user:vehicle:updated",
+                            mock_vehicle_data,
+                            f"2024-01-01T00:00:0{second}Z",
+                            vendor=vendor,
+                        )
+                    )
+                )
+            call_later.assert_called_once()
+            entry.runtime_data.update_vehicles_data.assert_not_called()
+
+            flush = call_later.call_args.args[2]
+            flush(None)
+
+        (vehicles,) = entry.runtime_data.update_vehicles_data.call_args.args
+        assert [vehicle.vendor for vehicle in vehicles] == ["SECOND"]
+        assert processor.folded == 1
+
+    def test_delete_drops_pending_update(self, hass, entry, mock_vehicle_data):
+        """Test a deleted vehicle is not updated by an earlier pending event."""
+        processor = WebhookProcessor(hass, entry, window=timedelta(0))
+
+        processor.process(
+            _events(
+                _vehicle_event(
+                    "user:vehicle:updated", mock_vehicle_data, "2024-01-01T00:00:00Z"
+                ),
+                _vehicle_event(
+                    "user:vehicle:deleted", mock_vehicle_data, "2024-01-01T00:00:01Z"
+                ),
+            )
+        )
+
+        entry.runtime_data.remove_vehicle_data.assert_called_once_with("v1")
+        entry.runtime_data.update_vehicles_data.assert_not_called()
+        assert processor.folded == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_processes_in_order(self, hass, entry, mock_vehicle_data):
+        """Test queued payloads are processed in order by the worker."""
+        entry.async_create_background_task.side_effect = lambda _hass, target, _name: (
+            asyncio.create_task(target)
+        )
+        processor = WebhookProcessor(hass, entry, window=timedelta(0))
+        processor.async_start()
+
+        for vendor in ("FIRST", "SECOND"):
+            assert processor.async_enqueue(
+                _events(
+                    _vehicle_event(
+                        "user:vehicle:updated",
+                        mock_vehicle_data,
+                        "2024-01-01T00:00:00Z",
+                        vendor=vendor,
+                    )
+                )
+            )
+        await processor.async_join()
+        processor.async_shutdown()
+
+        assert [
+            vehicles[0].vendor
+            for (vehicles,), _ in entry.runtime_data.update_vehicles_data.call_args_list
+        ] == ["FIRST", "SECOND"]
+
+    def test_queue_rejects_when_full(self, hass, entry):
+        """Test payloads are rejected once the queue is full."""
+        processor = WebhookProcessor(hass, entry, queue_size=1)
+
+        assert processor.async_enqueue(_events())
+        assert not processor.async_enqueue(_events())
+        assert processor.rejected == 1
+        assert processor.as_dict()["queued"] == 1
+
+        processor.async_shutdown()
+        assert processor.as_dict()["queued"] == 0
+
+    def test_redelivery_is_duplicate(self, hass, entry):
+        """Test an accepted delivery is recognised when redelivered."""
+        processor = WebhookProcessor(hass, entry, queue_size=1)
+
+        assert not processor.async_is_duplicate("sha1=abc")
+        assert processor.async_enqueue(_events(), "sha1=abc")
+        assert not processor.async_enqueue(_events(), "sha1=def")
+
+        assert processor.async_is_duplicate("sha1=abc")
+        assert not processor.async_is_duplicate("sha1=def")
+        assert processor.duplicates == 1
+        processor.async_shutdown()
+
+
+class TestDeliveryCache:
+    """Test DeliveryCache class."""
+
+    def test_expires_after_ttl(self, clock):
+        """Test deliveries are forgotten once the TTL has passed."""
+        cache = DeliveryCache(ttl=timedelta(seconds=60), time_func=clock)
+        cache.add("a")
+
+        clock.now = 59
+        assert cache.seen("a")
+        clock.now = 60
+        assert not cache.seen("a")
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_seen(self):
+        """Test the least recently seen delivery is evicted when full."""
+        cache = DeliveryCache(size=2)
+        cache.add("a")
+        cache.add("b")
+        assert cache.seen("a")
+
+        cache.add("c")
+
+        assert cache.seen("a")
+        assert not cache.seen("b")
+        assert cache.seen("c")
+
+
+class TestParseWebhookEvents:
+    """Test parse_webhook_events function."""
+
+    def test_validates_handled_events_only(self, mock_vehicle_data):
+        """Test events without a handler are skipped without being validated."""
+        payload = [
+            _vehicle_event(
+                "user:vehicle:updated", mock_vehicle_data, "2024-01-01T00:00:00Z"
+            ),
+            # Not a valid event, but only its type is read as there is no handler
+            {"event": "user:vendor-action:updated", "version": "2024-10-01"},
+            {
+                "event": "system:heartbeat",
+                "version": "2024-10-01",
+                "createdAt": "2024-01-01T00:00:00Z",
+                "pendingEvents": 0,
+            },
+        ]
+
+        events = parse_webhook_events(json.dumps(payload).encode())
+
+        assert [event.event for event in events] == [
+            "user:vehicle:updated",
+            "system:heartbeat",
+        ]
+        assert events[0] == WebhookEvents.model_validate([payload[0]])[0]
+
+    def test_known_event_types(self):
+        """Test every known event type is either handled or skipped."""
+        (event,) = get_args(WebhookPayload.model_fields["root"].annotation)
+        models = get_args(get_args(event)[0])
+
+        assert set(WebhookEventType) - {WebhookEventType.ALL} <= {
+            tag
+            for model in models
+            for tag in get_args(model.model_fields["event"].annotation)
+        }
+
+    def test_invalid_payload(self):
+        """Test a payload that is not an array of events is rejected."""
+        with pytest.raises(ValidationError):
+            parse_webhook_events(b'{"event": "system:heartbeat"}')
+        with pytest.raises(ValidationError):
+            parse_webhook_events(b'[{"event": "system:heartbeat"}]')